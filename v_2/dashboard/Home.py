@@ -20,7 +20,6 @@
 """
 
 import streamlit as st
-import yaml
 import time
 import os
 import subprocess
@@ -29,15 +28,14 @@ import plotly.graph_objects as go
 import os, sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from strategies.binance_client import BinanceClient
-from scripts.fetch_data import fetch_market_data
-from models.groq_interface import GroqInterface
-from strategies.technical_indicators import TechnicalAnalysis
-
-def load_config():
-    """설정 파일 로드"""
-    with open('utils/config.yaml', 'r') as file:
-        return yaml.safe_load(file)
+from dashboard.utils.cache import (
+    get_binance_client, get_groq_interface, load_candles, load_analysis, show_cache_stats
+)
+from dashboard.utils.chart_data import candlestick_trace, line_trace, histogram_trace
+from dashboard.utils.live_chart import get_incremental_chart
+from dashboard.utils.state import market_snapshot, read_shared
+from utils.config import load_config, save_config
+from utils.state_bus import TOPIC_CANDLES, TOPIC_ANALYSIS, TOPIC_LLM, TOPIC_POSITION
 
 def run_trading_page(page_name):
     """트레이딩 페이지 실행"""
@@ -67,15 +65,15 @@ def display_groq_trading():
             value=config['trading']['interval']
         )
         
-        # 바이낸스 클라이언트 초기화
-        client = BinanceClient(
+        # 바이낸스 클라이언트 (프로세스 단위 캐시)
+        client = get_binance_client(
+            st.session_state.environment,
             api_key=config['binance'][st.session_state.environment]['api_key'],
-            secret_key=config['binance'][st.session_state.environment]['secret_key'],
-            testnet=(st.session_state.environment == 'testnet')
+            secret_key=config['binance'][st.session_state.environment]['secret_key']
         )
         
-        # 시장 데이터 수집
-        market_data = fetch_market_data()
+        # 시장 데이터 수집 (캐시)
+        market_data = load_candles()
         
         # 현재 포지션 정보
         position = client.get_position('BTC/USDT')
@@ -95,14 +93,12 @@ def display_groq_trading():
         st.subheader("📈 시장 데이터")
         
         # OHLCV 데이터 가져오기
-        ohlcv = client.get_ohlcv('BTC/USDT', '1h', 100)
-        df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        df = load_candles('BTC/USDT', '1h', 100)
         
         # 캔들스틱 차트
         fig = go.Figure(data=[
             go.Candlestick(
-                x=df['timestamp'],
+                x=df.index,
                 open=df['open'],
                 high=df['high'],
                 low=df['low'],
@@ -123,8 +119,8 @@ def display_groq_trading():
         # LLM 분석 섹션
         st.subheader("🤖 LLM 분석")
         
-        # Groq 인터페이스 초기화
-        groq = GroqInterface(groq_api_key)
+        # Groq 인터페이스 (프로세스 단위 캐시)
+        groq = get_groq_interface(groq_api_key)
         
         # 시장 분석 실행
         with st.spinner("시장 분석 중..."):
@@ -180,15 +176,15 @@ def display_openai_trading():
             value=config['trading']['interval']
         )
         
-        # 바이낸스 클라이언트 초기화
-        client = BinanceClient(
+        # 바이낸스 클라이언트 (프로세스 단위 캐시)
+        client = get_binance_client(
+            st.session_state.environment,
             api_key=config['binance'][st.session_state.environment]['api_key'],
-            secret_key=config['binance'][st.session_state.environment]['secret_key'],
-            testnet=(st.session_state.environment == 'testnet')
+            secret_key=config['binance'][st.session_state.environment]['secret_key']
         )
         
-        # 시장 데이터 수집
-        market_data = fetch_market_data()
+        # 시장 데이터 수집 (캐시)
+        market_data = load_candles()
         
         # 현재 포지션 정보
         position = client.get_position('BTC/USDT')
@@ -213,95 +209,110 @@ def display_openai_trading():
         time.sleep(5)
         st.experimental_rerun()
 
-def display_charts(df):
+def build_charts(df):
+    """
+    차트 생성 함수 (첫 실행과 다운샘플링 재구성 시에만 호출되고 그 사이에는 새 데이터만 반영)
+    
+    Args:
+        df (pd.DataFrame): OHLCV 데이터와 기술적 지표가 포함된 DataFrame
+        
+    Returns:
+        tuple: (캔들스틱, RSI, MACD) Figure
+    
+    데이터가 많으면 화면 해상도에 맞게 집계/다운샘플링하고 WebGL 트레이스로 표시
+    """
+    # 캔들스틱 차트
+    candlestick = go.Figure(data=[
+        candlestick_trace(df, name='OHLC')
+    ])
+    
+    # RSI 차트
+    rsi = go.Figure()
+    rsi.add_trace(line_trace(
+        df.index,
+        df['RSI'], 
+        name='RSI',
+        line=dict(color='#2962FF', width=2)
+    ))
+    rsi.add_hline(
+        y=70, 
+        line_dash="dash", 
+        line_color="red",
+        annotation_text="과매수",
+        annotation_position="right"
+    )
+    rsi.add_hline(
+        y=30, 
+        line_dash="dash", 
+        line_color="green",
+        annotation_text="과매도",
+        annotation_position="right"
+    )
+    rsi.update_layout(
+        title="RSI (14)",
+        height=250,
+        xaxis_title="시간",
+        yaxis_title="RSI",
+        plot_bgcolor='white',
+        yaxis=dict(gridcolor='lightgrey')
+    )
+    
+    # MACD 차트
+    macd = go.Figure()
+    macd.add_trace(line_trace(
+        df.index,
+        df['MACD'], 
+        name='MACD',
+        line=dict(color='#2962FF', width=2)
+    ))
+    macd.add_trace(line_trace(
+        df.index,
+        df['MACD_Signal'], 
+        name='Signal',
+        line=dict(color='#FF6D00', width=2)
+    ))
+    macd.add_trace(histogram_trace(
+        df.index,
+        df['MACD_Hist'], 
+        name='Histogram'
+    ))
+    macd.update_layout(
+        title="MACD",
+        height=250,
+        xaxis_title="시간",
+        yaxis_title="MACD",
+        plot_bgcolor='white',
+        yaxis=dict(gridcolor='lightgrey')
+    )
+    
+    return candlestick, rsi, macd
+
+def display_charts(df, source='local'):
     """
     차트 시각화 함수
     
     Args:
         df (pd.DataFrame): OHLCV 데이터와 기술적 지표가 포함된 DataFrame
+        source (str): 데이터 출처 ('bus': 봇 발행 상태, 'local': 직접 조회) - 출처별로 차트 상태 분리
         
     표시되는 차트:
     1. BTC/USDT 캔들스틱
     2. RSI (14) - 과매수/과매도 기준선 포함
     3. MACD - 시그널선과 히스토그램
+    
+    차트 상태는 세션에 유지되며 재실행 시 새 캔들만 브라우저로 전송
     """
-    # 캔들스틱 차트
-    candlestick = go.Figure(data=[
-        go.Candlestick(
-            x=df.index,
-            open=df['open'],
-            high=df['high'],
-            low=df['low'],
-            close=df['close'],
-            name='OHLC'
-        )
-    ])
-    st.plotly_chart(candlestick, use_container_width=True)
+    chart = get_incremental_chart(f'home_charts_{source}', build_charts)
+    chart.update(df)
+    
+    chart.show(0)
     
     # RSI와 MACD 차트를 나란히 표시
     col1, col2 = st.columns(2)
-    
     with col1:
-        rsi = go.Figure()
-        rsi.add_trace(go.Scatter(
-            x=df.index,
-            y=df['RSI'], 
-            name='RSI',
-            line=dict(color='#2962FF', width=2)
-        ))
-        rsi.add_hline(
-            y=70, 
-            line_dash="dash", 
-            line_color="red",
-            annotation_text="과매수",
-            annotation_position="right"
-        )
-        rsi.add_hline(
-            y=30, 
-            line_dash="dash", 
-            line_color="green",
-            annotation_text="과매도",
-            annotation_position="right"
-        )
-        rsi.update_layout(
-            title="RSI (14)",
-            height=250,
-            xaxis_title="시간",
-            yaxis_title="RSI",
-            plot_bgcolor='white',
-            yaxis=dict(gridcolor='lightgrey')
-        )
-        st.plotly_chart(rsi, use_container_width=True)
-    
+        chart.show(1)
     with col2:
-        macd = go.Figure()
-        macd.add_trace(go.Scatter(
-            x=df.index,
-            y=df['MACD'], 
-            name='MACD',
-            line=dict(color='#2962FF', width=2)
-        ))
-        macd.add_trace(go.Scatter(
-            x=df.index,
-            y=df['MACD_Signal'], 
-            name='Signal',
-            line=dict(color='#FF6D00', width=2)
-        ))
-        macd.add_bar(
-            x=df.index,
-            y=df['MACD_Hist'], 
-            name='Histogram',
-            marker_color=['red' if x < 0 else 'green' for x in df['MACD_Hist']]
-        )
-        macd.update_layout(
-            title="MACD",
-            height=250,
-            xaxis_title="시간",
-            yaxis_title="MACD",
-            plot_bgcolor='white',
-            yaxis=dict(gridcolor='lightgrey')
-        )
-        st.plotly_chart(macd, use_container_width=True)
+        chart.show(2)
 
 def display_signals(signals):
     st.subheader("📊 기술적 분석 시그널")
@@ -372,28 +383,39 @@ def main():
         # 설정 저장 버튼
         if st.button("설정 저장"):
             config['trading']['interval'] = interval
-            with open('utils/config.yaml', 'w') as f:
-                yaml.dump(config, f)
+            save_config(config)
             st.success("설정이 저장되었습니다!")
+        
+        # 캐시 적중률과 비우기
+        show_cache_stats(st)
     
     # 세션 상태 저장
     st.session_state.environment = 'testnet' if environment == "테스트넷" else 'live'
     
     try:
-        # 시장 데이터 가져오기 (DataFrame으로 받음)
-        df = fetch_market_data()
-        
-        # 기술적 분석 수행
-        analysis = TechnicalAnalysis(df)
-        analysis_result = analysis.analyze_rsi_macd()
+        # 봇이 상태 버스로 발행한 최신 상태 (봇이 없거나 오래되면 None)
+        shared = read_shared(config)
+        
+        if shared[TOPIC_CANDLES] is not None and shared[TOPIC_ANALYSIS] is not None:
+            # 봇이 계산한 캔들/지표 재사용
+            df = shared[TOPIC_CANDLES]
+            analysis_result = dict(shared[TOPIC_ANALYSIS], historical_data=df)
+            source = 'bus'
+        else:
+            # 기술적 분석 수행 (같은 캔들 구간은 캐시된 결과 사용)
+            analysis_result = load_analysis()
+            df = analysis_result['historical_data']
+            source = 'local'
         
         # 현재 포지션 정보
-        client = BinanceClient(
-            api_key=config['binance'][st.session_state.environment]['api_key'],
-            secret_key=config['binance'][st.session_state.environment]['secret_key'],
-            testnet=(st.session_state.environment == 'testnet')
-        )
-        position = client.get_position('BTC/USDT')
+        position = shared[TOPIC_POSITION]
+        if position is None:
+            client = get_binance_client(
+                st.session_state.environment,
+                api_key=config['binance'][st.session_state.environment]['api_key'],
+                secret_key=config['binance'][st.session_state.environment]['secret_key']
+            )
+            position = client.get_position('BTC/USDT')
         
         # 지표 표시 (DataFrame의 마지막 행 사용)
         current_data = df.iloc[-1]
@@ -408,7 +430,7 @@ def main():
             st.metric("거래량", f"${current_data['volume']:,.2f}")
         
         # 차트와 시그널 표시
-        display_charts(analysis_result['historical_data'])
+        display_charts(analysis_result['historical_data'], source)
         
         # 기술적 분석 결과 표시
         st.subheader("📊 기술적 분석 시그널")
@@ -416,17 +438,14 @@ def main():
             st.info(f"**{signal['indicator']}**: {signal['signal']} ({signal['strength']} 강도) → {'🔵 매수 고려' if signal['action'] == 'consider_buy' else '🔴 매도 고려'}")
         
         # DataFrame을 dictionary 형태로 변환
-        current_data = {
-            'price': df['close'].iloc[-1],
-            'volume': df['volume'].iloc[-1],
-            'bid': df['close'].iloc[-1] * 0.9999,  # 예시값
-            'ask': df['close'].iloc[-1] * 1.0001   # 예시값
-        }
+        current_data = market_snapshot(df)
         
         # LLM 분석 실행 및 표시
         st.subheader("🤖 LLM 분석")
-        groq = GroqInterface(config['groq']['api_key'])
-        llm_analysis = groq.analyze_market(current_data, analysis_result)
+        llm_analysis = shared[TOPIC_LLM]
+        if llm_analysis is None:
+            groq = get_groq_interface(config['groq']['api_key'])
+            llm_analysis = groq.analyze_market(current_data, analysis_result)
         st.write(llm_analysis)
         
         # 시장 트렌드 표시
@@ -1,6 +1,8 @@
 """
 LLM 기반 트레이딩 봇 대시보드
 실시간 모니터링 및 설정 관리
+
+봇이 실행 중이면 상태 버스로 발행된 캔들/LLM 분석을 사용하고, 없을 때만 직접 조회
 """
 
 import streamlit as st
@@ -8,20 +10,15 @@ import pandas as pd
 import plotly.graph_objects as go
 from datetime import datetime
 import time
-import yaml
 from models.llm_interface import LLMInterface
+from models.strategy_generator import StrategyGenerator
 from strategies.llm_strategy import LLMStrategy
-from scripts.fetch_data import fetch_market_data
-
-def load_config():
-    """설정 파일 로드"""
-    with open('utils/config.yaml', 'r') as file:
-        return yaml.safe_load(file)
-
-def save_config(config):
-    """설정 파일 저장"""
-    with open('utils/config.yaml', 'w') as file:
-        yaml.dump(config, file)
+from dashboard.utils.cache import load_candles, show_cache_stats
+from dashboard.utils.state import market_snapshot, read_shared
+from utils.config import load_config, save_config
+from utils.log_reader import LogReader, format_record
+from utils.price_ring import PriceRingBuffer
+from utils.state_bus import TOPIC_CANDLES, TOPIC_LLM
 
 def main():
     st.title('🤖 LLM 트레이딩 봇 대시보드')
@@ -85,17 +82,28 @@ def main():
         save_config(config)
         st.sidebar.success('✅ 설정이 저장되었습니다!')
     
+    # 캐시 적중률과 비우기
+    show_cache_stats()
+    
     # 메인 화면: 실시간 정보
     col1, col2, col3, col4 = st.columns(4)
     
     try:
-        # 시장 데이터 수집
-        market_data = fetch_market_data()
+        # 봇이 발행한 최신 상태 (봇이 없거나 오래되면 None)
+        shared = read_shared(config)
+        
+        # 시장 데이터 (봇 발행 캔들, 없으면 캐시된 직접 조회)
+        candles = shared[TOPIC_CANDLES]
+        if candles is None:
+            candles = load_candles()
+        market_data = market_snapshot(candles)
         
-        # LLM 전략 실행
-        strategy = LLMStrategy(openai_api_key, None)  # client는 나중에 추가
-        llm_output = strategy.llm.generate_strategy(market_data)
-        trading_signal = strategy.generator.parse_strategy(llm_output)
+        # LLM 분석 (봇 발행 결과, 없으면 직접 호출)
+        llm_output = shared[TOPIC_LLM]
+        if llm_output is None:
+            strategy = LLMStrategy(openai_api_key, None)  # client는 나중에 추가
+            llm_output = strategy.llm.generate_strategy(market_data)
+        trading_signal = StrategyGenerator().parse_strategy(llm_output)
         
         # 지표 표시
         with col1:
@@ -133,40 +141,44 @@ def main():
         # 차트 섹션
         st.subheader("📈 시장 데이터")
         
-        # 실시간 데이터 로드
-        df = pd.read_csv('data/live_data.csv')
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        # 실시간 데이터 로드 (봇이 기록한 링 버퍼를 복사 없이 조회)
+        try:
+            samples = PriceRingBuffer.from_config(config.get('live_data'), readonly=True).latest()
+        except FileNotFoundError:
+            samples = None
         
-        # 가격 차트
-        fig = go.Figure(data=[
-            go.Scatter(
-                x=df['timestamp'],
-                y=df['price'],
-                name='가격',
-                line=dict(color='blue')
+        if samples is not None and len(samples):
+            # 가격 차트
+            fig = go.Figure(data=[
+                go.Scatter(
+                    x=pd.to_datetime(samples['ts'], unit='ms'),
+                    y=samples['price'],
+                    name='가격',
+                    line=dict(color='blue')
+                )
+            ])
+            
+            fig.update_layout(
+                title="BTC/USDT 가격 추이",
+                height=400,
+                xaxis_title="시간",
+                yaxis_title="가격 (USDT)"
             )
-        ])
-        
-        fig.update_layout(
-            title="BTC/USDT 가격 추이",
-            height=400,
-            xaxis_title="시간",
-            yaxis_title="가격 (USDT)"
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+            
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("아직 실시간 가격 데이터가 없습니다.")
         
         # 거래 이력
         st.subheader("📝 거래 이력")
         
-        # 로그 파일 읽기
-        log_file = f"data/logs/trading_{datetime.now().strftime('%Y%m%d')}.log"
-        try:
-            with open(log_file, 'r') as f:
-                logs = f.readlines()[-10:]  # 최근 10개 로그
-                for log in logs:
-                    st.text(log.strip())
-        except FileNotFoundError:
+        # 로그 파일 읽기 (파일 끝에서 역방향 탐색)
+        log_file = config.get('logging', {}).get('path', 'data/logs/trading.log')
+        logs = LogReader(log_file).tail(10)  # 최근 10개 로그
+        if logs:
+            for log in logs:
+                st.text(format_record(log))
+        else:
             st.info("아직 거래 이력이 없습니다.")
         
         # 자동 새로고침
@@ -21,6 +21,8 @@ OpenAI GPT-4 기반 트레이딩 페이지
   - 자동 거래 실행
   - 거래 내역 표시
   - 성과 분석
+
+봇이 실행 중이면 상태 버스로 발행된 캔들/LLM 분석/포지션을 사용하고, 없을 때만 직접 조회
 """
 
 import streamlit as st
@@ -28,21 +30,13 @@ import pandas as pd
 import plotly.graph_objects as go
 from datetime import datetime
 import time
-import yaml
 from models.llm_interface import LLMInterface
+from models.strategy_generator import StrategyGenerator
 from strategies.llm_strategy import LLMStrategy
-from scripts.fetch_data import fetch_market_data
-from strategies.binance_client import BinanceClient
-
-def load_config():
-    """설정 파일 로드"""
-    with open('utils/config.yaml', 'r') as file:
-        return yaml.safe_load(file)
-
-def save_config(config):
-    """설정 파일 저장"""
-    with open('utils/config.yaml', 'w') as file:
-        yaml.dump(config, file)
+from utils.config import load_config, save_config
+from utils.state_bus import TOPIC_CANDLES, TOPIC_LLM, TOPIC_POSITION
+from dashboard.utils.cache import get_binance_client, load_candles, show_cache_stats
+from dashboard.utils.state import market_snapshot, read_shared
 
 def main():
     """
@@ -127,29 +121,40 @@ def main():
         save_config(config)
         st.sidebar.success('✅ 설정이 저장되었습니다!')
     
-    # 바이낸스 클라이언트 초기화
-    client = BinanceClient(
+    # 캐시 적중률과 비우기
+    show_cache_stats()
+    
+    # 바이낸스 클라이언트 (프로세스 단위 캐시)
+    client = get_binance_client(
+        'testnet',
         api_key=config['binance']['api_key'],
-        secret_key=config['binance']['secret_key'],
-        testnet=True
+        secret_key=config['binance']['secret_key']
     )
     
-    # LLM 전략 초기화
-    strategy = LLMStrategy(openai_api_key, client)
-    
     # 실시간 정보 표시
     col1, col2, col3, col4 = st.columns(4)
     
     try:
-        # 시장 데이터 수집
-        market_data = fetch_market_data()
-        
-        # LLM 분석 실행
-        llm_output = strategy.llm.generate_strategy(market_data)
-        trading_signal = strategy.generator.parse_strategy(llm_output)
+        # 봇이 발행한 최신 상태 (봇이 없거나 오래되면 None)
+        shared = read_shared(config)
+        
+        # 시장 데이터 (봇 발행 캔들, 없으면 캐시된 직접 조회)
+        df = shared[TOPIC_CANDLES]
+        if df is None:
+            df = load_candles('BTC/USDT', '1h', 100)
+        market_data = market_snapshot(df)
+        
+        # LLM 분석 (봇 발행 결과, 없으면 직접 호출)
+        llm_output = shared[TOPIC_LLM]
+        if llm_output is None:
+            strategy = LLMStrategy(openai_api_key, client)
+            llm_output = strategy.llm.generate_strategy(market_data)
+        trading_signal = StrategyGenerator().parse_strategy(llm_output)
         
         # 현재 포지션 정보
-        position = client.get_position('BTC/USDT')
+        position = shared[TOPIC_POSITION]
+        if position is None:
+            position = client.get_position('BTC/USDT')
         
         with col1:
             st.metric(
@@ -186,15 +191,10 @@ def main():
         # 차트 섹션
         st.subheader("📈 시장 데이터")
         
-        # OHLCV 데이터 가져오기
-        ohlcv = client.get_ohlcv('BTC/USDT', '1h', 100)
-        df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-        
         # 캔들스틱 차트
         fig = go.Figure(data=[
             go.Candlestick(
-                x=df['timestamp'],
+                x=df.index,
                 open=df['open'],
                 high=df['high'],
                 low=df['low'],
@@ -229,6 +229,14 @@ def main():
             st.metric("총 거래대금", f"${stats['total_volume']:,.2f}")
             st.metric("평균 거래량", f"{stats['avg_trade_size']:.4f} BTC")
         
+        # 거래 내역 (최신순, 디스크에 내보낸 거래까지 페이지 단위 조회)
+        st.subheader("📜 거래 내역")
+        page_size = 20
+        total_pages = max(1, -(-len(client.trade_history) // page_size))
+        page = st.number_input('페이지', min_value=1, max_value=total_pages, value=1, step=1)
+        st.dataframe(client.get_trade_history(page - 1, page_size), use_container_width=True)
+        st.caption(f"전체 {len(client.trade_history)}건 / {total_pages}페이지")
+        
         # 자동 새로고침
         time.sleep(interval)
         st.rerun()
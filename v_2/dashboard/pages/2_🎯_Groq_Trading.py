@@ -8,13 +8,14 @@ Groq LLM 기반 트레이딩 페이지
 - LLM 기반 시장 분석
 - 거래 통계 시각화
 - 자동 거래 실행
+
+봇이 실행 중이면 상태 버스로 발행된 캔들/LLM 분석/포지션을 사용하고, 없을 때만 직접 조회
 """
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 from datetime import datetime
 import time
-import yaml
 import sys
 from pathlib import Path
 
@@ -22,51 +23,44 @@ from pathlib import Path
 project_root = str(Path(__file__).parent.parent.parent)
 sys.path.append(project_root)
 
-from models.groq_interface import GroqInterface
-from scripts.fetch_data import fetch_market_data
-from strategies.binance_client import BinanceClient
+from utils.config import load_config, save_config
 from strategies.technical_indicators import TechnicalAnalysis
+from utils.state_bus import TOPIC_CANDLES, TOPIC_LLM, TOPIC_POSITION
+from dashboard.utils.cache import get_binance_client, get_groq_interface, load_analysis, show_cache_stats
+from dashboard.utils.chart_data import candlestick_trace, line_trace, histogram_trace
+from dashboard.utils.live_chart import get_incremental_chart
+from dashboard.utils.state import market_snapshot, read_shared
 
-def load_config():
-    """설정 파일 로드"""
-    with open('utils/config.yaml', 'r') as file:
-        return yaml.safe_load(file)
-
-def save_config(config):
-    """설정 파일 저장"""
-    with open('utils/config.yaml', 'w') as file:
-        yaml.dump(config, file)
-
-def display_charts(df):
-    # 캔들스틱 차트
+def build_charts(df):
+    # 캔들스틱 차트 (화면 해상도에 맞게 집계)
     candlestick = go.Figure(data=[
-        go.Candlestick(
-            x=df.index,
-            open=df['open'],
-            high=df['high'],
-            low=df['low'],
-            close=df['close'],
-            name='OHLC'
-        )
+        candlestick_trace(df, name='OHLC')
     ])
     candlestick.update_layout(title="BTC/USDT 가격 차트", height=400)
     
-    # RSI 차트
+    # RSI 차트 (LTTB 다운샘플링 + WebGL)
     rsi = go.Figure()
-    rsi.add_trace(go.Scatter(x=df.index, y=df['RSI'], name='RSI'))
+    rsi.add_trace(line_trace(df.index, df['RSI'], name='RSI'))
     rsi.add_hline(y=70, line_dash="dash", line_color="red")
     rsi.add_hline(y=30, line_dash="dash", line_color="green")
     rsi.update_layout(title="RSI (14)", height=200)
     
     # MACD 차트
     macd = go.Figure()
-    macd.add_trace(go.Scatter(x=df.index, y=df['MACD'], name='MACD'))
-    macd.add_trace(go.Scatter(x=df.index, y=df['MACD_Signal'], name='Signal'))
-    macd.add_bar(x=df.index, y=df['MACD_Hist'], name='Histogram')
+    macd.add_trace(line_trace(df.index, df['MACD'], name='MACD'))
+    macd.add_trace(line_trace(df.index, df['MACD_Signal'], name='Signal'))
+    macd.add_trace(histogram_trace(df.index, df['MACD_Hist'], name='Histogram', colored=False))
     macd.update_layout(title="MACD", height=200)
     
     return candlestick, rsi, macd
 
+def display_charts(df, source='local'):
+    """세션에 유지되는 차트에 새 캔들만 반영하여 표시 (브라우저에는 변경분만 전송, 데이터 출처별 상태)"""
+    chart = get_incremental_chart(f'groq_charts_{source}', build_charts)
+    chart.update(df)
+    for position in range(len(chart.figures)):
+        chart.show(position)
+
 def main():
     """
     메인 대시보드 표시
@@ -150,28 +144,40 @@ def main():
         save_config(config)
         st.sidebar.success('✅ 설정이 저장되었습니다!')
     
-    # 바이낸스 클라이언트 초기화
-    client = BinanceClient(
+    # 캐시 적중률과 비우기
+    show_cache_stats()
+    
+    # 바이낸스 클라이언트 (프로세스 단위 캐시)
+    client = get_binance_client(
+        st.session_state.environment,
         api_key=config['binance'][st.session_state.environment]['api_key'],
-        secret_key=config['binance'][st.session_state.environment]['secret_key'],
-        testnet=(st.session_state.environment == 'testnet')
+        secret_key=config['binance'][st.session_state.environment]['secret_key']
     )
     
-    # Groq 인터페이스 초기화
-    groq = GroqInterface(groq_api_key)
-    
     # 실시간 정보 표시
     col1, col2, col3, col4 = st.columns(4)
     
     try:
-        # 시장 데이터 수집
-        market_data = fetch_market_data()
-        
-        # Groq 분석 실행
-        analysis = groq.generate_strategy(market_data)
+        # 봇이 발행한 최신 상태 (봇이 없거나 오래되면 None)
+        shared = read_shared(config)
+        
+        # 캔들/지표 (봇 발행 결과, 없으면 캐시된 직접 계산)
+        chart_data = shared[TOPIC_CANDLES]
+        source = 'bus'
+        if chart_data is None:
+            chart_data = load_analysis()['historical_data']
+            source = 'local'
+        market_data = market_snapshot(chart_data)
+        
+        # Groq 분석 (봇 발행 결과, 없으면 직접 호출)
+        llm_analysis = shared[TOPIC_LLM]
+        if llm_analysis is None:
+            llm_analysis = get_groq_interface(groq_api_key).generate_strategy(market_data)
         
         # 현재 포지션 정보
-        position = client.get_position('BTC/USDT')
+        position = shared[TOPIC_POSITION]
+        if position is None:
+            position = client.get_position('BTC/USDT')
         
         with col1:
             st.metric(
@@ -198,14 +204,11 @@ def main():
             )
         
         # 차트 표시
-        candlestick, rsi, macd = display_charts(analysis['chart_data'])
-        st.plotly_chart(candlestick, use_container_width=True)
-        st.plotly_chart(rsi, use_container_width=True)
-        st.plotly_chart(macd, use_container_width=True)
+        display_charts(chart_data, source)
         
         # LLM 분석 결과 표시
         st.subheader("🤖 Groq 분석")
-        st.write(analysis['llm_analysis'])
+        st.write(llm_analysis)
         
         # 거래 통계
         st.subheader("📊 거래 통계")
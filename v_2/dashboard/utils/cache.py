@@ -0,0 +1,169 @@
+"""
+대시보드 캐시 계층
+Streamlit 재실행마다 반복되던 클라이언트 생성/시세 조회/지표 계산을 프로세스 단위로 재사용
+
+# 주요 기능:
+- 리소스 캐시 (st.cache_resource)
+  - BinanceClient: 실행 환경(testnet/live)과 API 키별로 하나 (마켓 정보 로드 1회)
+  - GroqInterface: API 키별로 하나
+
+- 데이터 캐시 (st.cache_data)
+  - 캔들: 거래 페어/시간단위/개수별
+  - 기술적 분석: 같은 캔들 구간에 대해 한 번만 계산
+  - 캔들 경계가 지나거나 max_age가 지나면 캐시 키가 바뀌어 새로 조회
+
+- 관리
+  - invalidate(): 지정한 캐시 (기본: 전체) 비우기
+  - show_cache_stats(): 캐시별 호출 수/적중률 표시와 비우기 버튼
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import ccxt
+import pandas as pd
+import streamlit as st
+
+from models.groq_interface import GroqInterface
+from scripts.fetch_data import fetch_candles
+from strategies.binance_client import BinanceClient
+from strategies.technical_indicators import TechnicalAnalysis
+from utils.config import load_config
+from utils.trade_history import TradeHistory
+
+# 진행 중인 캔들의 최대 보관 시간 (초)
+DEFAULT_MAX_AGE = 30
+# 캔들 경계 키와 별개로 오래된 항목을 정리하는 시간 (초)
+DATA_TTL = 24 * 3600
+
+_lock = threading.Lock()
+_stats: Dict[str, Dict[str, int]] = {}
+
+
+def _count(name: str, field: str):
+    with _lock:
+        counts = _stats.setdefault(name, {'calls': 0, 'misses': 0})
+        counts[field] += 1
+
+
+def cache_bucket(timeframe: str = '1h', max_age: Optional[float] = DEFAULT_MAX_AGE) -> Tuple[int, int]:
+    """
+    캐시 키로 쓰는 시간 구간
+
+    Args:
+        timeframe (str): 캔들 시간단위
+        max_age (float, optional): 캔들 구간 안에서 다시 조회할 주기 (초, None이면 캔들 경계에서만)
+
+    Returns:
+        tuple: (현재 캔들 시작 시각, 캔들 안의 max_age 구간 번호)
+    """
+    period = ccxt.Exchange.parse_timeframe(timeframe)
+    now = time.time()
+    boundary = now - now % period
+    step = int((now - boundary) // max_age) if max_age else 0
+    return int(boundary), step
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _binance_client(environment: str, api_key: str, secret_key: str) -> BinanceClient:
+    _count('binance_client', 'misses')
+    config = load_config()
+    # 봇과 같은 거래 내역 디렉토리/체결 동기화 파일을 조회
+    return BinanceClient(
+        api_key=api_key, secret_key=secret_key, testnet=(environment == 'testnet'),
+        trade_history=TradeHistory.from_config(config.get('trade_history')),
+        fills_config=config.get('fills'),
+    )
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _groq_interface(api_key: str) -> GroqInterface:
+    _count('groq_interface', 'misses')
+    return GroqInterface(api_key)
+
+
+@st.cache_data(ttl=DATA_TTL, max_entries=32, show_spinner=False)
+def _candles(symbol: str, timeframe: str, limit: int, bucket: Tuple[int, int]) -> pd.DataFrame:
+    _count('candles', 'misses')
+    return fetch_candles(symbol, timeframe, limit=limit).to_frame()
+
+
+@st.cache_data(ttl=DATA_TTL, max_entries=32, show_spinner=False)
+def _analysis(symbol: str, timeframe: str, limit: int, bucket: Tuple[int, int]) -> Dict[str, Any]:
+    _count('analysis', 'misses')
+    _count('candles', 'calls')
+    return TechnicalAnalysis(_candles(symbol, timeframe, limit, bucket)).analyze_rsi_macd()
+
+
+CACHES = {
+    'binance_client': _binance_client,
+    'groq_interface': _groq_interface,
+    'candles': _candles,
+    'analysis': _analysis,
+}
+
+
+def get_binance_client(environment: str, api_key: str = '', secret_key: str = '') -> BinanceClient:
+    """실행 환경/API 키별 공유 바이낸스 클라이언트"""
+    _count('binance_client', 'calls')
+    return _binance_client(environment, api_key, secret_key)
+
+
+def get_groq_interface(api_key: str) -> GroqInterface:
+    """API 키별 공유 Groq 인터페이스"""
+    _count('groq_interface', 'calls')
+    return _groq_interface(api_key)
+
+
+def load_candles(symbol: str = 'BTC/USDT', timeframe: str = '1h', limit: int = 100,
+                 max_age: Optional[float] = DEFAULT_MAX_AGE) -> pd.DataFrame:
+    """
+    캐시된 OHLCV DataFrame (fetch_market_data()와 같은 형식)
+
+    Args:
+        symbol (str): 거래 페어
+        timeframe (str): 시간단위
+        limit (int): 캔들 개수
+        max_age (float, optional): 진행 중인 캔들의 최대 보관 시간 (초)
+    """
+    _count('candles', 'calls')
+    return _candles(symbol, timeframe, limit, cache_bucket(timeframe, max_age))
+
+
+def load_analysis(symbol: str = 'BTC/USDT', timeframe: str = '1h', limit: int = 100,
+                  max_age: Optional[float] = DEFAULT_MAX_AGE) -> Dict[str, Any]:
+    """캐시된 TechnicalAnalysis.analyze_rsi_macd() 결과 (load_candles()와 같은 캔들 기준)"""
+    _count('analysis', 'calls')
+    return _analysis(symbol, timeframe, limit, cache_bucket(timeframe, max_age))
+
+
+def invalidate(*names: str):
+    """
+    캐시 비우기
+
+    Args:
+        *names: 비울 캐시 이름 (binance_client, groq_interface, candles, analysis / 기본: 전체)
+    """
+    for name in names or CACHES:
+        CACHES[name].clear()
+
+
+def cache_stats() -> Dict[str, Dict[str, float]]:
+    """캐시별 {'calls', 'misses', 'hit_rate'}"""
+    with _lock:
+        return {
+            name: dict(counts, hit_rate=(1 - counts['misses'] / counts['calls']) if counts['calls'] else 0.0)
+            for name, counts in _stats.items()
+        }
+
+
+def show_cache_stats(container=None):
+    """캐시 적중률 표시와 비우기 버튼 (기본: 사이드바)"""
+    container = container or st.sidebar
+    with container.expander('🗄️ 캐시 상태'):
+        for name, stats in cache_stats().items():
+            st.caption(f"{name}: 적중률 {stats['hit_rate']:.0%} ({stats['calls']}회 호출, {stats['misses']}회 조회)")
+        if st.button('캐시 비우기'):
+            invalidate()
+            st.success('캐시를 비웠습니다')
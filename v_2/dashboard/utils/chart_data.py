@@ -0,0 +1,176 @@
+"""
+차트 데이터 처리 계층
+화면 해상도에 맞게 데이터를 줄여 Plotly 트레이스를 생성
+
+# 주요 기능:
+- 캔들 집계
+  - 연속 구간을 시가/고가/저가/종가/거래량 규칙으로 병합 (OHLC 보존)
+
+- 라인 다운샘플링
+  - LTTB (Largest-Triangle-Three-Buckets) 알고리즘
+  - 시각적 형태를 유지하며 포인트 수 축소
+
+- 트레이스 생성
+  - WebGL 트레이스 (Scattergl) 사용
+  - 히스토그램 색상 벡터화
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# 차트 한 개에 그릴 최대 포인트 수 (일반적인 차트 가로 픽셀 수 수준)
+DEFAULT_MAX_POINTS = 1500
+
+
+def _bucket_starts(length: int, max_points: int) -> np.ndarray:
+    """길이를 max_points개 이하의 연속 구간으로 나눈 시작 위치"""
+    bucket = int(np.ceil(length / max_points))
+    return np.arange(0, length, bucket)
+
+
+def aggregate_ohlc(df: pd.DataFrame, max_points: int = DEFAULT_MAX_POINTS) -> pd.DataFrame:
+    """
+    OHLC 규칙에 따라 캔들을 max_points개 이하로 병합
+
+    Args:
+        df (pd.DataFrame): open/high/low/close(/volume) 컬럼을 가진 DataFrame
+        max_points (int): 최대 캔들 수
+
+    Returns:
+        pd.DataFrame: 구간 첫 시간을 인덱스로 하는 병합된 캔들
+    """
+    if len(df) <= max_points:
+        return df
+
+    starts = _bucket_starts(len(df), max_points)
+    ends = np.append(starts[1:], len(df)) - 1
+
+    data = {
+        'open': df['open'].to_numpy()[starts],
+        'high': np.maximum.reduceat(df['high'].to_numpy(), starts),
+        'low': np.minimum.reduceat(df['low'].to_numpy(), starts),
+        'close': df['close'].to_numpy()[ends],
+    }
+    if 'volume' in df:
+        data['volume'] = np.add.reduceat(df['volume'].to_numpy(), starts)
+
+    return pd.DataFrame(data, index=df.index[starts])
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    LTTB 다운샘플링으로 남길 포인트 인덱스 계산
+
+    Args:
+        x (np.ndarray): x 값 (수치형, 증가 순)
+        y (np.ndarray): y 값 (NaN 없음)
+        threshold (int): 남길 포인트 수
+
+    Returns:
+        np.ndarray: 선택된 인덱스 (첫/마지막 포인트 포함)
+    """
+    length = len(x)
+    if threshold >= length or threshold < 3:
+        return np.arange(length)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # 첫/마지막 포인트를 제외한 구간을 threshold - 2개 버킷으로 분할
+    edges = np.linspace(1, length - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = length - 1
+
+    previous = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else length
+
+        # 다음 버킷의 평균점
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        # 이전 선택점, 평균점과 만드는 삼각형 면적이 가장 큰 포인트 선택
+        area = np.abs(
+            (x[previous] - avg_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (avg_y - y[previous])
+        )
+        previous = start + int(area.argmax())
+        selected[i + 1] = previous
+
+    return selected
+
+
+def downsample_line(x, y, max_points: int = DEFAULT_MAX_POINTS):
+    """
+    라인 시리즈를 LTTB로 다운샘플링 (NaN 구간은 제외)
+
+    Args:
+        x: 시간 인덱스 또는 수치형 x 값
+        y: y 값
+
+    Returns:
+        tuple: (다운샘플링된 x, 다운샘플링된 y)
+    """
+    values = np.asarray(y, dtype=np.float64)
+    valid = np.isfinite(values)
+    x = pd.Index(x)[valid]
+    values = values[valid]
+
+    if isinstance(x, pd.DatetimeIndex):
+        numeric_x = x.asi8
+    else:
+        numeric_x = np.asarray(x, dtype=np.float64)
+    indices = lttb_indices(numeric_x, values, max_points)
+    return x[indices], values[indices]
+
+
+def aggregate_extremes(index, values, max_points: int = DEFAULT_MAX_POINTS):
+    """
+    막대 시리즈를 구간별 절대값 최대 포인트로 축소 (히스토그램 피크 보존)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) <= max_points:
+        return pd.Index(index), values
+
+    starts = _bucket_starts(len(values), max_points)
+    bucket = starts[1] - starts[0]
+    padded = np.full(len(starts) * bucket, 0.0)
+    padded[:len(values)] = np.nan_to_num(values)
+    picks = starts + np.abs(padded.reshape(-1, bucket)).argmax(axis=1)
+    picks = np.minimum(picks, len(values) - 1)
+    return pd.Index(index)[picks], values[picks]
+
+
+def histogram_colors(values, positive: str = 'green', negative: str = 'red') -> np.ndarray:
+    """히스토그램 막대 색상 배열 (벡터화)"""
+    return np.where(np.asarray(values) < 0, negative, positive)
+
+
+def candlestick_trace(df: pd.DataFrame, max_points: int = DEFAULT_MAX_POINTS, **kwargs) -> go.Candlestick:
+    """집계된 캔들스틱 트레이스"""
+    candles = aggregate_ohlc(df, max_points)
+    return go.Candlestick(
+        x=candles.index,
+        open=candles['open'],
+        high=candles['high'],
+        low=candles['low'],
+        close=candles['close'],
+        **kwargs
+    )
+
+
+def line_trace(x, y, max_points: int = DEFAULT_MAX_POINTS, **kwargs) -> go.Scattergl:
+    """LTTB 다운샘플링된 WebGL 라인 트레이스"""
+    sampled_x, sampled_y = downsample_line(x, y, max_points)
+    return go.Scattergl(x=sampled_x, y=sampled_y, mode='lines', **kwargs)
+
+
+def histogram_trace(x, y, max_points: int = DEFAULT_MAX_POINTS, colored: bool = True, **kwargs) -> go.Bar:
+    """피크 보존 축소 + 벡터화 색상 막대 트레이스"""
+    sampled_x, sampled_y = aggregate_extremes(x, y, max_points)
+    if colored:
+        kwargs.setdefault('marker_color', histogram_colors(sampled_y))
+    return go.Bar(x=sampled_x, y=sampled_y, **kwargs)
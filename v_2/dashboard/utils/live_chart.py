@@ -0,0 +1,188 @@
+"""
+증분 갱신 차트 컴포넌트
+Streamlit 재실행 사이에 Plotly 차트 상태를 유지하고 브라우저에는 새 데이터만 전송
+
+# 주요 기능:
+- 상태 유지
+  - 차트와 병합된 원본 캔들을 st.session_state에 보관 (max_rows까지)
+  - uirevision 고정으로 확대/이동 상태 유지
+
+- 증분 반영
+  - 마지막으로 반영한 캔들 이후(진행 중인 마지막 캔들 포함) 행만 병합
+  - 트레이스별로 (유지할 포인트 수, 새 포인트)만 계산해 전송
+  - 새 캔들이 rebuild_every개 쌓이면 병합된 전체 이력을 다시 다운샘플링 (chart_data 집계/LTTB)
+
+- 전송 (live_chart_frontend 커스텀 컴포넌트)
+  - 첫 실행/재구성 시에만 전체 Figure 전송, 이후에는 변경분만 전송
+  - 브라우저가 이전 상태를 잃으면(새로고침, 재마운트) 재동기화 요청 후 전체 Figure 전송
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+import streamlit as st
+import streamlit.components.v1 as components
+from plotly.utils import PlotlyJSONEncoder
+
+from dashboard.utils.chart_data import DEFAULT_MAX_POINTS, histogram_colors
+
+# 세션에 보관할 최대 원본 캔들 수 (다운샘플링 전)
+DEFAULT_MAX_ROWS = 20000
+# 다시 다운샘플링하기 전까지 원본 그대로 덧붙일 캔들 수
+DEFAULT_REBUILD_EVERY = DEFAULT_MAX_POINTS // 10
+
+# 트레이스 이름별로 갱신할 DataFrame 컬럼
+TRACE_COLUMNS = {
+    'OHLC': {'open': 'open', 'high': 'high', 'low': 'low', 'close': 'close'},
+    'RSI': {'y': 'RSI'},
+    'MACD': {'y': 'MACD'},
+    'Signal': {'y': 'MACD_Signal'},
+    'Histogram': {'y': 'MACD_Hist'},
+}
+
+FULL = 'full'  # 전체 Figure 전송이 필요한 상태
+
+_component = components.declare_component(
+    'live_chart', path=os.path.join(os.path.dirname(__file__), 'live_chart_frontend')
+)
+
+
+class IncrementalChart:
+    def __init__(self, builder, key: str, max_rows: int = DEFAULT_MAX_ROWS,
+                 rebuild_every: int = DEFAULT_REBUILD_EVERY):
+        """
+        증분 차트 초기화
+
+        Args:
+            builder (callable): DataFrame을 받아 Figure 튜플을 만드는 함수 (다운샘플링 포함, 재구성 시 호출)
+            key (str): 세션 상태 키 (uirevision 값과 컴포넌트 키로도 사용)
+            max_rows (int): 보관할 최대 원본 캔들 수
+            rebuild_every (int): 이 개수만큼 새 캔들이 쌓이면 전체 이력을 다시 다운샘플링
+        """
+        self.builder = builder
+        self.key = key
+        self.max_rows = max_rows
+        self.rebuild_every = rebuild_every
+        self.figures = None
+        self.data = None        # 병합된 원본 캔들 (다운샘플링 전)
+        self.appended = 0       # 마지막 재구성 이후 덧붙인 캔들 수
+        self.changes: List[Any] = []     # Figure별 미전송 변경 (FULL 또는 트레이스 변경 목록)
+        self.seq: Dict[int, int] = {}    # Figure별 마지막 전송 번호
+        self._resync: Dict[int, Any] = {}  # Figure별 처리한 재동기화 요청
+
+    def update(self, df: pd.DataFrame):
+        """
+        새로 들어온 행만 반영하여 Figure 갱신
+
+        Args:
+            df (pd.DataFrame): 최신 OHLCV + 지표 DataFrame (시간 인덱스)
+
+        Returns:
+            tuple: 갱신된 Figure 튜플
+        """
+        if self.figures is None:
+            self.data = df.tail(self.max_rows)
+            self._rebuild()
+            return self.figures
+
+        # 마지막 캔들은 아직 진행 중일 수 있으므로 다시 반영
+        new_rows = df[df.index >= self.data.index[-1]]
+        if new_rows.empty or new_rows.equals(self.data.tail(1)):
+            return self.figures
+
+        kept = self.data[self.data.index < new_rows.index[0]]
+        self.appended += int((new_rows.index > self.data.index[-1]).sum())
+        self.data = pd.concat([kept, new_rows]).tail(self.max_rows)
+
+        if self.appended >= self.rebuild_every:
+            self._rebuild()
+            return self.figures
+
+        for position, fig in enumerate(self.figures):
+            if self.changes[position] == FULL:
+                continue
+            for index, trace in enumerate(fig.data):
+                change = self._patch_trace(trace, new_rows)
+                if change is not None:
+                    change['trace'] = index
+                    self.changes[position].append(change)
+        return self.figures
+
+    def show(self, position: int, height: Optional[int] = None):
+        """
+        Figure 하나를 컴포넌트로 표시 (변경분만 전송)
+
+        Args:
+            position (int): update()가 반환한 Figure 튜플의 위치
+            height (int, optional): 표시 높이 (기본: Figure layout.height)
+        """
+        fig = self.figures[position]
+        key = f'{self.key}-{position}'
+
+        # 브라우저가 보낸 재동기화 요청 (이번 실행을 일으킨 값)
+        requested = st.session_state.get(key)
+        if requested is not None and requested != self._resync.get(position):
+            self._resync[position] = requested
+            self.changes[position] = FULL
+
+        change = self.changes[position]
+        base = self.seq.get(position, 0)
+        figure = delta = None
+        if change == FULL:
+            figure = json.dumps(fig.to_plotly_json(), cls=PlotlyJSONEncoder)
+        elif change:
+            delta = json.dumps(change, cls=PlotlyJSONEncoder)
+        seq = base + 1 if (figure or delta) else base
+        self.seq[position] = seq
+        self.changes[position] = []
+
+        value = _component(
+            seq=seq, base=base, figure=figure, delta=delta,
+            height=height or fig.layout.height or 450, key=key, default=None
+        )
+        if value is not None and value != self._resync.get(position):
+            # 이번 실행에 처리하지 못한 요청은 다음 실행에 전체 전송
+            self._resync[position] = value
+            self.changes[position] = FULL
+
+    def _rebuild(self):
+        """병합된 전체 이력을 다시 다운샘플링하여 Figure 생성"""
+        self.figures = self.builder(self.data)
+        for fig in self.figures:
+            fig.update_layout(uirevision=self.key)
+        self.appended = 0
+        self.changes = [FULL] * len(self.figures)
+
+    def _patch_trace(self, trace, new_rows: pd.DataFrame) -> Optional[Dict[str, Any]]:
+        """새 행을 트레이스 끝에 반영하고 (유지할 포인트 수, 새 포인트) 반환"""
+        columns = TRACE_COLUMNS.get(trace.name)
+        if columns is None or any(col not in new_rows for col in columns.values()):
+            return None
+
+        x = pd.Index(trace.x if trace.x is not None else [])
+        keep = int(x.searchsorted(new_rows.index[0]))  # 새 첫 행 이전의 포인트는 유지
+        points = {'x': new_rows.index}
+        for attr, col in columns.items():
+            points[attr] = new_rows[col].to_numpy()
+
+        # 색상 배열을 쓰는 히스토그램은 색상도 함께 갱신
+        if trace.type == 'bar' and trace.marker.color is not None and not isinstance(trace.marker.color, str):
+            points['marker.color'] = histogram_colors(new_rows[columns['y']])
+
+        trace.x = x[:keep].append(new_rows.index)
+        for attr, values in points.items():
+            if attr == 'x':
+                continue
+            owner, name = (trace.marker, 'color') if attr == 'marker.color' else (trace, attr)
+            current = getattr(owner, name)
+            setattr(owner, name, list(current[:keep]) + list(values))
+        return {'keep': keep, 'points': points}
+
+
+def get_incremental_chart(key: str, builder, max_rows: int = DEFAULT_MAX_ROWS) -> IncrementalChart:
+    """세션 상태에 보관된 증분 차트 반환 (없으면 생성)"""
+    if key not in st.session_state:
+        st.session_state[key] = IncrementalChart(builder, key, max_rows)
+    return st.session_state[key]
@@ -0,0 +1,57 @@
+"""
+대시보드 공유 상태 접근
+봇 프로세스가 발행한 상태 버스를 대시보드 프로세스당 한 번만 구독
+"""
+
+from typing import Any, Dict
+
+import streamlit as st
+
+from utils.state_bus import (
+    StateBusClient, DEFAULT_SOCKET_PATH, DEFAULT_POSITION_INTERVAL,
+    TOPIC_CANDLES, TOPIC_ANALYSIS, TOPIC_LLM, TOPIC_POSITION
+)
+
+SHARED_TOPICS = (TOPIC_CANDLES, TOPIC_ANALYSIS, TOPIC_LLM, TOPIC_POSITION)
+
+
+@st.cache_resource
+def get_state_bus(path: str = DEFAULT_SOCKET_PATH) -> StateBusClient:
+    """프로세스 전역 상태 버스 구독 클라이언트"""
+    return StateBusClient(path)
+
+
+def bus_from_config(config) -> StateBusClient:
+    """config['state_bus'] 설정에 맞는 구독 클라이언트 (비활성화 시 None)"""
+    bus_config = config.get('state_bus', {})
+    if not bus_config.get('enabled', True):
+        return None
+    return get_state_bus(bus_config.get('path', DEFAULT_SOCKET_PATH))
+
+
+def read_shared(config) -> Dict[str, Any]:
+    """
+    봇이 발행한 최신 상태 {토픽: 값} (버스가 없거나 값이 오래되면 None, 호출 측에서 직접 조회)
+
+    캔들/지표/LLM은 trading.interval의 2배, 포지션은 state_bus.position_interval의 2배까지 사용
+    """
+    bus = bus_from_config(config)
+    interval = config['trading']['interval']
+    position_interval = config.get('state_bus', {}).get('position_interval', DEFAULT_POSITION_INTERVAL)
+    max_ages = {topic: interval * 2 for topic in SHARED_TOPICS}
+    max_ages[TOPIC_POSITION] = max(interval, position_interval) * 2
+    return {
+        topic: bus.get(topic, max_age=max_ages[topic]) if bus else None
+        for topic in SHARED_TOPICS
+    }
+
+
+def market_snapshot(df) -> Dict[str, float]:
+    """캔들 DataFrame 마지막 행의 LLM 입력용 시장 데이터 (price/volume/bid/ask)"""
+    price = df['close'].iloc[-1]
+    return {
+        'price': price,
+        'volume': df['volume'].iloc[-1],
+        'bid': price * 0.9999,  # 예시값
+        'ask': price * 1.0001   # 예시값
+    }
@@ -0,0 +1,157 @@
+"""
+LLM 분석 기억소
+과거 기술적 분석 상태와 그때의 LLM 분석을 저장하고, 비슷한 상태가 다시 오면 재사용
+
+# 주요 기능:
+- 상태 벡터
+  - RSI, MACD/시그널/히스토그램 (가격 대비), 트렌드 방향/강도, 최근 수익률
+  - 차원별 표준편차로 정규화하여 거리 계산
+
+- 최근접 이웃 조회
+  - 정규화 좌표와 제곱 노름을 미리 계산해 두고 행렬-벡터 곱 한 번으로 전수 비교
+    (9차원에서는 파이썬 KD-트리보다 빠름, 수만 건까지 밀리초 미만)
+  - 유사도 = 1 / (1 + 정규화 거리)
+
+- 재사용 판단
+  - 유사도가 임계값 이상이고 기록이 충분할 때만 과거 분석 반환
+  - 그 외에는 LLM 호출 후 결과 기록
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+FEATURE_NAMES = (
+    'rsi', 'macd', 'macd_signal', 'macd_hist',
+    'trend_direction', 'trend_strength',
+    'return_1', 'return_2', 'return_3',
+)
+RETURN_LAGS = 3
+TREND_DIRECTION = {'bearish': -1.0, 'neutral': 0.0, 'bullish': 1.0}
+
+
+def analysis_features(analysis_result: Dict[str, Any]) -> np.ndarray:
+    """TechnicalAnalysis.analyze_rsi_macd() 결과를 상태 벡터로 변환"""
+    price = float(analysis_result['current_price']) or 1.0
+    trend = analysis_result.get('trend', {})
+
+    returns = np.zeros(RETURN_LAGS)
+    df = analysis_result.get('historical_data')
+    if df is not None and len(df) > RETURN_LAGS:
+        close = df['close'].to_numpy(dtype=float)[-(RETURN_LAGS + 1):]
+        returns = np.diff(close) / close[:-1]
+
+    return np.concatenate([[
+        analysis_result['rsi'],
+        analysis_result['macd'] / price,
+        analysis_result['macd_signal'] / price,
+        analysis_result['macd_hist'] / price,
+        TREND_DIRECTION.get(trend.get('direction'), 0.0),
+        1.0 if trend.get('strength') == 'strong' else 0.0,
+    ], returns]).astype(float)
+
+
+class AnalysisMemory:
+    def __init__(self, path: Optional[str] = None, min_similarity: float = 0.8,
+                 min_samples: int = 50, rescale_every: int = 64):
+        """
+        분석 기억소 초기화
+
+        Args:
+            path (str, optional): 저장 파일 (.npz, 없으면 메모리에만 보관)
+            min_similarity (float): 과거 분석을 재사용할 최소 유사도 (0~1)
+            min_samples (int): 재사용을 시작할 최소 기록 수
+            rescale_every (int): 기록이 이만큼 늘 때마다 정규화 척도 재계산
+        """
+        self.path = path
+        self.min_similarity = min_similarity
+        self.min_samples = min_samples
+        self.rescale_every = rescale_every
+        self.features = np.empty((0, len(FEATURE_NAMES)))
+        self.analyses: List[str] = []
+        self._scale = np.ones(len(FEATURE_NAMES))
+        self._scaled = self.features  # 정규화 좌표
+        self._norms = np.empty(0)     # 정규화 좌표의 제곱 노름
+        self._scaled_at = 0           # 마지막으로 척도를 계산한 기록 수
+        if path and os.path.exists(path):
+            with np.load(path) as data:
+                self.features = data['features']
+                self.analyses = data['analyses'].tolist()
+            self._rescale()
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None,
+                    symbol: Optional[str] = None) -> Optional['AnalysisMemory']:
+        """
+        config['llm']['memory'] 설정으로 생성 (비활성화 시 None)
+
+        Args:
+            symbol (str, optional): 거래 페어 (지정 시 페어별 파일 사용, 예: llm_memory_BTC-USDT.npz)
+        """
+        config = config or {}
+        if not config.get('enabled', False):
+            return None
+        path = config.get('path')
+        if path and symbol:
+            root, ext = os.path.splitext(path)
+            path = f"{root}_{symbol.replace('/', '-')}{ext}"
+        return cls(
+            path=path,
+            min_similarity=config.get('min_similarity', 0.8),
+            min_samples=config.get('min_samples', 50),
+        )
+
+    def __len__(self) -> int:
+        return len(self.analyses)
+
+    def nearest(self, analysis_result: Dict[str, Any]) -> Tuple[Optional[str], float]:
+        """
+        가장 비슷한 과거 상태의 LLM 분석 조회
+
+        Returns:
+            tuple: (과거 분석 또는 None, 유사도)
+        """
+        if not len(self):
+            return None, 0.0
+        x = analysis_features(analysis_result) / self._scale
+        # |p - x|^2 = |p|^2 - 2 p·x + |x|^2
+        sq_dists = self._norms - 2.0 * (self._scaled @ x) + x @ x
+        idx = int(np.argmin(sq_dists))
+        dist = float(np.sqrt(max(sq_dists[idx], 0.0)))
+        return self.analyses[idx], 1.0 / (1.0 + dist)
+
+    def lookup(self, analysis_result: Dict[str, Any]) -> Tuple[Optional[str], float]:
+        """재사용 조건을 만족하는 과거 분석 조회 (없으면 (None, 유사도))"""
+        analysis, similarity = self.nearest(analysis_result)
+        if len(self) < self.min_samples or similarity < self.min_similarity:
+            return None, similarity
+        return analysis, similarity
+
+    def add(self, analysis_result: Dict[str, Any], analysis: str):
+        """상태와 그에 대한 LLM 분석 기록"""
+        features = analysis_features(analysis_result)
+        self.features = np.vstack([self.features, features])
+        self.analyses.append(analysis)
+        if len(self) - self._scaled_at >= self.rescale_every or len(self) == self.min_samples:
+            self._rescale()
+        else:
+            scaled = features / self._scale
+            self._scaled = np.vstack([self._scaled, scaled])
+            self._norms = np.append(self._norms, scaled @ scaled)
+        if self.path:
+            self.save()
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp.npz'
+        np.savez(tmp_path, features=self.features, analyses=np.array(self.analyses, dtype=str))
+        os.replace(tmp_path, self.path)
+
+    def _rescale(self):
+        """현재 분포의 표준편차로 정규화 좌표 재계산"""
+        scale = self.features.std(axis=0) if len(self) > 1 else np.ones(len(FEATURE_NAMES))
+        self._scale = np.where(scale > 1e-12, scale, 1.0)
+        self._scaled = self.features / self._scale
+        self._norms = (self._scaled ** 2).sum(axis=1)
+        self._scaled_at = len(self)
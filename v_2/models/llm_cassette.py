@@ -0,0 +1,153 @@
+"""
+LLM 호출 기록/재생 카세트
+백테스트에서 LLM 판단 경로를 빠르고 재현 가능하게 실행하기 위한 계층
+
+# 주요 기능:
+- 기록 (record)
+  - 실제 LLM 호출 결과를 프롬프트 해시와 함께 저장
+  - 제공자, 기록 시각, 응답 시간 등 메타데이터 포함
+  - gzip 압축 JSONL 파일에 추가 기록
+
+- 재생 (replay)
+  - 시작 시 카세트 전체를 메모리에 적재하여 해시 조회로 즉시 응답
+  - 기록이 없는 프롬프트 처리 방식 선택
+    - fail: 예외 발생
+    - live: 실제 LLM 호출 (결과도 기록)
+    - stub: 고정 응답 반환
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .llm_interface import LLMInterface
+
+MODES = ('record', 'replay')
+MISS_POLICIES = ('fail', 'live', 'stub')
+DEFAULT_CASSETTE_PATH = 'data/cassettes/llm.jsonl.gz'
+STUB_RESPONSE = "기록된 분석 없음: 관망 (hold)"
+
+
+class CassetteMiss(KeyError):
+    """재생 모드에서 기록되지 않은 프롬프트"""
+
+
+def prompt_key(prompt: str, provider: str = '') -> str:
+    """프롬프트 해시 (제공자별로 구분)"""
+    return hashlib.sha256(f'{provider}\n{prompt}'.encode('utf-8')).hexdigest()
+
+
+class LLMCassette:
+    def __init__(self, path: str = DEFAULT_CASSETTE_PATH, mode: str = 'replay',
+                 on_miss: str = 'fail', stub_response: str = STUB_RESPONSE):
+        """
+        카세트 초기화
+
+        Args:
+            path (str): 카세트 파일 경로 (.jsonl.gz)
+            mode (str): 'record' 또는 'replay'
+            on_miss (str): 재생 모드에서 기록이 없을 때 'fail' / 'live' / 'stub'
+            stub_response (str): on_miss='stub'일 때 반환할 응답
+        """
+        if mode not in MODES:
+            raise ValueError(f"지원하지 않는 카세트 모드: {mode}")
+        if on_miss not in MISS_POLICIES:
+            raise ValueError(f"지원하지 않는 미기록 처리 방식: {on_miss}")
+        self.path = path
+        self.mode = mode
+        self.on_miss = on_miss
+        self.stub_response = stub_response
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> Optional['LLMCassette']:
+        """config['llm']['cassette'] 설정으로 생성 (mode가 off이면 None)"""
+        config = config or {}
+        mode = config.get('mode', 'off')
+        if not mode or mode == 'off':
+            return None
+        return cls(
+            path=config.get('path', DEFAULT_CASSETTE_PATH),
+            mode=mode,
+            on_miss=config.get('on_miss', 'fail'),
+        )
+
+    @property
+    def needs_live(self) -> bool:
+        """실제 LLM 클라이언트가 필요한지 여부"""
+        return self.mode == 'record' or self.on_miss == 'live'
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.entries.get(key)
+
+    def record(self, key: str, provider: str, prompt: str, response: str, latency: float):
+        entry = {
+            'key': key,
+            'provider': provider,
+            'recorded_at': time.time(),
+            'latency': latency,
+            'prompt_chars': len(prompt),
+            'response': response,
+        }
+        line = json.dumps(entry, ensure_ascii=False) + '\n'
+        with self._lock:
+            self.entries[key] = entry
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            # gzip 멤버를 이어 붙이는 방식이라 기존 기록을 다시 압축하지 않음
+            with gzip.open(self.path, 'at', encoding='utf-8') as file:
+                file.write(line)
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with gzip.open(self.path, 'rt', encoding='utf-8') as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 기록 중 중단된 마지막 줄
+                self.entries[entry['key']] = entry
+
+
+class CassetteLLM(LLMInterface):
+    def __init__(self, llm: Optional[LLMInterface], cassette: LLMCassette, provider: str = ''):
+        """
+        카세트를 거치는 LLM 래퍼
+
+        Args:
+            llm (LLMInterface, optional): 실제 LLM (재생 전용이면 None 가능)
+            cassette (LLMCassette): 기록/재생 카세트
+            provider (str): 해시 구분용 제공자 이름
+        """
+        self.api_key = getattr(llm, 'api_key', '')
+        self.llm = llm
+        self.cassette = cassette
+        self.provider = provider
+
+    def get_analysis(self, prompt: str) -> str:
+        key = prompt_key(prompt, self.provider)
+        if self.cassette.mode == 'replay':
+            entry = self.cassette.lookup(key)
+            if entry is not None:
+                self.cassette.hits += 1
+                return entry['response']
+            self.cassette.misses += 1
+            if self.cassette.on_miss == 'fail':
+                raise CassetteMiss(f"카세트에 기록되지 않은 프롬프트: {key[:12]}")
+            if self.cassette.on_miss == 'stub':
+                return self.cassette.stub_response
+
+        if self.llm is None:
+            raise RuntimeError("실제 LLM 클라이언트 없이 카세트 기록/실시간 호출을 할 수 없습니다")
+        started = time.perf_counter()
+        response = self.llm.get_analysis(prompt)
+        self.cassette.record(key, self.provider, prompt, response, time.perf_counter() - started)
+        return response
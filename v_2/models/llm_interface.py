@@ -70,20 +70,29 @@ class OpenAILLM(LLMInterface):
         return completion.choices[0].message.content
 
 class LLMAnalyzer:
-    def __init__(self, api_key: str, provider: str = "groq"):
+    def __init__(self, api_key: str, provider: str = "groq", cassette=None, memory=None):
         """
         LLM 분석기 초기화
         
         Args:
             api_key (str): API 키
             provider (str): LLM 제공자 ("groq" 또는 "openai")
+            cassette (LLMCassette, optional): 호출 기록/재생 카세트 (백테스트용)
+            memory (AnalysisMemory, optional): 유사 상태의 과거 분석 재사용
         """
-        if provider == "groq":
-            self.llm = GroqLLM(api_key)
-        elif provider == "openai":
-            self.llm = OpenAILLM(api_key)
-        else:
+        if provider not in ("groq", "openai"):
             raise ValueError(f"지원하지 않는 LLM 제공자: {provider}")
+
+        # 재생 전용 카세트는 실제 클라이언트 없이 동작
+        llm = None
+        if cassette is None or cassette.needs_live:
+            llm = GroqLLM(api_key) if provider == "groq" else OpenAILLM(api_key)
+
+        if cassette is not None:
+            from .llm_cassette import CassetteLLM
+            llm = CassetteLLM(llm, cassette, provider=provider)
+        self.llm = llm
+        self.memory = memory
     
     def generate_analysis_prompt(self, market_data, analysis_result):
         prompt = f"""
@@ -122,6 +131,23 @@ class LLMAnalyzer:
         """
         return self.llm.get_analysis(prompt)
 
+    def analyze(self, prompt: str, analysis_result):
+        """
+        비슷한 과거 상태의 분석이 있으면 재사용하고, 없으면 LLM에 요청
+        
+        Returns:
+            tuple: (분석 텍스트, 유사도 - LLM을 호출했으면 None)
+        """
+        if self.memory is not None:
+            analysis, similarity = self.memory.lookup(analysis_result)
+            if analysis is not None:
+                return analysis, similarity
+
+        analysis = self.get_analysis(prompt)
+        if self.memory is not None:
+            self.memory.add(analysis_result, analysis)
+        return analysis, None
+
     def _get_rsi_status(self, rsi):
         if rsi > 70: return "과매수 구간"
         if rsi < 30: return "과매도 구간"
@@ -43,4 +43,32 @@ class StrategyGenerator:
             "amount": 0.0,
             "reason": "분석 중...",
             "risk_level": "medium"
-        } 
\ No newline at end of file
+        }
+
+    def generate_from_signals(self, signals, amount: float = 0.0) -> Dict[str, Any]:
+        """
+        기술적 시그널만으로 결정적 거래 전략 생성 (LLM 미호출 경로)
+
+        모든 시그널이 같은 방향이고 강한(strong) 시그널이 하나 이상 있을 때만
+        매매하며, 그 외에는 보류
+
+        Args:
+            signals (list): TechnicalAnalysis 시그널 목록
+            amount (float): 매매 시 거래량
+
+        Returns:
+            dict: parse_strategy()와 동일한 형식
+        """
+        actions = {s['action'] for s in signals}
+        has_strong = any(s['strength'] == 'strong' for s in signals)
+
+        action = "hold"
+        if len(actions) == 1 and has_strong and amount > 0:
+            action = {"consider_buy": "buy", "consider_sell": "sell"}.get(actions.pop(), "hold")
+
+        return {
+            "action": action,
+            "amount": amount if action != "hold" else 0.0,
+            "reason": "기술적 시그널 기반 결정",
+            "risk_level": "medium"
+        }
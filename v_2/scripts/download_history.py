@@ -0,0 +1,226 @@
+"""
+과거 OHLCV 대량 다운로드 스크립트
+여러 심볼/시간단위의 수년치 캔들을 월 파티션 단위로 받아 로컬 데이터셋에 저장
+
+# 주요 기능:
+- 다운로드
+  - since 기반 페이지 조회 (요청당 최대 page_limit개)
+  - (심볼, 시간단위, 월) 작업을 워커 스레드로 동시 처리
+  - 모든 워커가 하나의 요청 한도(RateLimiter)를 공유
+
+- 재개
+  - 파티션마다 체크포인트 기록 (manifest.json)
+  - 완료된 파티션은 건너뛰고, 진행 중인 달은 마지막 캔들부터 이어받기
+
+- 누락 보정
+  - 기대 시각 격자와 비교해 빠진 구간 탐지 후 재조회
+  - 거래소에도 없는 구간은 체크포인트에 기록 (반복 재조회 방지)
+
+사용법:
+    python -m scripts.download_history
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import ccxt
+import numpy as np
+
+from utils.candles import CandleBatch
+from utils.config import config_service
+from utils.history_store import HistoryStore, DEFAULT_HISTORY_ROOT, month_bounds, month_key
+from utils.logger import setup_logger
+from utils.rate_limit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+def _union(a: CandleBatch, b: CandleBatch) -> CandleBatch:
+    """두 배치 합집합 (같은 시각은 b 값 사용, 시간순 정렬)"""
+    ts = np.concatenate([b.ts, a.ts])
+    values = np.concatenate([b.values, a.values], axis=1)
+    ts, first = np.unique(ts, return_index=True)
+    return CandleBatch(ts, values[:, first])
+
+
+def find_gaps(ts: np.ndarray, start_ms: int, end_ms: int, step_ms: int) -> List[List[int]]:
+    """
+    [start_ms, end_ms) 격자 중 빠진 캔들 구간 탐지
+
+    Returns:
+        list: [[누락 시작, 누락 마지막], ...] (ms)
+    """
+    expected = np.arange(start_ms, end_ms, step_ms, dtype=np.int64)
+    missing = expected[~np.isin(expected, ts)]
+    if not len(missing):
+        return []
+    breaks = np.flatnonzero(np.diff(missing) != step_ms)
+    starts = np.concatenate([[0], breaks + 1])
+    ends = np.concatenate([breaks, [len(missing) - 1]])
+    return [[int(missing[s]), int(missing[e])] for s, e in zip(starts, ends)]
+
+
+class HistoryDownloader:
+    def __init__(self, store: HistoryStore, limiter: RateLimiter, workers: int = 4,
+                 page_limit: int = 1000, request_weight: float = 2.0,
+                 max_retries: int = 5, exchange_factory=ccxt.binance):
+        """
+        다운로더 초기화
+
+        Args:
+            store (HistoryStore): 저장소
+            limiter (RateLimiter): 워커가 공유하는 요청 한도
+            workers (int): 동시 다운로드 스레드 수
+            page_limit (int): 요청당 캔들 수
+            request_weight (float): 요청 1회가 차감하는 한도 가중치
+            max_retries (int): 네트워크 오류 재시도 횟수
+            exchange_factory (callable): 워커별 ccxt 거래소 인스턴스 생성 함수
+        """
+        self.store = store
+        self.limiter = limiter
+        self.workers = workers
+        self.page_limit = page_limit
+        self.request_weight = request_weight
+        self.max_retries = max_retries
+        self.exchange_factory = exchange_factory
+        self._local = threading.local()
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> 'HistoryDownloader':
+        """config['history'] 설정으로 생성"""
+        config = config or {}
+        rate = config.get('requests_per_second', 10)
+        return cls(
+            store=HistoryStore(config.get('root', DEFAULT_HISTORY_ROOT)),
+            limiter=RateLimiter(rate * config.get('request_weight', 2.0)),
+            workers=config.get('workers', 4),
+            page_limit=config.get('page_limit', 1000),
+            request_weight=config.get('request_weight', 2.0),
+        )
+
+    def run(self, symbols: List[str], timeframes: List[str],
+            start_ms: int, end_ms: Optional[int] = None) -> Dict[str, int]:
+        """
+        기간 내 모든 파티션 다운로드
+
+        Args:
+            symbols (list): 거래 페어 목록
+            timeframes (list): 시간단위 목록
+            start_ms (int): 시작 시각 (ms)
+            end_ms (int, optional): 종료 시각 (기본: 현재)
+
+        Returns:
+            dict: {'downloaded': 받은 파티션 수, 'skipped': 완료되어 건너뛴 수, 'failed': 실패 수}
+        """
+        end_ms = end_ms or int(time.time() * 1000)
+        tasks = []
+        skipped = 0
+        for symbol in symbols:
+            for timeframe in timeframes:
+                key = month_key(start_ms)
+                while month_bounds(key)[0] < end_ms:
+                    status = self.store.status(symbol, timeframe, key)
+                    if status and status['complete']:
+                        skipped += 1
+                    else:
+                        tasks.append((symbol, timeframe, key, start_ms, end_ms))
+                    key = month_key(month_bounds(key)[1])
+
+        summary = {'downloaded': 0, 'skipped': skipped, 'failed': 0}
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self._download_partition, *task): task for task in tasks}
+            for future, task in futures.items():
+                try:
+                    future.result()
+                    summary['downloaded'] += 1
+                except Exception as e:
+                    summary['failed'] += 1
+                    logger.error(f"파티션 다운로드 실패 {task[:3]}: {e}")
+        return summary
+
+    def _exchange(self):
+        """워커 스레드별 거래소 인스턴스 (속도 제한은 공유 limiter가 담당)"""
+        if not hasattr(self._local, 'exchange'):
+            self._local.exchange = self.exchange_factory({'enableRateLimit': False})
+        return self._local.exchange
+
+    def _download_partition(self, symbol: str, timeframe: str, key: str,
+                            start_ms: int, end_ms: int):
+        step = int(ccxt.Exchange.parse_timeframe(timeframe) * 1000)
+        month_start, month_end = month_bounds(key)
+        lo, hi = max(month_start, start_ms), min(month_end, end_ms)
+
+        # 진행 중이던 파티션은 마지막 캔들부터 이어받기
+        batch = self.store.read_partition(symbol, timeframe, key)
+        since = int(batch.ts[-1]) if len(batch) else lo
+        batch = _union(batch, self._fetch_range(symbol, timeframe, since, hi, step))
+
+        gaps = []
+        if len(batch):
+            # 첫 캔들 이전은 상장 전일 수 있으므로 내부/후행 누락만 확인
+            last_closed = min(hi, int(time.time() * 1000) - step)
+            for gap_start, gap_end in find_gaps(batch.ts, int(batch.ts[0]), last_closed, step):
+                batch = _union(batch, self._fetch_range(symbol, timeframe, gap_start, gap_end + step, step))
+            gaps = find_gaps(batch.ts, int(batch.ts[0]), last_closed, step)
+            if gaps:
+                logger.warning(f"{symbol} {timeframe} {key}: 채우지 못한 누락 구간 {len(gaps)}개")
+
+        complete = hi == month_end and month_end <= int(time.time() * 1000)
+        self.store.write_partition(symbol, timeframe, key, batch, complete, gaps)
+        logger.info(f"{symbol} {timeframe} {key}: {len(batch)}개 캔들 저장")
+
+    def _fetch_range(self, symbol: str, timeframe: str, since: int, until: int, step: int) -> CandleBatch:
+        """[since, until) 구간을 페이지 단위로 조회"""
+        batch = CandleBatch.empty()
+        cursor = since
+        while cursor < until:
+            rows = self._fetch_page(symbol, timeframe, cursor)
+            if not rows:
+                break
+            page = CandleBatch.from_ccxt(rows)
+            inside = page.ts < until
+            if inside.any():
+                batch = _union(batch, CandleBatch(page.ts[inside], page.values[:, inside]))
+            if len(rows) < self.page_limit or not inside.all():
+                break
+            cursor = int(page.ts[-1]) + step
+        return batch
+
+    def _fetch_page(self, symbol: str, timeframe: str, since: int) -> list:
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire(self.request_weight)
+            try:
+                return self._exchange().fetch_ohlcv(symbol, timeframe, since=since, limit=self.page_limit)
+            except ccxt.NetworkError as e:
+                if attempt == self.max_retries:
+                    raise
+                wait = 2 ** attempt
+                logger.warning(f"OHLCV 조회 재시도 ({symbol} {timeframe}, {wait}초 후): {e}")
+                time.sleep(wait)
+
+
+def main():
+    """config['history'] 설정대로 과거 캔들 다운로드"""
+    config = config_service.get()
+    setup_logger(config.get('logging'))
+    history_config = config.get('history', {})
+
+    start = datetime.strptime(history_config.get('start', '2020-01-01'), '%Y-%m-%d')
+    start_ms = int(start.replace(tzinfo=timezone.utc).timestamp() * 1000)
+    symbols = history_config.get('symbols', [config['trading']['symbol']])
+    timeframes = history_config.get('timeframes', ['1h'])
+
+    downloader = HistoryDownloader.from_config(history_config)
+    summary = downloader.run(symbols, timeframes, start_ms)
+    logger.info(
+        f"과거 데이터 다운로드 완료: 신규 {summary['downloaded']}, "
+        f"건너뜀 {summary['skipped']}, 실패 {summary['failed']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -23,16 +23,10 @@ import ccxt
 import pandas as pd
 from datetime import datetime
 import streamlit as st
-import yaml
 import os
 
-def load_config():
-    """
-    설정 파일 로드
-    API 키와 거래 설정을 YAML 파일에서 읽어옴
-    """
-    with open('utils/config.yaml', 'r') as file:
-        return yaml.safe_load(file)
+from utils.candles import CandleBatch
+from utils.market_recorder import recorder
 
 def ensure_data_dir():
     """
@@ -46,6 +40,32 @@ def ensure_data_dir():
     if not os.path.exists(os.path.join(data_dir, 'logs')):
         os.makedirs(os.path.join(data_dir, 'logs'))
 
+# 공개 시세 조회용 거래소 인스턴스 (매 호출 재생성하지 않고 재사용)
+_public_exchange = None
+
+def _get_public_exchange():
+    global _public_exchange
+    if _public_exchange is None:
+        _public_exchange = ccxt.binance()
+    return _public_exchange
+
+def fetch_candles(symbol: str = 'BTC/USDT', timeframe: str = '1h', limit: int = 100,
+                  timeout: float = None) -> CandleBatch:
+    """
+    바이낸스로부터 OHLCV 데이터를 컴팩트 캔들 배치로 수집 (DataFrame 변환 없음)
+    
+    Args:
+        timeout (float, optional): 요청 제한 시간 (초, 기본: ccxt 기본값)
+    
+    Returns:
+        CandleBatch: int64 타임스탬프 + 컬럼별 float64 배열
+    """
+    client = _get_public_exchange()
+    client.timeout = int(timeout * 1000) if timeout else ccxt.Exchange.timeout
+    ohlcv = client.fetch_ohlcv(symbol, timeframe, limit=limit)
+    recorder.record('ohlcv', ohlcv, symbol=symbol, timeframe=timeframe)
+    return CandleBatch.from_ccxt(ohlcv)
+
 def fetch_market_data():
     """
     바이낸스로부터 시장 데이터 수집
@@ -60,20 +80,5 @@ def fetch_market_data():
             'volume': float        # 거래량
         }
     """
-    # 바이낸스 API로부터 데이터 가져오기
-    client = ccxt.binance()
-    
-    # OHLCV 데이터 가져오기 (1시간 봉)
-    ohlcv = client.fetch_ohlcv('BTC/USDT', '1h', limit=100)
-    
-    # DataFrame 생성
-    df = pd.DataFrame(
-        ohlcv,
-        columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
-    )
-    
-    # 타임스탬프를 datetime으로 변환
-    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-    df.set_index('timestamp', inplace=True)
-    
-    return df 
\ No newline at end of file
+    # OHLCV 데이터 가져오기 (1시간 봉) 후 DataFrame 변환
+    return fetch_candles('BTC/USDT', '1h', limit=100).to_frame() 
\ No newline at end of file
@@ -0,0 +1,320 @@
+"""
+기록된 시장 데이터 재생 스크립트
+MarketRecorder 세그먼트를 가상 시계에 맞춰 LLMStrategy.execute에 흘려보내고 결과를 보고
+
+# 주요 기능:
+- 재생
+  - 기록된 캔들 조회 1회를 틱 1회로 간주 (같은 틱의 티커/잔고 반영 후 실행)
+  - 실제 시간 대비 N배속 또는 최대 속도(speed=0)로 진행
+  - 가상 시계: 주문 시각, 틱 예산, 회로 차단기는 기록 시각 기준 (처리 시간 측정은 실제 시간)
+  - 틱은 해당 틱의 기록을 모두 반영한 직후, 다음 기록 시각으로 이동하기 전에 실행
+  - 캔들 경계 정렬 스케줄이면 실행 봇과 같이 진행 중인 마지막 캔들을 빼고 전달
+
+- 거래소 대역 (ReplayExchange)
+  - 기록된 티커/호가창/캔들로 조회 응답
+  - 주문은 마지막 가격에 즉시 체결된 것으로 처리하고 잔고 갱신
+
+- 보고
+  - 틱별 트리거/대체 사유/결정, 체결 주문
+  - 단계별 처리 시간 (평균, p95, 최대)
+
+사용법:
+    python -m scripts.replay_market --speed 0 --output data/replay_report.json
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from models.llm_cassette import LLMCassette
+from strategies.llm_strategy import LLMStrategy
+from strategies.trigger_engine import TriggerEngine
+from utils.candles import CandleBatch
+from utils.config import config_service
+from utils.deadline import CircuitBreaker, TickBudget
+from utils.market_recorder import DEFAULT_RECORDING_DIR, read_records
+from utils.metrics import metrics
+
+
+class VirtualClock:
+    def __init__(self, speed: float = 0.0):
+        """
+        가상 시계
+
+        Args:
+            speed (float): 실제 시간 대비 배속 (0이면 대기 없이 최대 속도)
+        """
+        self.speed = speed
+        self.now_ms = None
+        self._wall_start = None
+        self._virtual_start = None
+
+    def time(self) -> float:
+        """가상 현재 시각 (epoch 초)"""
+        return (self.now_ms or 0) / 1000
+
+    def advance_to(self, ts_ms: int):
+        """기록 시각으로 이동 (배속 재생이면 그만큼 실제로 대기)"""
+        if self._virtual_start is None:
+            self._virtual_start = ts_ms
+            self._wall_start = time.monotonic()
+        self.now_ms = ts_ms
+        if self.speed > 0:
+            due = self._wall_start + (ts_ms - self._virtual_start) / 1000 / self.speed
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+
+class ReplayExchange:
+    def __init__(self, clock: VirtualClock, base_balance: float = 0.0, quote_balance: float = 10000.0):
+        """
+        기록 데이터 기반 거래소 대역 (BinanceClient와 같은 조회/주문 메서드 제공)
+
+        Args:
+            clock (VirtualClock): 가상 시계
+            base_balance (float): 기록된 잔고가 없을 때 시작 기준 통화 잔고
+            quote_balance (float): 기록된 잔고가 없을 때 시작 결제 통화 잔고
+        """
+        self.clock = clock
+        self.tickers: Dict[str, Dict[str, Any]] = {}
+        self.orderbooks: Dict[str, Dict[str, Any]] = {}
+        self.ohlcv: Dict[tuple, list] = {}
+        self.default_balances = {'base': base_balance, 'quote': quote_balance}
+        self.recorded_balance = None  # 기록된 최초 잔고
+        self.balances = None  # 모의 체결 반영 잔고 (첫 조회 시 결정)
+        self.orders: List[Dict[str, Any]] = []
+
+    def apply(self, record: Dict[str, Any]):
+        """기록된 응답으로 거래소 상태 갱신"""
+        kind, args, data = record['kind'], record['args'], record['data']
+        if kind == 'ticker':
+            self.tickers[args['symbol']] = data
+        elif kind == 'orderbook':
+            self.orderbooks[args['symbol']] = data
+        elif kind == 'ohlcv':
+            self.ohlcv[(args['symbol'], args.get('timeframe', '1h'))] = data
+        elif kind == 'balance' and self.recorded_balance is None:
+            # 최초 잔고만 사용하고 이후는 모의 체결로 계산
+            self.recorded_balance = data
+
+    def get_market_price(self, symbol: str) -> float:
+        ticker = self.tickers.get(symbol)
+        if ticker and ticker.get('last') is not None:
+            return ticker['last']
+        for (candle_symbol, _), rows in self.ohlcv.items():
+            if candle_symbol == symbol and rows:
+                return rows[-1][4]
+        raise KeyError(f"재생 데이터에 {symbol} 가격이 없습니다")
+
+    def get_ticker(self, symbol: str) -> Dict[str, Any]:
+        return self.tickers[symbol]
+
+    def get_orderbook(self, symbol: str):
+        return self.orderbooks[symbol]
+
+    def get_ohlcv(self, symbol: str, timeframe: str = '1h', limit: int = 100):
+        return self.ohlcv[(symbol, timeframe)][-limit:]
+
+    def get_candles(self, symbol: str, timeframe: str = '1h', limit: int = 100) -> CandleBatch:
+        return CandleBatch.from_ccxt(self.get_ohlcv(symbol, timeframe, limit))
+
+    def get_position(self, symbol: str):
+        self._ensure_balances(symbol)
+        return {
+            side: {'free': amount, 'used': 0.0, 'total': amount}
+            for side, amount in self.balances.items()
+        }
+
+    def place_order(self, symbol: str, side: str, amount: float, price: float = None):
+        """마지막 가격(또는 지정가)에 즉시 체결된 것으로 처리"""
+        self._ensure_balances(symbol)
+        fill_price = price or self.get_market_price(symbol)
+        sign = 1 if side == 'buy' else -1
+        self.balances['base'] += sign * amount
+        self.balances['quote'] -= sign * amount * fill_price
+        order = {
+            'id': f'replay-{len(self.orders) + 1}',
+            'timestamp': self.clock.now_ms,
+            'symbol': symbol,
+            'side': side,
+            'amount': amount,
+            'price': fill_price,
+            'status': 'closed',
+        }
+        self.orders.append(order)
+        return order
+
+    def _ensure_balances(self, symbol: str):
+        if self.balances is not None:
+            return
+        if self.recorded_balance is None:
+            self.balances = dict(self.default_balances)
+            return
+        base, quote = symbol.split('/')
+        self.balances = {
+            'base': (self.recorded_balance.get(base) or {}).get('total') or 0.0,
+            'quote': (self.recorded_balance.get(quote) or {}).get('total') or 0.0,
+        }
+
+
+class ReplayEngine:
+    def __init__(self, strategy: LLMStrategy, clock: VirtualClock, exchange: ReplayExchange,
+                 symbol: str = 'BTC/USDT', timeframe: str = '1h', tick_budget: Optional[float] = None,
+                 closed: bool = False):
+        """
+        재생 엔진 초기화
+
+        Args:
+            strategy (LLMStrategy): 재생할 전략 (client는 exchange로 교체됨)
+            clock (VirtualClock): 가상 시계
+            exchange (ReplayExchange): 거래소 대역
+            symbol (str): 틱으로 볼 캔들의 거래 페어
+            timeframe (str): 틱으로 볼 캔들의 시간단위
+            tick_budget (float, optional): 틱 시간 예산 (초, 가상 시계 기준)
+            closed (bool): 기록된 캔들에서 진행 중인 마지막 캔들 제외 (schedule.align 틱과 동일)
+        """
+        self.strategy = strategy
+        self.strategy.client = exchange
+        self.strategy.breaker.clock = clock.time  # 차단기 대기 시간도 기록 시각 기준
+        self.clock = clock
+        self.exchange = exchange
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.tick_budget = tick_budget
+        self.closed = closed
+        self.ticks: List[Dict[str, Any]] = []
+
+    def run(self, records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        기록 재생 후 보고서 반환
+
+        Returns:
+            dict: {'ticks', 'orders', 'decisions', 'stages', 'wall_seconds', 'virtual_seconds'}
+        """
+        wall_start = time.perf_counter()
+        first_ts = last_ts = None
+        pending = None
+        for record in records:
+            is_tick = (record['kind'] == 'ohlcv'
+                       and record['args'].get('symbol') == self.symbol
+                       and record['args'].get('timeframe', '1h') == self.timeframe)
+            if is_tick and pending is not None:
+                # 이전 틱의 티커/잔고까지 반영된 상태에서, 다음 틱 시각으로 이동하기 전에 실행
+                self._run_tick(pending)
+
+            self.clock.advance_to(record['ts'])
+            first_ts = first_ts if first_ts is not None else record['ts']
+            last_ts = record['ts']
+            self.exchange.apply(record)
+            if is_tick:
+                pending = record
+        if pending is not None:
+            self._run_tick(pending)
+
+        return self._report(time.perf_counter() - wall_start, first_ts, last_ts)
+
+    def _run_tick(self, record: Dict[str, Any]):
+        market_data = CandleBatch.from_ccxt(record['data'])
+        if self.closed:
+            market_data = market_data.closed()
+        budget = None
+        if self.tick_budget is not None:
+            budget = TickBudget(self.tick_budget, clock=self.clock.time)
+
+        metrics.start_tick()
+        error = None
+        order = None
+        try:
+            order = self.strategy.execute(market_data, budget=budget)
+        except Exception as e:
+            error = str(e)
+        tick_record = metrics.end_tick()
+
+        decision = getattr(self.strategy, 'last_decision', None) or {}
+        self.ticks.append({
+            'ts': record['ts'],
+            'triggers': list(self.strategy.last_triggers),
+            'fallback': self.strategy.last_fallback,
+            'action': decision.get('action'),
+            'order': order,
+            'error': error,
+            'duration': tick_record.get('duration'),
+            'stages': tick_record.get('stages', {}),
+        })
+
+    def _report(self, wall_seconds: float, first_ts: Optional[int], last_ts: Optional[int]) -> Dict[str, Any]:
+        stages: Dict[str, List[float]] = {}
+        for tick in self.ticks:
+            for stage, seconds in tick['stages'].items():
+                stages.setdefault(stage, []).append(seconds)
+
+        return {
+            'ticks': len(self.ticks),
+            'orders': self.exchange.orders,
+            'decisions': [
+                {key: tick[key] for key in ('ts', 'triggers', 'fallback', 'action', 'error')}
+                for tick in self.ticks
+            ],
+            'stages': {
+                stage: {
+                    'count': len(values),
+                    'mean': float(np.mean(values)),
+                    'p95': float(np.percentile(values, 95)),
+                    'max': float(np.max(values)),
+                }
+                for stage, values in stages.items()
+            },
+            'wall_seconds': wall_seconds,
+            'virtual_seconds': ((last_ts - first_ts) / 1000) if first_ts is not None else 0.0,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기록된 시장 데이터로 전략 재생")
+    parser.add_argument('--directory', default=DEFAULT_RECORDING_DIR, help="기록 세그먼트 디렉토리")
+    parser.add_argument('--speed', type=float, default=0.0, help="배속 (0이면 최대 속도)")
+    parser.add_argument('--start', type=int, default=None, help="시작 시각 (epoch ms)")
+    parser.add_argument('--end', type=int, default=None, help="종료 시각 (epoch ms)")
+    parser.add_argument('--output', default=None, help="보고서 JSON 경로")
+    args = parser.parse_args()
+
+    config = config_service.get()
+    # 재생 중 실제 LLM 호출 방지: 카세트 설정이 없으면 기록 없는 프롬프트는 고정 응답
+    cassette = LLMCassette.from_config(config['llm'].get('cassette'))
+    if cassette is None:
+        cassette = LLMCassette(mode='replay', on_miss='stub')
+
+    clock = VirtualClock(args.speed)
+    exchange = ReplayExchange(clock)
+    strategy = LLMStrategy(
+        api_key=config['groq']['api_key'],
+        client=exchange,
+        trigger=TriggerEngine.from_config(config['trading'].get('trigger')),
+        trade_amount=config['trading']['min_amount'],
+        compact=config['trading'].get('compact_indicators', True),
+        cassette=cassette,
+        breaker=CircuitBreaker.from_config(config['llm'].get('circuit_breaker'), clock=clock.time),
+    )
+    engine = ReplayEngine(
+        strategy, clock, exchange,
+        symbol=config['trading']['symbol'],
+        tick_budget=config['trading'].get('tick_budget'),
+        closed=(config['trading'].get('schedule') or {}).get('align', True),
+    )
+    report = engine.run(read_records(args.directory, args.start, args.end))
+
+    print(f"틱 {report['ticks']}개, 주문 {len(report['orders'])}건, "
+          f"가상 {report['virtual_seconds']:.0f}초 / 실제 {report['wall_seconds']:.2f}초")
+    for stage, summary in report['stages'].items():
+        print(f"  {stage}: 평균 {summary['mean'] * 1000:.2f}ms, p95 {summary['p95'] * 1000:.2f}ms")
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=1, default=str)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,16 +19,74 @@
   - 상태 보고
 """
 
+import atexit
+import threading
 import time
 from pathlib import Path
-import yaml
 import logging
 
+import pandas as pd
+
 from models.groq_interface import GroqInterface
+from models.analysis_memory import AnalysisMemory
+from models.llm_cassette import LLMCassette
 from strategies.binance_client import BinanceClient
 from strategies.llm_strategy import LLMStrategy
-from scripts.fetch_data import fetch_market_data
-from utils.logger import setup_logger
+from strategies.trigger_engine import TriggerEngine
+from scripts.fetch_data import fetch_candles
+from utils.config import config_service
+from utils.deadline import BoundedExecutor, CircuitBreaker, TickBudget
+from utils.logger import setup_logger, set_log_context
+from utils.market_recorder import recorder
+from utils.memory_monitor import MemoryMonitor
+from utils.metrics import metrics
+from utils.pipeline import LatestQueue, Pipeline, Stage
+from utils.price_ring import PriceRingBuffer
+from utils.profiler import profiler
+from utils.scheduler import TickScheduler, schedule_symbols
+from utils.trade_history import TradeHistory
+from utils.state_bus import (
+    StateBusServer, DEFAULT_SOCKET_PATH, DEFAULT_POSITION_INTERVAL,
+    TOPIC_CANDLES, TOPIC_ANALYSIS, TOPIC_LLM, TOPIC_POSITION, TOPIC_ORDER
+)
+
+# 페어별 마지막 포지션 발행 시각 (단조 시계)
+_position_published = {}
+
+def publish_state(bus, analysis, client, symbol, order, position_interval=DEFAULT_POSITION_INTERVAL):
+    """
+    틱 결과를 상태 버스로 발행
+    
+    대시보드 프로세스들은 거래소/LLM을 직접 호출하지 않고 이 값을 사용
+    
+    Args:
+        analysis (dict): LLMStrategy.decide()가 반환한 분석 결과
+        position_interval (float): 주문이 없을 때 포지션을 다시 조회/발행하는 최소 간격 (초)
+    """
+    technical = {
+        key: value for key, value in analysis['technical_analysis'].items()
+        if key != 'historical_data'
+    }
+    chart_data = analysis['chart_data']
+    if not isinstance(chart_data, pd.DataFrame):
+        chart_data = chart_data.to_frame()  # 컴팩트 모드 결과는 DataFrame으로 변환해 발행
+    bus.publish(TOPIC_CANDLES, chart_data)
+    bus.publish(TOPIC_ANALYSIS, technical)
+    if analysis['llm_analysis'] is not None:
+        bus.publish(TOPIC_LLM, analysis['llm_analysis'])
+    # 포지션은 주문 직후 또는 position_interval마다만 조회 (틱마다 fetch_balance 방지)
+    now = time.monotonic()
+    last = _position_published.get(symbol)
+    if order or last is None or now - last >= position_interval:
+        bus.publish(TOPIC_POSITION, client.get_position(symbol))
+        _position_published[symbol] = now
+    if order:
+        bus.publish(TOPIC_ORDER, order)
+
+def merge_triggers(previous, item):
+    """결정 대기열에서 대체되는 스냅샷의 트리거 사유를 새 스냅샷에 합침 (트리거 유실 방지)"""
+    item['triggers'] = list(dict.fromkeys(previous['triggers'] + item['triggers']))
+    return item
 
 def main():
     """
@@ -39,44 +97,253 @@ def main():
     3. API 클라이언트 설정
     4. 거래 루프 실행
     """
-    # 설정 로드
-    config = yaml.safe_load(open('utils/config.yaml'))
+    # 설정 로드 (파일 변경 시 실행 중에도 반영)
+    config = config_service.get()
     
     # 로거 설정
-    logger = setup_logger()
+    logger = setup_logger(config.get('logging'))
+    
+    # 계측 설정 (메트릭 엔드포인트, JSONL 기록)
+    metrics.setup(config.get('metrics'))
+    
+    # 거래소 응답 기록 (장애 재현/벤치마크용)
+    recorder.setup(config.get('recorder'))
+    atexit.register(recorder.close)  # 대기열에 남은 응답 기록 (다른 종료 처리보다 나중에 실행)
+    
+    # 프로파일링 제어 (SIGUSR2, /profile 엔드포인트, profiling 설정)
+    profiler.setup(config.get('profiling'))
+    profiler.install_signal()
+    metrics.add_route('/profile', profiler.http_handler)
+    
+    # 장기 실행 메모리 감시 (RSS, 상위 할당 위치, 증가 경고)
+    memory_monitor = MemoryMonitor.from_config(config.get('memory'))
     
     try:
         # 클라이언트 초기화
         client = BinanceClient(
             api_key=config['binance']['testnet']['api_key'],
             secret_key=config['binance']['testnet']['secret_key'],
-            testnet=True
+            testnet=True,
+            trade_history=TradeHistory.from_config(config.get('trade_history')),
+            fills_config=config.get('fills')
         )
+        atexit.register(client.trade_history.flush)  # 메모리에 남은 거래 내역 저장
         
-        # 전략 초기화
-        strategy = LLMStrategy(
-            api_key=config['groq']['api_key'],
-            client=client
-        )
+        # 실시간 가격 기록용 링 버퍼 (대시보드가 조회)
+        live_buffer = PriceRingBuffer.from_config(config.get('live_data'))
         
-        # 거래 루프
+        # 대시보드 공유용 상태 버스
+        bus_config = config.get('state_bus', {})
+        bus = None
+        if bus_config.get('enabled', True):
+            bus = StateBusServer(bus_config.get('path', DEFAULT_SOCKET_PATH)).start()
+        
+        # LLM 장애 차단기, 호출 작업자, 응답 카세트는 프로세스 전체에서 공유
+        # (같은 API/한도를 쓰고, 카세트 파일은 한 인스턴스만 기록해야 함)
+        breaker = CircuitBreaker.from_config(config['llm'].get('circuit_breaker'))
+        llm_executor = BoundedExecutor.from_config(config['llm'])
+        cassette = LLMCassette.from_config(config['llm'].get('cassette'))
+        
+        # 거래 페어별 전략 (트리거/분석 상태/분석 기억은 페어마다 따로 유지)
+        strategies = {}
+        strategies_lock = threading.Lock()
+        
+        def get_strategy(symbol):
+            with strategies_lock:
+                if symbol not in strategies:
+                    strategies[symbol] = LLMStrategy(
+                        api_key=config['groq']['api_key'],
+                        client=client,
+                        trigger=TriggerEngine.from_config(config['trading'].get('trigger')),
+                        trade_amount=config['trading']['min_amount'],
+                        compact=config['trading'].get('compact_indicators', True),
+                        cassette=cassette,
+                        memory=AnalysisMemory.from_config(config['llm'].get('memory'), symbol=symbol),
+                        breaker=breaker,
+                        llm_timeout=config['llm'].get('timeout', 30.0),
+                        symbol=symbol,
+                        executor=llm_executor
+                    )
+                return strategies[symbol]
+        
+        # 캔들 경계에 맞춘 틱 스케줄 (작업 시간 보정, 누락 틱 감지)
+        settings = {'config': config, 'scheduler': TickScheduler.from_config(config['trading'])}
+        
+        # 설정 변경 반영
+        def apply_config(new_config):
+            old_trading = settings['config']['trading']
+            trigger_config = new_config['trading'].get('trigger')
+            for strategy in strategies.values():
+                if trigger_config != old_trading.get('trigger'):
+                    strategy.trigger = TriggerEngine.from_config(trigger_config)
+                strategy.trade_amount = new_config['trading']['min_amount']
+                strategy.llm_timeout = new_config['llm'].get('timeout', 30.0)
+            if any(new_config['trading'].get(key) != old_trading.get(key)
+                   for key in ('symbol', 'interval', 'schedule')):
+                settings['scheduler'] = TickScheduler.from_config(new_config['trading'])
+            if new_config.get('profiling') != settings['config'].get('profiling'):
+                profiler.setup(new_config.get('profiling'))
+            if new_config['trading'].get('pipeline') != old_trading.get('pipeline'):
+                # 단계별 작업자 구성은 시작 시 한 번만 만들어짐
+                logger.warning("trading.pipeline 변경은 봇을 다시 시작해야 적용됩니다")
+            settings['config'] = new_config
+            logger.info("변경된 설정 적용")
+        
+        config_service.subscribe(apply_config)
+        
+        def ingest(symbol, primary, budget, closed=False):
+            """
+            시장 데이터 수집 (캔들 + 티커)
+            
+            closed가 True면 (캔들 경계 정렬 틱) 방금 열린 진행 중 캔들을 빼고 확정 캔들만 반환
+            """
+            config = settings['config']
+            timeframe = schedule_symbols(config['trading']).get(symbol, {}).get('timeframe', '1h')
+            with metrics.span('fetch'):
+                if closed:
+                    market_data = fetch_candles(symbol, timeframe, limit=101, timeout=budget.remaining()).closed()
+                else:
+                    market_data = fetch_candles(symbol, timeframe, timeout=budget.remaining())
+                ticker = client.get_ticker(symbol)
+            if primary:
+                live_buffer.append_ticker(ticker)
+            return market_data
+        
+        def report(strategy, triggers, fallback, order, latency):
+            """틱 결과 로그와 체결 동기화"""
+            if triggers:
+                logger.info(f"LLM 분석 트리거: {', '.join(triggers)}")
+            if fallback:
+                logger.warning(f"LLM 대신 규칙 기반 결정 사용: {fallback}")
+            if order:
+                logger.info(f"주문 실행: {order}", extra={'latency': latency})
+            # 거래소 체결 동기화 (min_interval마다 새 체결만 조회, 대시보드 통계 공유)
+            with metrics.span('fills'):
+                client.fills.maybe_sync([strategy.symbol])
+        
+        # 단계별 파이프라인 (LLM 응답을 기다리는 동안에도 수집/분석 계속)
+        pipeline_config = config['trading'].get('pipeline') or {}
+        pipeline = None
+        if pipeline_config.get('enabled', False):
+            def analyze_stage(item):
+                strategy = get_strategy(item['symbol'])
+                item['analysis'], item['triggers'] = strategy.evaluate(item['market_data'])
+                return item
+            
+            def decide_stage(item):
+                # 틱은 결정 단계에서 시작해 주문/상태 발행을 마친 실행 단계에서 종료
+                strategy = get_strategy(item['symbol'])
+                metrics.start_tick()
+                profiler.on_tick_start()
+                set_log_context(tick=metrics.tick, symbol=item['symbol'])
+                try:
+                    item['decision'], item['analysis'] = strategy.decide(
+                        item['market_data'], item['analysis'], item['triggers'], budget=item['budget']
+                    )
+                    item['fallback'] = strategy.last_fallback
+                except Exception as e:
+                    profiler.on_tick_end()
+                    metrics.end_tick(triggers=item['triggers'], error=str(e))
+                    raise
+                profiler.on_tick_end()
+                item['tick'] = metrics.detach_tick()
+                return item
+            
+            def drop_decision(item, reason):
+                """실행하지 않고 버린 결정의 틱 기록 종료"""
+                metrics.attach_tick(item.get('tick'))
+                metrics.end_tick(triggers=item['triggers'], fallback=item['fallback'], dropped=reason)
+            
+            def supersede_decision(previous, item):
+                # 실행 전에 같은 페어의 새 결정이 오면 이전 결정은 버림
+                drop_decision(previous, 'superseded')
+                return item
+            
+            def execute_stage(item):
+                strategy = get_strategy(item['symbol'])
+                metrics.attach_tick(item['tick'])
+                # 로그 컨텍스트는 스레드별이므로 실행 단계에서도 이 틱 기준으로 설정
+                set_log_context(tick=item['tick']['tick'], symbol=item['symbol'])
+                try:
+                    order = strategy.act(item['decision'], item['analysis'])
+                    if bus and item['primary']:
+                        with metrics.span('publish'):
+                            publish_state(bus, item['analysis'], client, item['symbol'], order,
+                                          bus_config.get('position_interval', DEFAULT_POSITION_INTERVAL))
+                except Exception as e:
+                    metrics.end_tick(triggers=item['triggers'], fallback=item['fallback'], error=str(e))
+                    raise
+                metrics.end_tick(triggers=item['triggers'], fallback=item['fallback'], order=bool(order))
+                latency = time.monotonic() - item['created']
+                metrics.observe('pipeline_latency_seconds', latency)
+                report(strategy, item['triggers'], item['fallback'], order, latency)
+            
+            # 단계 사이 대기열은 페어별 최신 스냅샷 하나만 보관
+            analysis_queue = LatestQueue('analysis')
+            decision_queue = LatestQueue('decision', merge=merge_triggers)
+            execution_queue = LatestQueue('execution', merge=supersede_decision)
+            pipeline = Pipeline([
+                Stage('analysis', analyze_stage, analysis_queue, decision_queue),
+                Stage('decision', decide_stage, decision_queue, execution_queue),
+                # 오래된 결정은 주문하지 않음 (가격이 이미 움직였을 수 있음)
+                Stage('execution', execute_stage, execution_queue,
+                      max_age=pipeline_config.get('max_age', config['trading'].get('tick_budget', 60)),
+                      on_stale=lambda item: drop_decision(item, 'stale')),
+            ]).start()
+            atexit.register(pipeline.stop, 5.0)
+        
+        # 거래 루프 (예정 시각까지 대기 후 해당 페어 틱 실행)
         while True:
-            try:
-                # 시장 데이터 수집
-                market_data = fetch_market_data()
+            for job in settings['scheduler'].wait():
+                config = settings['config']
+                symbol = job.name
+                primary = symbol == config['trading']['symbol']
+                # 수집/분석/LLM 단계가 나눠 쓰는 틱 시간 예산
+                budget = TickBudget(config['trading'].get('tick_budget', job.period))
                 
-                # 전략 실행
-                order = strategy.execute(market_data)
+                if pipeline:
+                    # 수집만 하고 다음 단계로 전달 (분석/결정/주문은 단계별 작업자가 처리)
+                    try:
+                        market_data = ingest(symbol, primary, budget, closed=job.align)
+                    except Exception as e:
+                        metrics.inc('tick_errors_total')
+                        logger.error(f"시장 데이터 수집 오류: {e}")
+                        continue
+                    pipeline.submit(symbol, {
+                        'symbol': symbol, 'primary': primary,
+                        'market_data': market_data, 'budget': budget,
+                    })
+                    continue
                 
-                if order:
-                    logger.info(f"주문 실행: {order}")
+                strategy = get_strategy(symbol)
+                try:
+                    metrics.start_tick()
+                    profiler.on_tick_start()
+                    set_log_context(tick=metrics.tick, symbol=symbol)
+                    
+                    # 시장 데이터 수집
+                    market_data = ingest(symbol, primary, budget, closed=job.align)
+                    
+                    # 전략 실행
+                    order = strategy.execute(market_data, budget=budget)
+                    
+                    # 상태 발행 (대시보드는 기본 거래 페어만 표시)
+                    if bus and primary:
+                        with metrics.span('publish'):
+                            publish_state(bus, strategy.last_analysis, client, symbol, order,
+                                          bus_config.get('position_interval', DEFAULT_POSITION_INTERVAL))
+                    profiler.on_tick_end()
+                    tick_record = metrics.end_tick(triggers=strategy.last_triggers, order=bool(order))
+                    report(strategy, strategy.last_triggers, strategy.last_fallback, order, tick_record['duration'])
                     
-                # 대기
-                time.sleep(config['trading']['interval'])
+                except Exception as e:
+                    metrics.inc('tick_errors_total')
+                    profiler.on_tick_end()
+                    metrics.end_tick(error=str(e))
+                    logger.error(f"거래 중 오류: {e}")
                 
-            except Exception as e:
-                logger.error(f"거래 중 오류: {e}")
-                time.sleep(5)
+            if memory_monitor:
+                memory_monitor.maybe_sample()
                 
     except Exception as e:
         logger.error(f"시스템 오류: {e}")
@@ -0,0 +1,98 @@
+"""
+메모리 소크 테스트 스크립트
+고정 시드의 합성 캔들로 전략 틱을 최대 속도로 반복하며 메모리 증가 여부 확인
+
+# 동작:
+- 매 틱 새 캔들 응답(list of lists) 생성 → CandleBatch 변환 → LLMStrategy.execute
+- LLM은 고정 응답 카세트, 거래소는 재생용 대역 사용 (외부 호출 없음)
+- 일정 틱마다 MemoryMonitor로 샘플링, 워밍업 이후 증가량/틱당 증가율 보고
+- 증가량이 한도를 넘으면 종료 코드 1
+
+사용법:
+    python -m scripts.soak_test --ticks 20000 --sample-every 1000 --max-growth-mb 20
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from models.llm_cassette import LLMCassette
+from scripts.replay_market import ReplayExchange, VirtualClock
+from strategies.llm_strategy import LLMStrategy
+from strategies.trigger_engine import TriggerEngine
+from utils.candles import CandleBatch
+from utils.memory_monitor import MemoryMonitor
+from utils.metrics import metrics
+
+HOUR_MS = 3600 * 1000
+
+
+def synthetic_candles(rng: np.random.Generator, total: int, start_ms: int = 1_600_000_000_000) -> np.ndarray:
+    """랜덤워크 OHLCV (total, 6) 배열"""
+    close = 30000 * np.exp(np.cumsum(rng.normal(0, 0.01, total)))
+    spread = close * rng.uniform(0.001, 0.01, total)
+    ts = start_ms + np.arange(total) * HOUR_MS
+    return np.column_stack([ts, close, close + spread, close - spread, close, rng.uniform(1, 100, total)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="전략 틱 반복 메모리 소크 테스트")
+    parser.add_argument('--ticks', type=int, default=20000)
+    parser.add_argument('--window', type=int, default=100, help="틱당 캔들 수")
+    parser.add_argument('--sample-every', type=int, default=1000)
+    parser.add_argument('--warmup-samples', type=int, default=3)
+    parser.add_argument('--max-growth-mb', type=float, default=20.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-compact', action='store_true', help="DataFrame 지표 경로로 실행")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    candles = synthetic_candles(rng, args.ticks + args.window)
+
+    clock = VirtualClock(speed=0)
+    exchange = ReplayExchange(clock)
+    strategy = LLMStrategy(
+        api_key='',
+        client=exchange,
+        trigger=TriggerEngine(),
+        trade_amount=0.001,
+        compact=not args.no_compact,
+        cassette=LLMCassette(path='data/cassettes/soak.jsonl.gz', mode='replay', on_miss='stub'),
+    )
+    monitor = MemoryMonitor(
+        interval=0, warmup_samples=args.warmup_samples,
+        growth_threshold_mb=args.max_growth_mb, slope_threshold_mb_per_hour=float('inf'),
+    ).start()
+
+    record = {}
+    for tick in range(args.ticks):
+        rows = candles[tick:tick + args.window]
+        clock.advance_to(int(rows[-1, 0]))
+        exchange.apply({'kind': 'ticker', 'args': {'symbol': 'BTC/USDT'}, 'data': {'last': rows[-1, 4]}})
+
+        metrics.start_tick()
+        strategy.execute(CandleBatch.from_ccxt(rows.tolist()))
+        metrics.end_tick()
+
+        if (tick + 1) % args.sample_every == 0:
+            exchange.orders.clear()  # 대역의 모의 주문 기록은 측정 대상이 아님
+            record = monitor.sample()
+            print(f"틱 {tick + 1:>7}: RSS {record['rss_mb']:8.1f}MB, "
+                  f"추적 {record.get('traced_mb', 0):7.2f}MB, 기준 대비 {monitor.growth_mb():+7.2f}MB")
+
+    growth = monitor.growth_mb()
+    # 기준은 워밍업 다음 샘플 (틱 sample_every * (warmup_samples + 1)), 증가량은 마지막 샘플 기준
+    last_sampled = args.ticks - args.ticks % args.sample_every
+    measured_ticks = last_sampled - args.sample_every * (args.warmup_samples + 1)
+    per_tick_kb = growth * 1024 / measured_ticks if measured_ticks > 0 else 0.0
+    print(f"기준 대비 증가 {growth:+.2f}MB ({per_tick_kb:+.3f}KB/틱)")
+    if record.get('growth'):
+        print("증가 상위 할당 위치:")
+        for item in record['growth'][:5]:
+            print(f"  {item['where']}: +{item['size_mb']:.2f}MB ({item['count']:+d})")
+    sys.exit(1 if growth > args.max_growth_mb else 0)
+
+
+if __name__ == "__main__":
+    main()
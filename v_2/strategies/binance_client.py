@@ -27,12 +27,21 @@
 import ccxt
 import pandas as pd
 from typing import Dict, Any
-from datetime import datetime
+
+from strategies.fill_sync import FillSynchronizer
+from utils.candles import CandleBatch
+from utils.market_recorder import recorder
+from utils.trade_history import TradeHistory, to_frame
 
 class BinanceClient:
-    def __init__(self, api_key: str = '', secret_key: str = '', testnet: bool = True):
+    def __init__(self, api_key: str = '', secret_key: str = '', testnet: bool = True,
+                 trade_history: TradeHistory = None, fills_config: Dict[str, Any] = None):
         """
         바이낸스 클라이언트 초기화
+
+        Args:
+            trade_history (TradeHistory, optional): 거래 내역 저장소 (기본: data/trades)
+            fills_config (dict, optional): 체결 동기화 설정 (config['fills'])
         """
         # 테스트넷 URL 먼저 설정
         self.urls = {
@@ -58,16 +67,29 @@ class BinanceClient:
         })
         
         self.exchange.load_markets()  # 거래 가능한 마켓 정보 로드
-        self.trade_history = []  # 거래 내역 저장
+        self.trade_history = trade_history if trade_history is not None else TradeHistory()  # 최근 거래는 메모리, 오래된 거래는 디스크
+        # 거래소 체결 내역 기반 통계 (다른 곳에서 체결된 거래 포함)
+        self.fills = FillSynchronizer.from_config(
+            self.exchange, fills_config, environment='testnet' if testnet else 'live'
+        )
 
     def get_market_price(self, symbol: str) -> float:
         """현재가 조회"""
         ticker = self.exchange.fetch_ticker(symbol)
+        recorder.record('ticker', ticker, symbol=symbol)
         return ticker['last']
     
+    def get_ticker(self, symbol: str) -> Dict[str, Any]:
+        """현재가/호가/거래량 등 티커 정보 조회"""
+        ticker = self.exchange.fetch_ticker(symbol)
+        recorder.record('ticker', ticker, symbol=symbol)
+        return ticker
+    
     def get_balance(self) -> Dict[str, Any]:
         """계정 잔고 조회"""
-        return self.exchange.fetch_balance()
+        balance = self.exchange.fetch_balance()
+        recorder.record('balance', balance)
+        return balance
     
     def place_order(self, symbol: str, side: str, amount: float, price: float = None):
         """
@@ -81,16 +103,16 @@ class BinanceClient:
         """
         try:
             order = self.exchange.create_limit_order(symbol, side, amount, price)
+            recorder.record('order', order, symbol=symbol, side=side, amount=amount, price=price)
             
             # 거래 내역 저장
-            self.trade_history.append({
-                'timestamp': datetime.now(),
-                'symbol': symbol,
-                'side': side,
-                'amount': amount,
-                'price': price or self.get_market_price(symbol),
-                'status': order['status']
-            })
+            self.trade_history.append(
+                symbol, side, amount,
+                price or order.get('price') or self.get_market_price(symbol),
+                status=order['status'],
+                ts=order.get('timestamp'),
+                order_id=order.get('id') or ''
+            )
             return order
         except Exception as e:
             raise e
@@ -107,11 +129,19 @@ class BinanceClient:
         Returns:
             list: [[timestamp, open, high, low, close, volume], ...]
         """
-        return self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+        ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+        recorder.record('ohlcv', ohlcv, symbol=symbol, timeframe=timeframe)
+        return ohlcv
+
+    def get_candles(self, symbol: str, timeframe: str = '1h', limit: int = 100) -> CandleBatch:
+        """OHLCV 데이터를 컴팩트 캔들 배치로 조회 (필요 시 .to_frame()으로 DataFrame 변환)"""
+        return CandleBatch.from_ccxt(self.get_ohlcv(symbol, timeframe, limit))
 
     def get_orderbook(self, symbol: str):
         """호가창 정보 조회"""
-        return self.exchange.fetch_order_book(symbol)
+        orderbook = self.exchange.fetch_order_book(symbol)
+        recorder.record('orderbook', orderbook, symbol=symbol)
+        return orderbook
 
     def get_position(self, symbol: str):
         """
@@ -127,6 +157,7 @@ class BinanceClient:
             }
         """
         balance = self.exchange.fetch_balance()
+        recorder.record('balance', balance)
         base, quote = symbol.split('/')
         
         return {
@@ -134,24 +165,41 @@ class BinanceClient:
             'quote': balance[quote]
         }
 
-    def get_trade_stats(self):
+    def get_trade_history(self, page: int = 0, page_size: int = 50) -> pd.DataFrame:
+        """
+        거래 내역 페이지 조회 (최신순, 디스크에 내보낸 거래 포함)
+        
+        Args:
+            page (int): 페이지 번호 (0부터)
+            page_size (int): 페이지 크기
+            
+        Returns:
+            pd.DataFrame: timestamp 인덱스, symbol/side/amount/price/status/order_id 컬럼
+        """
+        return to_frame(self.trade_history.page(page, page_size))
+
+    def get_trade_stats(self, symbol: str = 'BTC/USDT'):
         """
-        거래 통계 정보
+        거래 통계 정보 (거래소 체결 내역 기준)
+        
+        새 체결만 증분 동기화하며, 최근에 동기화했으면 거래소를 조회하지 않음
+        
+        Args:
+            symbol (str): 거래 페어 (None이면 동기화된 전체 페어 합산)
         
         Returns:
             dict: {
                 'total_trades': 총 거래 횟수,
-                'success_rate': 성공률,
+                'buy_trades': 매수 횟수,
+                'sell_trades': 매도 횟수,
+                'success_rate': 성공률 (이익 실현 매도 비율, %),
                 'total_volume': 총 거래대금,
-                'avg_trade_size': 평균 거래량
+                'avg_trade_size': 평균 거래량,
+                'realized_pnl': FIFO 실현 손익,
+                'fees': 수수료,
+                'net_pnl': 수수료 차감 손익,
+                ...
             }
         """
-        # TODO: 실제 거래 통계 구현
-        return {
-            'total_trades': 0,
-            'buy_trades': 0,
-            'sell_trades': 0,
-            'success_rate': 0.0,
-            'total_volume': 0.0,
-            'avg_trade_size': 0.0
-        } 
\ No newline at end of file
+        self.fills.maybe_sync([symbol] if symbol is not None else list(self.fills.cursors))
+        return self.fills.summary(symbol) 
\ No newline at end of file
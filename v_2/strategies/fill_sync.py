@@ -0,0 +1,281 @@
+"""
+거래소 체결 내역 동기화와 거래 통계
+fetch_my_trades를 커서 기반으로 이어 받아 페어별 통계를 증분 갱신
+
+# 주요 기능:
+- 동기화 (FillSynchronizer)
+  - 페어별 커서(다음 조회 시작 시각, 마지막 체결 시각/ID)를 파일에 저장
+  - 매 동기화마다 커서 이후의 새 체결만 페이지 단위로 조회
+  - 조회 기간 제한이 있는 거래소(바이낸스 현물 24시간)를 위해 빈 구간은 window_ms씩 건너뜀
+  - min_interval 이내 재호출은 거래소 조회 없이 저장된 통계 반환 (대시보드 재실행 대응)
+
+- 통계 (FillStats)
+  - 매수/매도 횟수, 거래량, 거래대금
+  - FIFO 실현 손익, 수수료 (결제 통화 환산)
+  - 승률: 손익이 확정된 매도 중 이익 비율
+
+- 저장 형식
+  - JSON 파일 하나: {'symbols': {페어: {'cursor': ..., 'stats': ...}}, 'synced_at': {페어: 시각}}
+  - 원자적 교체로 기록 (봇과 대시보드가 같은 파일 공유)
+"""
+
+import json
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional
+
+from utils.metrics import metrics
+
+DEFAULT_FILLS_PATH = 'data/fills/{environment}.json'
+DAY_MS = 24 * 3600 * 1000
+
+logger = logging.getLogger(__name__)
+
+
+class FillStats:
+    __slots__ = ('trades', 'buy_trades', 'sell_trades', 'base_volume', 'quote_volume',
+                 'fees', 'other_fees', 'realized_pnl', 'wins', 'losses', 'unmatched', 'lots')
+
+    def __init__(self):
+        self.trades = 0
+        self.buy_trades = 0
+        self.sell_trades = 0
+        self.base_volume = 0.0
+        self.quote_volume = 0.0
+        self.fees = 0.0          # 결제 통화 환산 수수료
+        self.other_fees = {}     # 환산할 수 없는 수수료 (예: BNB) 통화 -> 금액
+        self.realized_pnl = 0.0  # 수수료 제외 전 FIFO 실현 손익
+        self.wins = 0
+        self.losses = 0
+        self.unmatched = 0.0     # 매수 기록 없이 매도된 수량 (동기화 시작 전 보유분)
+        self.lots = deque()      # 미청산 매수 [수량, 가격]
+
+    def apply(self, fill: Dict[str, Any], base: str, quote: str):
+        """ccxt 체결(trade) 한 건 반영"""
+        amount = float(fill['amount'])
+        price = float(fill['price'])
+        cost = float(fill.get('cost') or amount * price)
+        self.trades += 1
+        self.base_volume += amount
+        self.quote_volume += cost
+
+        fee = fill.get('fee') or {}
+        if fee.get('cost'):
+            currency = fee.get('currency')
+            if currency == quote:
+                self.fees += float(fee['cost'])
+            elif currency == base:
+                self.fees += float(fee['cost']) * price
+            else:
+                self.other_fees[currency] = self.other_fees.get(currency, 0.0) + float(fee['cost'])
+
+        if fill['side'] == 'buy':
+            self.buy_trades += 1
+            self.lots.append([amount, price])
+            return
+
+        self.sell_trades += 1
+        remaining = amount
+        pnl = 0.0
+        matched = False
+        while remaining > 1e-12 and self.lots:
+            lot = self.lots[0]
+            quantity = min(lot[0], remaining)
+            pnl += (price - lot[1]) * quantity
+            lot[0] -= quantity
+            remaining -= quantity
+            matched = True
+            if lot[0] <= 1e-12:
+                self.lots.popleft()
+        self.unmatched += max(0.0, remaining)
+        if matched:
+            self.realized_pnl += pnl
+            if pnl > 0:
+                self.wins += 1
+            else:
+                self.losses += 1
+
+    def merge(self, other: 'FillStats'):
+        """다른 페어 통계 합산 (전체 통계용, 미청산 매수는 합치지 않음)"""
+        for name in ('trades', 'buy_trades', 'sell_trades', 'base_volume', 'quote_volume',
+                     'fees', 'realized_pnl', 'wins', 'losses', 'unmatched'):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for currency, cost in other.other_fees.items():
+            self.other_fees[currency] = self.other_fees.get(currency, 0.0) + cost
+
+    def summary(self) -> Dict[str, Any]:
+        """get_trade_stats() 형식의 통계"""
+        closed = self.wins + self.losses
+        return {
+            'total_trades': self.trades,
+            'buy_trades': self.buy_trades,
+            'sell_trades': self.sell_trades,
+            'success_rate': self.wins / closed * 100 if closed else 0.0,
+            'total_volume': self.quote_volume,
+            'avg_trade_size': self.base_volume / self.trades if self.trades else 0.0,
+            'realized_pnl': self.realized_pnl,
+            'fees': self.fees,
+            'other_fees': dict(self.other_fees),
+            'net_pnl': self.realized_pnl - self.fees,
+            'open_amount': sum(lot[0] for lot in self.lots),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state['lots'] = list(self.lots)
+        return state
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'FillStats':
+        stats = cls()
+        for name in cls.__slots__:
+            if name in state:
+                setattr(stats, name, state[name])
+        stats.lots = deque(state.get('lots', []))
+        return stats
+
+
+class FillSynchronizer:
+    def __init__(self, exchange, path: str, page_limit: int = 500, min_interval: float = 60.0,
+                 lookback_days: float = 30, window_ms: int = DAY_MS):
+        """
+        체결 동기화 초기화 (저장된 커서/통계가 있으면 이어서 사용)
+
+        Args:
+            exchange: ccxt 거래소 객체 (fetch_my_trades 지원)
+            path (str): 커서/통계 저장 파일
+            page_limit (int): 한 번에 조회할 체결 수
+            min_interval (float): 같은 페어를 다시 조회하기까지 최소 간격 (초)
+            lookback_days (float): 첫 동기화 시 조회할 과거 기간 (일)
+            window_ms (int): 거래소의 조회 기간 제한 (ms, 빈 구간을 이 단위로 건너뜀)
+        """
+        self.exchange = exchange
+        self.path = path
+        self.page_limit = page_limit
+        self.min_interval = min_interval
+        self.lookback_days = lookback_days
+        self.window_ms = window_ms
+        self.cursors: Dict[str, Dict[str, Any]] = {}
+        self.stats: Dict[str, FillStats] = {}
+        self.synced_at: Dict[str, float] = {}
+        self._load()
+
+    @classmethod
+    def from_config(cls, exchange, config: Optional[Dict[str, Any]] = None,
+                    environment: str = 'testnet') -> 'FillSynchronizer':
+        """config['fills'] 설정으로 생성 (저장 파일은 환경별로 분리)"""
+        config = config or {}
+        return cls(
+            exchange,
+            config.get('path') or DEFAULT_FILLS_PATH.format(environment=environment),
+            page_limit=config.get('page_limit', 500),
+            min_interval=config.get('min_interval', 60.0),
+            lookback_days=config.get('lookback_days', 30),
+        )
+
+    def maybe_sync(self, symbols: Iterable[str]) -> int:
+        """min_interval이 지난 페어만 동기화 (대시보드 조회용)"""
+        self._load()  # 다른 프로세스가 먼저 동기화했으면 그 결과 사용
+        now = time.time()
+        due = [s for s in symbols if now - self.synced_at.get(s, 0.0) >= self.min_interval]
+        return self.sync(due) if due else 0
+
+    def sync(self, symbols: Iterable[str]) -> int:
+        """
+        커서 이후 새 체결 조회 및 통계 반영
+
+        Returns:
+            int: 반영한 새 체결 수
+        """
+        total = 0
+        for symbol in symbols:
+            try:
+                total += self._sync_symbol(symbol)
+            except Exception as e:
+                metrics.inc('fill_sync_errors_total')
+                logger.error(f"{symbol} 체결 동기화 실패: {e}")
+                continue
+            self.synced_at[symbol] = time.time()
+            self._save()
+        return total
+
+    def summary(self, symbol: Optional[str] = None) -> Dict[str, Any]:
+        """
+        거래 통계 (거래소 조회 없음)
+
+        Args:
+            symbol (str, optional): 거래 페어 (기본: 전체 합산)
+        """
+        if symbol is not None:
+            return self.stats.get(symbol, FillStats()).summary()
+        combined = FillStats()
+        for stats in self.stats.values():
+            combined.merge(stats)
+        return combined.summary()
+
+    def _sync_symbol(self, symbol: str) -> int:
+        base, quote = symbol.split('/')
+        now = int(time.time() * 1000)
+        cursor = self.cursors.setdefault(symbol, {
+            'since': now - int(self.lookback_days * DAY_MS), 'last_ts': 0, 'last_ids': [],
+        })
+        stats = self.stats.setdefault(symbol, FillStats())
+
+        applied = 0
+        while True:
+            page = self.exchange.fetch_my_trades(symbol, since=cursor['since'], limit=self.page_limit)
+            for fill in self._new_fills(page, cursor):
+                stats.apply(fill, base, quote)
+                if fill['timestamp'] > cursor['last_ts']:
+                    cursor['last_ts'], cursor['last_ids'] = fill['timestamp'], []
+                cursor['last_ids'].append(str(fill['id']))
+                applied += 1
+
+            if len(page) >= self.page_limit and page[-1]['timestamp'] > cursor['since']:
+                cursor['since'] = page[-1]['timestamp']  # 다음 페이지 (같은 시각 체결은 ID로 중복 제거)
+                continue
+            if cursor['since'] + self.window_ms < now:
+                cursor['since'] += self.window_ms  # 조회 기간 제한 밖의 다음 구간
+                continue
+            cursor['since'] = max(cursor['since'], cursor['last_ts'])
+            break
+
+        if applied:
+            metrics.inc('fills_synced_total', applied, symbol=symbol)
+        return applied
+
+    @staticmethod
+    def _new_fills(page: List[Dict[str, Any]], cursor: Dict[str, Any]) -> List[Dict[str, Any]]:
+        seen = set(cursor['last_ids'])
+        fills = [
+            fill for fill in page
+            if fill['timestamp'] > cursor['last_ts']
+            or (fill['timestamp'] == cursor['last_ts'] and str(fill['id']) not in seen)
+        ]
+        return sorted(fills, key=lambda fill: fill['timestamp'])
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return
+        self.cursors = {s: item['cursor'] for s, item in state.get('symbols', {}).items()}
+        self.stats = {s: FillStats.from_dict(item['stats']) for s, item in state.get('symbols', {}).items()}
+        self.synced_at = state.get('synced_at', {})
+
+    def _save(self):
+        state = {
+            'symbols': {
+                symbol: {'cursor': self.cursors[symbol], 'stats': self.stats[symbol].to_dict()}
+                for symbol in self.cursors
+            },
+            'synced_at': self.synced_at,
+        }
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(state, file)
+        os.replace(tmp_path, self.path)
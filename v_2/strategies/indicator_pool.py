@@ -0,0 +1,169 @@
+"""
+배치 지표 계산 서비스
+여러 (심볼, 시간단위) 캔들 데이터의 기술적 지표를 프로세스 풀에서 병렬 계산
+
+# 주요 기능:
+- 입력/출력 공유
+  - 모든 캔들 컬럼을 하나의 공유 메모리 블록에 적재
+  - 워커는 복사 없이 입력을 읽고 출력 블록에 직접 기록
+
+- 작업 분배
+  - 행 수 기준으로 균등하게 워커별 샤드 구성
+  - 작은 배치는 현재 프로세스에서 바로 계산 (풀 오버헤드 회피)
+
+- 결과
+  - (심볼, 시간단위)별 지표 DataFrame (add_all_indicators()와 동일한 컬럼)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .technical_indicators import TechnicalAnalysis
+
+INPUT_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+OUTPUT_COLUMNS = (
+    'SMA_20', 'EMA_20', 'MACD', 'MACD_Signal', 'MACD_Hist',
+    'RSI', 'Stoch_K', 'Stoch_D', 'BB_Upper', 'BB_Lower', 'ATR'
+)
+
+
+def _compute_block(inputs: np.ndarray, outputs: np.ndarray, tasks: List[Tuple[int, int]]):
+    """입력 블록의 각 구간 (시작, 길이)에 대해 지표를 계산해 출력 블록에 기록"""
+    for start, length in tasks:
+        end = start + length
+        df = pd.DataFrame({col: inputs[i, start:end] for i, col in enumerate(INPUT_COLUMNS)})
+        result = TechnicalAnalysis(df).add_all_indicators()
+        for j, col in enumerate(OUTPUT_COLUMNS):
+            outputs[j, start:end] = result[col].to_numpy()
+
+
+def _compute_shard(input_name: str, output_name: str, total_rows: int,
+                   tasks: List[Tuple[int, int]]) -> int:
+    """워커 프로세스 진입점: 공유 메모리에 연결하여 샤드 계산"""
+    input_shm = shared_memory.SharedMemory(name=input_name)
+    output_shm = shared_memory.SharedMemory(name=output_name)
+    try:
+        inputs = np.ndarray((len(INPUT_COLUMNS), total_rows), dtype=np.float64, buffer=input_shm.buf)
+        outputs = np.ndarray((len(OUTPUT_COLUMNS), total_rows), dtype=np.float64, buffer=output_shm.buf)
+        _compute_block(inputs, outputs, tasks)
+        del inputs, outputs  # 공유 메모리 해제 전에 버퍼 참조 제거
+    finally:
+        input_shm.close()
+        output_shm.close()
+    return len(tasks)
+
+
+class IndicatorBatchService:
+    def __init__(self, workers: Optional[int] = None, min_parallel_rows: int = 20000):
+        """
+        배치 지표 계산 서비스 초기화
+
+        Args:
+            workers (int, optional): 워커 프로세스 수 (기본: CPU 코어 수)
+            min_parallel_rows (int): 이보다 적은 총 행 수는 현재 프로세스에서 계산
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.min_parallel_rows = min_parallel_rows
+        self._executor = None
+
+    def compute(self, candles: Dict[Hashable, pd.DataFrame]) -> Dict[Hashable, pd.DataFrame]:
+        """
+        여러 캔들 데이터의 지표를 한 번에 계산
+
+        Args:
+            candles (dict): {(symbol, timeframe): OHLCV DataFrame}
+
+        Returns:
+            dict: {(symbol, timeframe): OHLCV + 지표 DataFrame}
+        """
+        keys = [key for key, df in candles.items() if len(df)]
+        lengths = [len(candles[key]) for key in keys]
+        total_rows = sum(lengths)
+        if total_rows == 0:
+            return {}
+
+        starts = np.concatenate([[0], np.cumsum(lengths)[:-1]]).astype(int)
+        tasks = list(zip(starts.tolist(), lengths))
+
+        if self.workers == 1 or total_rows < self.min_parallel_rows or len(keys) == 1:
+            inputs = self._pack(candles, keys, np.empty((len(INPUT_COLUMNS), total_rows)))
+            outputs = np.empty((len(OUTPUT_COLUMNS), total_rows))
+            _compute_block(inputs, outputs, tasks)
+            return self._unpack(candles, keys, tasks, outputs)
+
+        input_shm = shared_memory.SharedMemory(create=True, size=len(INPUT_COLUMNS) * total_rows * 8)
+        output_shm = shared_memory.SharedMemory(create=True, size=len(OUTPUT_COLUMNS) * total_rows * 8)
+        try:
+            inputs = np.ndarray((len(INPUT_COLUMNS), total_rows), dtype=np.float64, buffer=input_shm.buf)
+            outputs = np.ndarray((len(OUTPUT_COLUMNS), total_rows), dtype=np.float64, buffer=output_shm.buf)
+            self._pack(candles, keys, inputs)
+
+            futures = [
+                self._pool().submit(_compute_shard, input_shm.name, output_shm.name, total_rows, shard)
+                for shard in self._shard(tasks)
+            ]
+            for future in futures:
+                future.result()
+
+            # 공유 메모리를 해제하기 전에 결과를 복사
+            results = self._unpack(candles, keys, tasks, outputs.copy())
+            del inputs, outputs
+            return results
+        finally:
+            input_shm.close()
+            input_shm.unlink()
+            output_shm.close()
+            output_shm.unlink()
+
+    def close(self):
+        """워커 프로세스 종료"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _shard(self, tasks: List[Tuple[int, int]]) -> List[List[Tuple[int, int]]]:
+        """행 수가 큰 작업부터 가장 가벼운 샤드에 배정"""
+        shards = [[] for _ in range(min(self.workers, len(tasks)))]
+        loads = [0] * len(shards)
+        for task in sorted(tasks, key=lambda t: t[1], reverse=True):
+            lightest = loads.index(min(loads))
+            shards[lightest].append(task)
+            loads[lightest] += task[1]
+        return shards
+
+    @staticmethod
+    def _pack(candles, keys, inputs: np.ndarray) -> np.ndarray:
+        position = 0
+        for key in keys:
+            df = candles[key]
+            for i, col in enumerate(INPUT_COLUMNS):
+                inputs[i, position:position + len(df)] = df[col].to_numpy(dtype=np.float64)
+            position += len(df)
+        return inputs
+
+    @staticmethod
+    def _unpack(candles, keys, tasks, outputs: np.ndarray) -> Dict[Hashable, pd.DataFrame]:
+        results = {}
+        for key, (start, length) in zip(keys, tasks):
+            indicators = pd.DataFrame(
+                {col: outputs[j, start:start + length] for j, col in enumerate(OUTPUT_COLUMNS)},
+                index=candles[key].index
+            )
+            results[key] = pd.concat([candles[key][list(INPUT_COLUMNS)], indicators], axis=1)
+        return results
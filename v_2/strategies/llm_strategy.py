@@ -7,13 +7,24 @@ LLM 기반 거래 전략 클래스
 2. 매매 신호 검증
 3. 거래 실행 결정
 4. 리스크 관리
+5. 이벤트 기반 LLM 호출 (트리거 엔진 사용 시)
+6. 틱 시간 예산 내 LLM 응답 대기, 초과/장애/작업자 포화 시 규칙 기반 결정으로 대체
+7. 단계별 실행 (evaluate → decide → act, 파이프라인 작업자가 나눠 실행)
 """
+from concurrent.futures import TimeoutError as FuturesTimeout
+
 from models.llm_interface import LLMAnalyzer
 from models.strategy_generator import StrategyGenerator
+from utils.deadline import BoundedExecutor, CircuitBreaker, ExecutorBusy
+from utils.metrics import metrics
 from .technical_indicators import TechnicalAnalysis
 
 class LLMStrategy:
-    def __init__(self, api_key: str, client, llm_provider: str = "groq"):
+    def __init__(self, api_key: str, client, llm_provider: str = "groq",
+                 trigger=None, trade_amount: float = 0.0, compact: bool = False,
+                 cassette=None, memory=None, breaker=None,
+                 llm_timeout: float = 30.0, min_llm_seconds: float = 1.0,
+                 symbol: str = 'BTC/USDT', executor=None):
         """
         LLM 전략 초기화
         
@@ -21,85 +32,224 @@ class LLMStrategy:
             api_key: LLM API 키
             client: 거래소 클라이언트
             llm_provider: 사용할 LLM 제공자
+            trigger: TriggerEngine (None이면 매 틱 LLM 호출)
+            trade_amount: LLM 미호출 틱의 규칙 기반 매매 거래량
+            compact: True이면 float32 컴팩트 모드로 지표 계산 (chart_data는 읽기 전용 IndicatorFrame)
+            cassette: LLMCassette (LLM 호출 기록/재생, 백테스트용)
+            memory: AnalysisMemory (유사 상태의 과거 LLM 분석 재사용)
+            breaker: CircuitBreaker (제공자 장애 시 LLM 호출 건너뜀, 기본값 사용)
+            llm_timeout: 틱 예산과 별개로 LLM 응답을 기다리는 최대 시간 (초)
+            min_llm_seconds: 남은 틱 예산이 이보다 적으면 LLM을 호출하지 않음 (초)
+            symbol: 주문할 거래 페어
+            executor: BoundedExecutor (LLM 호출 실행기, 기본: 작업자 2개)
         """
         self.api_key = api_key
-        self.analyzer = LLMAnalyzer(api_key, provider=llm_provider)
+        self.analyzer = LLMAnalyzer(api_key, provider=llm_provider, cassette=cassette,
+                                    memory=memory)
         self.generator = StrategyGenerator()
         self.client = client
         self.technical_analysis = None
+        self.trigger = trigger
+        self.trade_amount = trade_amount
+        self.compact = compact
+        self.breaker = breaker or CircuitBreaker()
+        self.llm_timeout = llm_timeout
+        self.min_llm_seconds = min_llm_seconds
+        self.symbol = symbol
+        # 응답 없는 호출이 거래 루프를 붙잡지 않도록 별도 스레드에서 실행
+        # (멈춘 호출이 작업자를 모두 점유하면 대기열에 쌓지 않고 'busy'로 대체)
+        self._llm_executor = executor if executor is not None else BoundedExecutor()
+        self.last_triggers = []  # 마지막 틱의 트리거 사유
+        self.last_fallback = None  # 마지막 틱에서 LLM 대신 규칙 기반 결정을 쓴 사유
+        self.last_analysis = None  # 마지막 틱의 분석 결과
+        self.last_decision = None  # 마지막 틱의 매매 결정
 
-    def analyze_market(self, market_data):
+    def analyze_market(self, market_data, use_llm: bool = True):
         """
         시장 데이터 종합 분석
         
         Args:
             market_data (pd.DataFrame): OHLCV 데이터
+            use_llm (bool): False이면 기술적 분석만 수행
             
         Returns:
             Dict: {
-                'llm_analysis': str,      # LLM 분석 결과
+                'llm_analysis': str,      # LLM 분석 결과 (use_llm=False이면 None)
                 'technical_analysis': Dict,  # 기술적 분석 결과
                 'chart_data': pd.DataFrame  # 차트 데이터
             }
         """
         # 기술적 분석 수행
-        self.technical_analysis = TechnicalAnalysis(market_data)
-        analysis_result = self.technical_analysis.analyze_rsi_macd()
+        with metrics.span('indicators'):
+            self.technical_analysis = TechnicalAnalysis(market_data, compact=self.compact)
+            analysis_result = self.technical_analysis.analyze_rsi_macd()
+        
+        if not use_llm:
+            return {
+                'llm_analysis': None,
+                'technical_analysis': analysis_result,
+                'chart_data': analysis_result['historical_data']
+            }
         
+        return self._analyze_with_llm(market_data, analysis_result)
+
+    def _analyze_with_llm(self, market_data, analysis_result, timeout: float = None):
+        """
+        기술적 분석 결과를 바탕으로 LLM 분석 요청
+        
+        Raises:
+            concurrent.futures.TimeoutError: timeout(초) 안에 응답이 없을 때
+            ExecutorBusy: 이전 호출들이 작업자를 모두 점유하고 있을 때
+        """
         # LLM 분석 요청
-        prompt = self.analyzer.generate_analysis_prompt(
-            market_data=market_data,
-            analysis_result=analysis_result
-        )
+        with metrics.span('prompt'):
+            prompt = self.analyzer.generate_analysis_prompt(
+                market_data=market_data,
+                analysis_result=analysis_result
+            )
         
         # LLM 응답 처리
-        analysis = self.analyzer.get_analysis(prompt)
+        with metrics.span('llm'):
+            future = self._llm_executor.submit(self.analyzer.analyze, prompt, analysis_result)
+            try:
+                analysis, similarity = future.result(timeout=timeout)
+            except FuturesTimeout:
+                future.cancel()
+                raise
+        if similarity is None:
+            metrics.inc('llm_calls_total')
+        else:
+            metrics.inc('llm_reused_total')
         
         # 분석 결과와 차트 데이터 함께 반환
         return {
             'llm_analysis': analysis,
             'technical_analysis': analysis_result,
-            'chart_data': analysis_result['historical_data']
+            'chart_data': analysis_result['historical_data'],
+            'similarity': similarity  # 과거 분석 재사용 시 유사도
         }
 
-    def execute(self, market_data):
+    def execute(self, market_data, budget=None):
         """
         시장 데이터 분석 및 거래 실행
         
         Process:
-        1. 시장 데이터 LLM 분석 요청
-        2. 분석 결과를 거래 신호로 변환
-        3. 거래 실행 및 모니터링
+        1. 기술적 분석 후 트리거 평가
+        2. 트리거 발생 시 LLM 분석, 아니면 규칙 기반 결정
+        3. 분석 결과를 거래 신호로 변환
+        4. 거래 실행 및 모니터링
         
         Args:
             market_data (dict): 현재 시장 데이터
                 - price: 현재가
                 - volume: 거래량
                 - bid/ask: 호가 정보
+            budget (TickBudget, optional): 틱 시간 예산 (LLM 대기 시간 제한)
                 
         Returns:
             dict: 실행된 주문 정보 또는 None
         """
-        # 시장 분석 수행
-        analysis_result = self.analyze_market(market_data)
+        analysis_result, triggers = self.evaluate(market_data)
+        strategy, analysis_result = self.decide(market_data, analysis_result, triggers, budget)
+        return self.act(strategy, analysis_result)
+
+    def evaluate(self, market_data):
+        """
+        1단계: 기술적 분석 후 트리거 평가
         
-        # 전략 생성
-        strategy = self.generator.parse_strategy(analysis_result['llm_analysis'])
+        Returns:
+            tuple: (analyze_market(use_llm=False) 결과, 트리거 사유 목록)
+        """
+        analysis_result = self.analyze_market(market_data, use_llm=False)
+        # 트리거 엔진이 없으면 항상 LLM 호출
+        triggers = self.trigger.evaluate(analysis_result['technical_analysis']) if self.trigger else ['always']
+        return analysis_result, triggers
+
+    def decide(self, market_data, analysis_result, triggers, budget=None):
+        """
+        2단계: 트리거 발생 시 LLM 분석, 아니면 규칙 기반 결정 (last_* 갱신)
         
+        Returns:
+            tuple: (매매 전략, LLM 분석이 포함된 분석 결과)
+        """
+        technical = analysis_result['technical_analysis']
+        self.last_triggers = triggers
+        self.last_fallback = None
+        if self.last_triggers:
+            self.last_fallback = self._llm_unavailable(budget)
+            if self.last_fallback is None:
+                try:
+                    analysis_result = self._analyze_with_llm(
+                        market_data, technical, timeout=self._llm_wait(budget)
+                    )
+                    self.breaker.record_success()
+                except ExecutorBusy:
+                    # 제공자 응답을 받지 못한 것이 아니므로 차단기 실패로 세지 않고 시험 호출 기회 반납
+                    self.breaker.release()
+                    self.last_fallback = 'busy'
+                except FuturesTimeout:
+                    self.breaker.record_failure()
+                    self.last_fallback = 'timeout'
+                except Exception as e:
+                    self.breaker.record_failure()
+                    self.last_fallback = 'error'
+                    print(f"LLM 분석 실패: {e}")
+
+        if self.last_triggers and self.last_fallback is None:
+            # LLM 분석 후 전략 생성
+            with metrics.span('parse'):
+                strategy = self.generator.parse_strategy(analysis_result['llm_analysis'])
+        elif self.last_triggers:
+            metrics.inc('llm_fallback_total', reason=self.last_fallback)
+            # LLM을 쓸 수 없는 틱은 규칙 기반으로 결정 (조건 미충족 시 보류)
+            strategy = self.generator.generate_from_signals(
+                technical['signals'], self.trade_amount
+            )
+        else:
+            metrics.inc('llm_skipped_total')
+            # 이벤트가 없는 틱은 규칙 기반으로 결정
+            strategy = self.generator.generate_from_signals(
+                technical['signals'], self.trade_amount
+            )
+        self.last_analysis = analysis_result
+        self.last_decision = strategy
+        return strategy, analysis_result
+
+    def act(self, strategy, analysis_result):
+        """
+        3단계: 시그널 검증 후 주문 실행
+        
+        Returns:
+            dict: 실행된 주문 정보 또는 None
+        """
         # 기술적 시그널과 LLM 분석이 일치하는지 검증
         if not self._validate_signals(strategy, analysis_result['technical_analysis']):
             print("기술적 시그널과 LLM 분석이 일치하지 않아 매매 보류")
             return None
 
         # 매매 신호에 따른 주문 실행
-        if strategy["action"] == "buy":
-            print(f"매수 실행: {strategy['amount']} BTC")
-            return self.client.place_order('BTC/USDT', 'buy', strategy['amount'])
-        elif strategy["action"] == "sell":
-            print(f"매도 실행: {strategy['amount']} BTC")
-            return self.client.place_order('BTC/USDT', 'sell', strategy['amount'])
+        if strategy["action"] in ("buy", "sell"):
+            print(f"{'매수' if strategy['action'] == 'buy' else '매도'} 실행: {strategy['amount']} {self.symbol}")
+            with metrics.span('order'):
+                order = self.client.place_order(self.symbol, strategy['action'], strategy['amount'])
+            metrics.inc('orders_total', side=strategy['action'])
+            return order
         return None
 
+    def _llm_unavailable(self, budget):
+        """LLM을 호출하지 않을 사유 (호출 가능하면 None)"""
+        if budget is not None and budget.remaining() < self.min_llm_seconds:
+            return 'budget'
+        if not self.breaker.allow():
+            return 'circuit_open'
+        return None
+
+    def _llm_wait(self, budget) -> float:
+        """LLM 응답을 기다릴 시간 (초)"""
+        if budget is None:
+            return self.llm_timeout
+        return min(self.llm_timeout, budget.remaining())
+
     def _validate_signals(self, strategy, technical_signals):
         """
         LLM 전략과 기술적 시그널의 일치성 검증
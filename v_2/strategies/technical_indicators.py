@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import ta
 import pandas_ta as pta
@@ -12,10 +13,72 @@ RSI, MACD 등 기술적 지표를 계산하고 매매 시그널을 생성
 2. MACD (이동평균수렴확산) 계산
 3. 매매 시그널 생성
 4. 트렌드 분석
+5. 컴팩트 모드 (float32 컬럼 배열, 원본 DataFrame 미변경, 읽기 전용 결과)
 """
 
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+class IndicatorFrame:
+    """
+    float32 컬럼 배열 기반의 경량 지표 저장소
+    
+    DataFrame처럼 frame['RSI'], frame.index로 접근하며,
+    컬럼 조회는 배열을 복사하지 않는 Series 뷰를 반환
+    """
+
+    def __init__(self, index, arrays, readonly: bool = False):
+        self.index = index
+        self.readonly = readonly
+        self._arrays = {}
+        for name, values in arrays.items():
+            self._store(name, values)
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> 'IndicatorFrame':
+        """OHLCV 컬럼만 float32 배열로 추출 (원본 DataFrame/CandleBatch는 변경하지 않음)"""
+        return cls(df.index, {col: df[col] for col in OHLCV_COLUMNS if col in df})
+
+    def _store(self, name, values):
+        array = np.asarray(values, dtype=np.float32)
+        if self.readonly:
+            array = array.view()
+            array.flags.writeable = False
+        self._arrays[name] = array
+
+    def __getitem__(self, name) -> pd.Series:
+        return pd.Series(self._arrays[name], index=self.index, name=name, copy=False)
+
+    def __setitem__(self, name, values):
+        if self.readonly:
+            raise TypeError("읽기 전용 지표 데이터는 수정할 수 없습니다")
+        self._store(name, values)
+
+    def __contains__(self, name) -> bool:
+        return name in self._arrays
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def columns(self):
+        return list(self._arrays)
+
+    @property
+    def nbytes(self) -> int:
+        """컬럼 배열이 차지하는 메모리 (인덱스 제외)"""
+        return sum(array.nbytes for array in self._arrays.values())
+
+    def readonly_view(self) -> 'IndicatorFrame':
+        """배열을 공유하는 읽기 전용 뷰"""
+        return IndicatorFrame(self.index, self._arrays, readonly=True)
+
+    def to_frame(self) -> pd.DataFrame:
+        """필요할 때만 DataFrame으로 변환 (복사 발생)"""
+        return pd.DataFrame(self._arrays, index=self.index)
+
 class TechnicalAnalysis:
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, compact: bool = False):
         """
         기술적 분석 클래스 초기화
         
@@ -27,8 +90,15 @@ class TechnicalAnalysis:
                 - low: 저가
                 - close: 종가
                 - volume: 거래량
+                (utils.candles.CandleBatch도 허용)
+            compact (bool): True이면 원본을 변경하지 않고 float32 IndicatorFrame에
+                지표를 저장하며, 결과로 읽기 전용 뷰를 반환
         """
-        self.df = df
+        self.compact = compact
+        if compact:
+            self.df = IndicatorFrame.from_dataframe(df)
+        else:
+            self.df = df if isinstance(df, pd.DataFrame) else df.to_frame()
         
     def analyze_rsi_macd(self, timeframe: str = '1h') -> Dict[str, Any]:
         """
@@ -95,15 +165,19 @@ class TechnicalAnalysis:
             
         return {
             'timestamp': self.df.index[-1],
-            'current_price': self.df['close'].iloc[-1],
-            'rsi': current_rsi,
-            'macd': current_macd,
-            'macd_signal': current_signal,
-            'macd_hist': current_hist,
+            'current_price': float(self.df['close'].iloc[-1]),
+            'rsi': float(current_rsi),
+            'macd': float(current_macd),
+            'macd_signal': float(current_signal),
+            'macd_hist': float(current_hist),
             'signals': signals,
             'trend': self._analyze_trend(),
-            'historical_data': self.df  # 시각화를 위한 전체 데이터 추가
+            'historical_data': self._result_data()  # 시각화를 위한 전체 데이터 추가
         }
+
+    def _result_data(self):
+        """컴팩트 모드는 읽기 전용 뷰, 기존 모드는 DataFrame 그대로 반환"""
+        return self.df.readonly_view() if self.compact else self.df
     
     def _analyze_trend(self) -> Dict[str, str]:
         """
@@ -142,7 +216,7 @@ class TechnicalAnalysis:
         self.add_bollinger_bands()
         self.add_atr()
         
-        return self.df
+        return self._result_data()
     
     def add_moving_averages(self):
         self.df['SMA_20'] = ta.trend.sma_indicator(self.df['close'], window=20)
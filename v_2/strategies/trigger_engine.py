@@ -0,0 +1,120 @@
+"""
+LLM 호출 트리거 엔진
+기술적 분석 결과의 변화를 감지하여 LLM 분석이 필요한 시점을 결정
+
+# 주요 기능:
+- 이벤트 감지
+  - 시그널 집합 변화
+  - RSI 구간 이동 (과매도/중립/과매수)
+  - MACD 히스토그램 부호 전환
+  - 변동성 급등
+
+- 호출 제어
+  - 이벤트가 없는 틱은 LLM 호출 생략
+  - 최대 생략 틱 수 초과 시 강제 호출 (하트비트)
+"""
+
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+
+class TriggerEngine:
+    def __init__(self, rsi_lower: float = 30, rsi_upper: float = 70,
+                 volatility_window: int = 20, volatility_threshold: float = 2.5,
+                 max_skip_ticks: int = 12):
+        """
+        트리거 엔진 초기화
+
+        Args:
+            rsi_lower (float): RSI 과매도 기준선
+            rsi_upper (float): RSI 과매수 기준선
+            volatility_window (int): 변동성 계산에 사용할 수익률 개수
+            volatility_threshold (float): 최근 수익률이 표준편차의 몇 배를 넘으면 급등으로 볼지
+            max_skip_ticks (int): 이벤트가 없어도 LLM을 호출하기까지의 최대 틱 수 (0이면 비활성)
+        """
+        self.rsi_lower = rsi_lower
+        self.rsi_upper = rsi_upper
+        self.volatility_window = volatility_window
+        self.volatility_threshold = volatility_threshold
+        self.max_skip_ticks = max_skip_ticks
+
+        self.last_state = None  # 마지막으로 평가한 상태
+        self.skipped_ticks = 0  # 마지막 LLM 호출 이후 생략된 틱 수
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> 'TriggerEngine':
+        """config['trading']['trigger'] 설정으로 엔진 생성"""
+        return cls(**(config or {}))
+
+    def evaluate(self, analysis_result: Dict[str, Any]) -> List[str]:
+        """
+        이번 틱에서 LLM 분석이 필요한지 평가
+
+        Args:
+            analysis_result (dict): TechnicalAnalysis.analyze_rsi_macd() 결과
+
+        Returns:
+            list: 발생한 트리거 사유 목록 (비어 있으면 LLM 호출 불필요)
+        """
+        state = self._extract_state(analysis_result)
+        reasons = []
+
+        if self.last_state is None:
+            reasons.append('initial')
+        else:
+            if state['signals'] != self.last_state['signals']:
+                reasons.append('signal_change')
+            if state['rsi_band'] != self.last_state['rsi_band']:
+                reasons.append('rsi_band_cross')
+            if state['hist_sign'] != self.last_state['hist_sign']:
+                reasons.append('macd_hist_flip')
+
+        if state['volatility_spike']:
+            reasons.append('volatility_spike')
+
+        if not reasons and self.max_skip_ticks and self.skipped_ticks >= self.max_skip_ticks:
+            reasons.append('heartbeat')
+
+        self.last_state = state
+        self.skipped_ticks = 0 if reasons else self.skipped_ticks + 1
+        return reasons
+
+    def reset(self):
+        """상태 초기화 (다음 평가는 항상 트리거)"""
+        self.last_state = None
+        self.skipped_ticks = 0
+
+    def _extract_state(self, analysis_result: Dict[str, Any]) -> Dict[str, Any]:
+        """트리거 판단에 필요한 최소 상태만 추출"""
+        rsi = analysis_result['rsi']
+        if rsi < self.rsi_lower:
+            rsi_band = 'oversold'
+        elif rsi > self.rsi_upper:
+            rsi_band = 'overbought'
+        else:
+            rsi_band = 'neutral'
+
+        return {
+            'signals': frozenset(
+                (s['indicator'], s['action']) for s in analysis_result['signals']
+            ),
+            'rsi_band': rsi_band,
+            'hist_sign': int(np.sign(analysis_result['macd_hist'])),
+            'volatility_spike': self._is_volatility_spike(
+                analysis_result.get('historical_data')
+            ),
+        }
+
+    def _is_volatility_spike(self, df) -> bool:
+        """최근 수익률이 직전 구간 평균에서 표준편차의 임계 배수 이상 벗어났는지 확인"""
+        if df is None or len(df) < self.volatility_window + 2:
+            return False
+
+        close = df['close'].to_numpy(dtype=float)[-(self.volatility_window + 2):]
+        returns = np.diff(close) / close[:-1]
+        baseline = returns[:-1]
+        std = baseline.std()
+        if std < 1e-12:
+            return False
+        return bool(abs(returns[-1] - baseline.mean()) > self.volatility_threshold * std)
@@ -0,0 +1,99 @@
+"""
+컴팩트 캔들 컨테이너
+ccxt의 OHLCV 응답(list of lists)을 연속 메모리 배열로 바로 적재
+
+# 주요 기능:
+- 적재
+  - 타임스탬프: int64 (ms) 연속 배열
+  - 시가/고가/저가/종가/거래량: 컬럼별 연속 float64 배열
+  - 파이썬 객체/DataFrame 생성 없이 한 번에 변환
+
+- 조회
+  - batch['close'], batch.index 등 DataFrame과 같은 방식으로 접근
+  - 필요할 때만 DataFrame으로 변환 (to_frame)
+
+- 병합
+  - 새로 받은 캔들로 진행 중인 마지막 캔들 교체 및 추가
+  - 진행 중인 마지막 캔들 제외 (closed)
+"""
+
+from typing import List, Sequence
+
+import numpy as np
+import pandas as pd
+
+CANDLE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+class CandleBatch:
+    __slots__ = ('ts', 'values')
+
+    def __init__(self, ts: np.ndarray, values: np.ndarray):
+        """
+        캔들 배치 초기화
+
+        Args:
+            ts (np.ndarray): 캔들 시작 시각 (ms, int64)
+            values (np.ndarray): (5, N) float64 배열 - CANDLE_COLUMNS 순서
+        """
+        self.ts = ts
+        self.values = values
+
+    @classmethod
+    def from_ccxt(cls, ohlcv: Sequence[List[float]]) -> 'CandleBatch':
+        """ccxt fetch_ohlcv 응답 [[timestamp, open, high, low, close, volume], ...]을 변환"""
+        raw = np.asarray(ohlcv, dtype=np.float64).reshape(-1, 6)
+        ts = raw[:, 0].astype(np.int64)  # ms 타임스탬프는 float64로 정확히 표현됨
+        values = np.ascontiguousarray(raw[:, 1:].T)
+        return cls(ts, values)
+
+    @classmethod
+    def empty(cls) -> 'CandleBatch':
+        return cls(np.empty(0, dtype=np.int64), np.empty((len(CANDLE_COLUMNS), 0)))
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def __contains__(self, name) -> bool:
+        return name in CANDLE_COLUMNS
+
+    def __getitem__(self, name) -> np.ndarray:
+        """컬럼 배열 (복사 없는 뷰)"""
+        return self.values[CANDLE_COLUMNS.index(name)]
+
+    @property
+    def columns(self):
+        return list(CANDLE_COLUMNS)
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        """시간 인덱스 (문자열 파싱 없이 정수 배열에서 바로 생성)"""
+        return pd.DatetimeIndex(self.ts.astype('datetime64[ms]'), name='timestamp')
+
+    def tail(self, n: int) -> 'CandleBatch':
+        return CandleBatch(self.ts[-n:], self.values[:, -n:])
+
+    def closed(self) -> 'CandleBatch':
+        """진행 중인 마지막 캔들을 뺀 확정 캔들 (캔들 경계 직후 조회한 배치용)"""
+        return CandleBatch(self.ts[:-1], self.values[:, :-1])
+
+    def merge(self, newer: 'CandleBatch') -> 'CandleBatch':
+        """
+        새 캔들 병합
+
+        newer의 첫 캔들 이후 구간은 newer 값으로 교체 (진행 중이던 캔들 갱신)
+        """
+        if not len(newer):
+            return self
+        keep = np.searchsorted(self.ts, newer.ts[0])
+        return CandleBatch(
+            np.concatenate([self.ts[:keep], newer.ts]),
+            np.concatenate([self.values[:, :keep], newer.values], axis=1)
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """OHLCV DataFrame으로 변환 (timestamp 인덱스)"""
+        return pd.DataFrame(
+            {col: self.values[i] for i, col in enumerate(CANDLE_COLUMNS)},
+            index=self.index
+        )
@@ -0,0 +1,193 @@
+"""
+설정 서비스
+utils/config.yaml을 한 번만 파싱하여 검증된 설정을 모든 컴포넌트에 제공
+
+# 주요 기능:
+- 설정 로드
+  - 파싱/검증 결과 캐시 (재실행마다 YAML 파싱하지 않음)
+  - 필수 항목 확인 및 숫자 타입 변환
+
+- 핫 리로드
+  - 백그라운드 스레드가 파일 변경(mtime) 감시
+  - 변경 시 구독 콜백으로 새 설정 전달 (실행 중인 봇 포함)
+
+- 설정 저장
+  - 검증 후 임시 파일에 기록하고 원자적으로 교체
+"""
+
+import copy
+import logging
+import os
+import stat
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+import yaml
+
+CONFIG_PATH = 'utils/config.yaml'
+
+# (섹션, 키) -> 타입 : 검증 및 변환 대상
+TYPED_KEYS = {
+    ('trading', 'interval'): int,
+    ('trading', 'min_amount'): float,
+    ('trading', 'max_amount'): float,
+    ('trading', 'symbol'): str,
+    ('llm', 'temperature'): float,
+    ('llm', 'max_tokens'): int,
+}
+REQUIRED_SECTIONS = ('binance', 'groq', 'openai', 'llm', 'trading')
+
+logger = logging.getLogger(__name__)
+
+
+def validate_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    설정 검증 및 타입 변환
+
+    Raises:
+        ValueError: 필수 섹션이 없거나 값의 타입을 변환할 수 없을 때
+    """
+    if not isinstance(config, dict):
+        raise ValueError("설정 파일 최상위는 매핑이어야 합니다")
+
+    for section in REQUIRED_SECTIONS:
+        if not isinstance(config.get(section), dict):
+            raise ValueError(f"설정 섹션 누락: {section}")
+
+    for (section, key), cast in TYPED_KEYS.items():
+        if key not in config[section]:
+            raise ValueError(f"설정 항목 누락: {section}.{key}")
+        try:
+            config[section][key] = cast(config[section][key])
+        except (TypeError, ValueError):
+            raise ValueError(f"설정 값 타입 오류: {section}.{key}={config[section][key]!r}")
+
+    if config['trading']['min_amount'] > config['trading']['max_amount']:
+        raise ValueError("trading.min_amount는 max_amount보다 클 수 없습니다")
+    return config
+
+
+class ConfigService:
+    def __init__(self, path: str = CONFIG_PATH, poll_interval: float = 1.0):
+        """
+        설정 서비스 초기화
+
+        Args:
+            path (str): 설정 파일 경로
+            poll_interval (float): 파일 변경 감시 주기 (초)
+        """
+        self.path = path
+        self.poll_interval = poll_interval
+        self._config = None
+        self._mtime = None
+        self._lock = threading.Lock()
+        self._subscribers: List[Callable[[Dict[str, Any]], None]] = []
+        self._watcher = None
+
+    def get(self) -> Dict[str, Any]:
+        """
+        현재 설정 반환 (호출 측이 수정해도 캐시에 영향 없도록 복사본)
+        """
+        with self._lock:
+            if self._config is None:
+                self._reload()
+            self._start_watcher()
+            return copy.deepcopy(self._config)
+
+    def save(self, config: Dict[str, Any]):
+        """
+        설정 검증 후 원자적으로 저장
+
+        같은 디렉토리의 임시 파일에 기록한 뒤 os.replace로 교체하므로
+        다른 프로세스가 쓰다 만 파일을 읽는 일이 없음
+        """
+        config = validate_config(copy.deepcopy(config))
+        directory = os.path.dirname(self.path) or '.'
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.config.', suffix='.yaml')
+        try:
+            with os.fdopen(fd, 'w') as file:
+                yaml.dump(config, file)
+                file.flush()
+                os.fsync(file.fileno())
+            # mkstemp는 0600으로 만들므로 기존 파일 권한 유지
+            if os.path.exists(self.path):
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(self.path).st_mode))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            changed = self._reload()
+        if changed:
+            self._notify()
+
+    def subscribe(self, callback: Callable[[Dict[str, Any]], None]):
+        """설정이 바뀔 때 새 설정을 받을 콜백 등록"""
+        self._subscribers.append(callback)
+        self.get()  # 감시 스레드 시작
+
+    def _reload(self) -> bool:
+        """파일이 바뀌었으면 다시 읽기 (잘못된 설정이면 기존 설정 유지)"""
+        mtime = os.stat(self.path).st_mtime_ns
+        if mtime == self._mtime:
+            return False
+
+        try:
+            with open(self.path, 'r') as file:
+                config = yaml.safe_load(file)
+            config = validate_config(config)
+        except (yaml.YAMLError, ValueError) as e:
+            if self._config is None:
+                raise
+            # 같은 파일을 매 poll_interval마다 다시 읽지 않도록 mtime 기록
+            logger.error(f"설정 변경 무시 (파싱/검증 실패): {e}")
+            self._mtime = mtime
+            return False
+
+        self._config = config
+        self._mtime = mtime
+        return True
+
+    def _notify(self):
+        config = self.get()
+        for callback in list(self._subscribers):
+            try:
+                callback(copy.deepcopy(config))
+            except Exception as e:
+                logger.error(f"설정 변경 콜백 오류: {e}")
+
+    def _start_watcher(self):
+        if self._watcher is None:
+            self._watcher = threading.Thread(target=self._watch, daemon=True)
+            self._watcher.start()
+
+    def _watch(self):
+        while True:
+            time.sleep(self.poll_interval)
+            try:
+                with self._lock:
+                    changed = self._reload()
+            except (OSError, yaml.YAMLError) as e:
+                logger.error(f"설정 파일 읽기 실패: {e}")
+                continue
+            if changed:
+                logger.info("설정 파일 변경 감지, 새 설정 적용")
+                self._notify()
+
+
+# 프로세스 전역 설정 서비스
+config_service = ConfigService()
+
+
+def load_config() -> Dict[str, Any]:
+    """검증된 설정 반환 (캐시 사용)"""
+    return config_service.get()
+
+
+def save_config(config: Dict[str, Any]):
+    """설정 원자적 저장"""
+    config_service.save(config)
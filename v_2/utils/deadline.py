@@ -0,0 +1,183 @@
+"""
+틱 시간 예산과 회로 차단기
+느린 외부 호출(LLM 등)이 거래 루프 주기를 무너뜨리지 않도록 제한
+
+# 주요 기능:
+- 틱 예산 (TickBudget)
+  - 틱 시작 시각 기준 남은 시간 계산
+  - 수집/분석/LLM 단계가 남은 시간 안에서만 대기
+
+- 회로 차단기 (CircuitBreaker)
+  - 연속 실패(시간 초과 포함)가 임계값에 도달하면 열림 (호출 건너뜀)
+  - 대기 시간이 지나면 1회 시험 호출 허용 (half-open)
+  - 시험 호출 성공 시 닫힘, 실패 시 다시 열림
+  - 시험 호출을 하지 못하면 반납 (release, 다음 틱에 다시 시험), 결과가 오지 않으면 trial_timeout 후 새 시험 허용
+
+- 동시 호출 제한 실행기 (BoundedExecutor)
+  - 실행 중인 호출이 작업자 수만큼이면 대기열에 넣지 않고 거절 (ExecutorBusy)
+  - 시간 초과 후에도 멈춰 있는 호출이 작업자를 점유하면 이후 호출은 즉시 거절되어 대체 결정 사용
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from utils.metrics import metrics
+
+
+class ExecutorBusy(RuntimeError):
+    """모든 작업자가 실행 중이라 호출을 받을 수 없음"""
+
+
+class TickBudget:
+    def __init__(self, seconds: float, clock=time.monotonic):
+        """
+        틱 시간 예산 시작
+
+        Args:
+            seconds (float): 틱 전체에 허용할 시간 (초)
+            clock (callable): 시간 함수 (재생/테스트용으로 교체 가능)
+        """
+        self.seconds = seconds
+        self.clock = clock
+        self.started = clock()
+
+    def elapsed(self) -> float:
+        return self.clock() - self.started
+
+    def remaining(self) -> float:
+        return max(0.0, self.seconds - self.elapsed())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+
+class CircuitBreaker:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 60.0,
+                 clock=time.monotonic, trial_timeout: Optional[float] = None):
+        """
+        회로 차단기 초기화
+
+        Args:
+            failure_threshold (int): 차단기를 여는 연속 실패 횟수
+            reset_timeout (float): 열린 뒤 시험 호출까지 대기 시간 (초)
+            clock (callable): 시간 함수
+            trial_timeout (float, optional): 시험 호출 결과를 기다리는 최대 시간 (초, 기본: reset_timeout)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.trial_timeout = reset_timeout if trial_timeout is None else trial_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trial_at = 0.0  # 시험 호출을 허용한 시각
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None,
+                    clock=time.monotonic) -> 'CircuitBreaker':
+        """config['llm']['circuit_breaker'] 설정으로 생성"""
+        config = config or {}
+        return cls(
+            failure_threshold=config.get('failure_threshold', 3),
+            reset_timeout=config.get('reset_timeout', 60.0),
+            clock=clock,
+            trial_timeout=config.get('trial_timeout'),
+        )
+
+    def allow(self) -> bool:
+        """
+        호출해도 되는지 확인 (열린 상태에서 대기 시간이 지나면 시험 호출 1회 허용)
+
+        허용된 시험 호출의 결과가 trial_timeout 안에 기록되지 않으면 잃어버린 것으로 보고 새 시험 허용
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = self.clock()
+            if ((self.state == self.OPEN and now - self.opened_at >= self.reset_timeout)
+                    or (self.state == self.HALF_OPEN and now - self.trial_at >= self.trial_timeout)):
+                self.state = self.HALF_OPEN
+                self.trial_at = now
+                return True
+            return False
+
+    def release(self):
+        """허용받은 시험 호출을 하지 못했을 때 반납 (열린 상태로 되돌리고 opened_at 유지)"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = self.clock()
+
+
+class BoundedExecutor:
+    def __init__(self, max_workers: int = 2, name: str = 'llm'):
+        """
+        동시 호출 제한 실행기 초기화
+
+        future.cancel()은 이미 실행 중인 호출을 멈추지 못하므로, 응답 없는 호출이
+        작업자를 모두 점유한 상태에서 새 호출을 대기열에 쌓지 않고 바로 거절
+
+        Args:
+            max_workers (int): 작업자 수 (동시에 실행할 최대 호출 수)
+            name (str): 스레드 이름 접두사, 메트릭 라벨
+        """
+        self.max_workers = max_workers
+        self.name = name
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> 'BoundedExecutor':
+        """config['llm'] 설정으로 생성 (max_concurrency)"""
+        config = config or {}
+        return cls(max_workers=config.get('max_concurrency', 2))
+
+    @property
+    def in_flight(self) -> int:
+        """실행 중인 호출 수 (시간 초과 후 멈춰 있는 호출 포함)"""
+        return self._in_flight
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        호출 실행
+
+        Raises:
+            ExecutorBusy: 실행 중인 호출이 max_workers개일 때
+        """
+        with self._lock:
+            if self._in_flight >= self.max_workers:
+                metrics.inc('executor_rejected_total', executor=self.name)
+                raise ExecutorBusy(f"{self.name} 작업자 {self.max_workers}개 모두 실행 중")
+            self._in_flight += 1
+            metrics.set_gauge('executor_in_flight', self._in_flight, executor=self.name)
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, future):
+        with self._lock:
+            self._in_flight -= 1
+            metrics.set_gauge('executor_in_flight', self._in_flight, executor=self.name)
@@ -0,0 +1,147 @@
+"""
+과거 캔들 저장소
+(심볼, 시간단위, 월) 단위로 분할된 컬럼형 데이터셋
+
+# 구조:
+- <root>/<심볼>/<시간단위>/<YYYY-MM>.npz
+  - ts(int64, ms), open/high/low/close/volume(float64) 컬럼
+- <root>/manifest.json
+  - 파티션별 완료 여부, 행 수, 채울 수 없었던 누락 구간 (다운로드 재개용)
+
+# 주요 기능:
+- 파티션 원자적 기록 (임시 파일 후 교체)
+- 기간 조회 시 필요한 파티션만 로드하여 CandleBatch로 반환
+"""
+
+import glob
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from utils.candles import CANDLE_COLUMNS, CandleBatch
+
+DEFAULT_HISTORY_ROOT = 'data/history'
+
+
+def month_key(ts_ms: int) -> str:
+    """타임스탬프(ms)가 속한 월 파티션 이름 (UTC, YYYY-MM)"""
+    return datetime.fromtimestamp(ts_ms / 1000, tz=timezone.utc).strftime('%Y-%m')
+
+
+def month_bounds(key: str):
+    """월 파티션의 [시작, 끝) 타임스탬프(ms)"""
+    start = datetime.strptime(key, '%Y-%m').replace(tzinfo=timezone.utc)
+    if start.month == 12:
+        end = start.replace(year=start.year + 1, month=1)
+    else:
+        end = start.replace(month=start.month + 1)
+    return int(start.timestamp() * 1000), int(end.timestamp() * 1000)
+
+
+class HistoryStore:
+    def __init__(self, root: str = DEFAULT_HISTORY_ROOT):
+        """
+        과거 캔들 저장소 초기화
+
+        Args:
+            root (str): 데이터셋 루트 디렉토리
+        """
+        self.root = root
+        self.manifest_path = os.path.join(root, 'manifest.json')
+        self._lock = threading.Lock()
+        self.manifest: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, 'r') as file:
+                self.manifest = json.load(file)
+
+    def partition_dir(self, symbol: str, timeframe: str) -> str:
+        return os.path.join(self.root, symbol.replace('/', '-'), timeframe)
+
+    def partition_path(self, symbol: str, timeframe: str, key: str) -> str:
+        return os.path.join(self.partition_dir(symbol, timeframe), f'{key}.npz')
+
+    @staticmethod
+    def manifest_key(symbol: str, timeframe: str, key: str) -> str:
+        return f'{symbol}|{timeframe}|{key}'
+
+    def status(self, symbol: str, timeframe: str, key: str) -> Optional[Dict[str, Any]]:
+        """파티션 체크포인트 (없으면 None)"""
+        return self.manifest.get(self.manifest_key(symbol, timeframe, key))
+
+    def read_partition(self, symbol: str, timeframe: str, key: str) -> CandleBatch:
+        path = self.partition_path(symbol, timeframe, key)
+        if not os.path.exists(path):
+            return CandleBatch.empty()
+        with np.load(path) as data:
+            return CandleBatch(data['ts'], np.stack([data[col] for col in CANDLE_COLUMNS]))
+
+    def write_partition(self, symbol: str, timeframe: str, key: str,
+                        batch: CandleBatch, complete: bool, gaps=()):
+        """
+        파티션 기록 후 체크포인트 갱신
+
+        Args:
+            batch (CandleBatch): 파티션 전체 캔들 (시간순, 중복 없음)
+            complete (bool): 다시 받을 필요가 없는지 (지난 달이고 누락 재시도 완료)
+            gaps (list): 거래소에 데이터가 없어 채우지 못한 [시작, 끝] 구간 (ms)
+        """
+        if len(batch):
+            path = self.partition_path(symbol, timeframe, key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            columns = {col: batch[col] for col in CANDLE_COLUMNS}
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.npz.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    np.savez(file, ts=batch.ts, **columns)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+        with self._lock:
+            self.manifest[self.manifest_key(symbol, timeframe, key)] = {
+                'rows': len(batch),
+                'complete': complete,
+                'last_ts': int(batch.ts[-1]) if len(batch) else None,
+                'gaps': [list(map(int, gap)) for gap in gaps],
+            }
+            self._save_manifest()
+
+    def load(self, symbol: str, timeframe: str,
+             start_ms: Optional[int] = None, end_ms: Optional[int] = None) -> CandleBatch:
+        """
+        기간 내 캔들 조회 (해당 월 파티션만 로드)
+
+        Args:
+            start_ms (int, optional): 시작 시각 (포함)
+            end_ms (int, optional): 종료 시각 (미포함)
+        """
+        keys = sorted(
+            os.path.basename(path)[:-len('.npz')]
+            for path in glob.glob(os.path.join(self.partition_dir(symbol, timeframe), '*.npz'))
+        )
+        if start_ms is not None:
+            keys = [key for key in keys if key >= month_key(start_ms)]
+        if end_ms is not None:
+            keys = [key for key in keys if key <= month_key(end_ms - 1)]
+
+        batch = CandleBatch.empty()
+        for key in keys:
+            batch = batch.merge(self.read_partition(symbol, timeframe, key))
+
+        lo = 0 if start_ms is None else np.searchsorted(batch.ts, start_ms)
+        hi = len(batch) if end_ms is None else np.searchsorted(batch.ts, end_ms)
+        return CandleBatch(batch.ts[lo:hi], batch.values[:, lo:hi])
+
+    def _save_manifest(self):
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w') as file:
+            json.dump(self.manifest, file, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
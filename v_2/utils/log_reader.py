@@ -0,0 +1,280 @@
+"""
+로그 조회 모듈
+거래 로그 파일을 전체 읽기 없이 조회
+
+# 주요 기능:
+- 꼬리 읽기
+  - 파일 끝에서 블록 단위로 역방향 탐색
+
+- 오프셋 인덱스
+  - 사이드카 파일(<로그>.idx)에 라인별 오프셋/시간/레벨/심볼 저장
+  - 새로 추가된 부분만 증분 인덱싱
+  - 로테이션 감지 시 재생성
+  - "심볼별 최근 주문 N건", "T 이후 에러" 등 필터 조회
+
+- 증분 팔로우
+  - 마지막으로 읽은 오프셋 이후 새 라인만 반환
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+# 인덱스 레코드 형식 (라인당 24바이트)
+INDEX_DTYPE = np.dtype([
+    ('offset', '<i8'),   # 라인 시작 위치
+    ('ts', '<f8'),       # 로그 시간 (epoch 초)
+    ('level', 'u1'),     # 로그 레벨 코드
+    ('is_order', 'u1'),  # 주문 로그 여부
+    ('symbol', '<u2'),   # 심볼 번호 (0 = 없음)
+    ('pad', 'V4'),
+])
+
+LEVELS = ['', 'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+ORDER_PREFIX = '주문 실행'
+HEADER_SIZE = 64  # 로테이션 감지용으로 기록하는 파일 앞부분 길이
+BLOCK_SIZE = 8192
+
+
+def parse_line(line: str) -> Dict[str, Any]:
+    """
+    로그 한 줄 파싱
+
+    JSON 라인과 기존 '시간 - 레벨 - 메시지' 형식을 모두 지원
+    """
+    line = line.rstrip('\r\n')
+    try:
+        record = json.loads(line)
+        if isinstance(record, dict):
+            return record
+    except ValueError:
+        pass
+
+    parts = line.split(' - ', 2)
+    if len(parts) == 3:
+        return {'time': parts[0].replace(',', '.'), 'level': parts[1], 'message': parts[2]}
+    return {'time': None, 'level': '', 'message': line}
+
+
+def format_record(record: Dict[str, Any]) -> str:
+    """대시보드 표시용 한 줄 문자열"""
+    return f"{record.get('time')} - {record.get('level')} - {record.get('message')}"
+
+
+def _to_epoch(value) -> float:
+    if not value:
+        return float('nan')
+    try:
+        return datetime.fromisoformat(str(value)).timestamp()
+    except ValueError:
+        return float('nan')
+
+
+class LogReader:
+    def __init__(self, path: str, index_path: Optional[str] = None):
+        """
+        로그 조회기 초기화
+
+        Args:
+            path (str): 로그 파일 경로
+            index_path (str, optional): 사이드카 인덱스 경로 (기본 <path>.idx)
+        """
+        self.path = path
+        self.index_path = index_path or f'{path}.idx'
+        self.meta_path = f'{self.index_path}.json'
+
+        self.index = np.zeros(0, dtype=INDEX_DTYPE)
+        self.symbols: List[str] = ['']
+        self.indexed_size = 0
+        self.header = ''
+        self._load_index()
+
+    def tail(self, n: int = 10) -> List[Dict[str, Any]]:
+        """
+        파일 끝에서 역방향으로 읽어 최근 n개 라인 반환 (인덱스 미사용)
+
+        Returns:
+            list: 파싱된 로그 레코드 (오래된 순)
+        """
+        if not os.path.exists(self.path):
+            return []
+
+        with open(self.path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            buffer = b''
+            while position > 0 and buffer.count(b'\n') <= n:
+                step = min(BLOCK_SIZE, position)
+                position -= step
+                f.seek(position)
+                buffer = f.read(step) + buffer
+
+        lines = buffer.splitlines()[-n:] if n > 0 else []
+        return [parse_line(line.decode('utf-8', errors='replace')) for line in lines]
+
+    def query(self, n: Optional[int] = None, level: Optional[str] = None,
+              symbol: Optional[str] = None, orders_only: bool = False,
+              since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        인덱스 기반 필터 조회
+
+        Args:
+            n (int, optional): 최근 n건만 반환
+            level (str, optional): 이 레벨 이상만 (예: 'ERROR')
+            symbol (str, optional): 심볼 필터
+            orders_only (bool): 주문 로그만
+            since (datetime, optional): 이 시각 이후만
+
+        Returns:
+            list: 파싱된 로그 레코드 (오래된 순)
+        """
+        self.refresh()
+        mask = np.ones(len(self.index), dtype=bool)
+
+        if level:
+            mask &= self.index['level'] >= LEVELS.index(level.upper())
+        if symbol:
+            if symbol not in self.symbols:
+                return []
+            mask &= self.index['symbol'] == self.symbols.index(symbol)
+        if orders_only:
+            mask &= self.index['is_order'] == 1
+        if since is not None:
+            mask &= self.index['ts'] >= since.timestamp()
+
+        offsets = self.index['offset'][mask]
+        if n is not None:
+            offsets = offsets[-n:] if n > 0 else offsets[:0]
+        return self._read_at(offsets)
+
+    def last_orders(self, n: int = 10, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        """심볼별 최근 주문 로그 n건"""
+        return self.query(n=n, symbol=symbol, orders_only=True)
+
+    def errors_since(self, since: datetime) -> List[Dict[str, Any]]:
+        """특정 시각 이후 에러 로그"""
+        return self.query(level='ERROR', since=since)
+
+    def follow(self, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        지정한 오프셋 이후 새로 추가된 완전한 라인만 읽기
+
+        Args:
+            offset (int): 마지막으로 읽은 위치 (처음이면 0)
+
+        Returns:
+            tuple: (새 로그 레코드 목록, 다음 호출에 넘길 오프셋)
+        """
+        if not os.path.exists(self.path):
+            return [], 0
+
+        size = os.path.getsize(self.path)
+        if offset > size:
+            offset = 0  # 로테이션으로 파일이 새로 시작됨
+
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            data = f.read(size - offset)
+
+        end = data.rfind(b'\n') + 1
+        lines = data[:end].splitlines()
+        return [parse_line(line.decode('utf-8', errors='replace')) for line in lines], offset + end
+
+    def refresh(self):
+        """로그 파일에 새로 추가된 라인을 인덱스에 반영"""
+        if not os.path.exists(self.path):
+            return
+
+        size = os.path.getsize(self.path)
+        with open(self.path, 'rb') as f:
+            header = f.read(HEADER_SIZE).decode('utf-8', errors='replace')
+            if size < self.indexed_size or (self.header and not header.startswith(self.header)):
+                self._reset_index()  # 로테이션 감지
+            if size == self.indexed_size:
+                return
+
+            f.seek(self.indexed_size)
+            data = f.read(size - self.indexed_size)
+
+        end = data.rfind(b'\n') + 1
+        if end == 0:
+            return
+
+        records = []
+        offset = self.indexed_size
+        for line in data[:end].split(b'\n')[:-1]:
+            records.append(self._index_entry(offset, line))
+            offset += len(line) + 1
+
+        new_entries = np.array(records, dtype=INDEX_DTYPE)
+        with open(self.index_path, 'ab') as f:
+            f.write(new_entries.tobytes())
+
+        self.index = np.concatenate([self.index, new_entries])
+        self.indexed_size = offset
+        self.header = header
+        self._save_meta()
+
+    def _index_entry(self, offset: int, line: bytes) -> tuple:
+        record = parse_line(line.decode('utf-8', errors='replace'))
+        level = record.get('level', '')
+        symbol = record.get('symbol') or ''
+        if symbol and symbol not in self.symbols:
+            self.symbols.append(symbol)
+        return (
+            offset,
+            _to_epoch(record.get('time')),
+            LEVELS.index(level) if level in LEVELS else 0,
+            int(str(record.get('message', '')).startswith(ORDER_PREFIX)),
+            self.symbols.index(symbol) if symbol else 0,
+            b'\x00' * 4,
+        )
+
+    def _read_at(self, offsets) -> List[Dict[str, Any]]:
+        records = []
+        with open(self.path, 'rb') as f:
+            for offset in offsets:
+                f.seek(int(offset))
+                records.append(parse_line(f.readline().decode('utf-8', errors='replace')))
+        return records
+
+    def _load_index(self):
+        if not (os.path.exists(self.index_path) and os.path.exists(self.meta_path)):
+            return
+        try:
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            index = np.fromfile(self.index_path, dtype=INDEX_DTYPE)
+        except (ValueError, OSError):
+            self._reset_index()
+            return
+
+        if len(index) != meta.get('count'):
+            self._reset_index()  # 인덱스와 메타 정보 불일치 (기록 도중 중단)
+            return
+        self.index = index
+        self.symbols = meta['symbols']
+        self.indexed_size = meta['indexed_size']
+        self.header = meta['header']
+
+    def _save_meta(self):
+        tmp_path = f'{self.meta_path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'count': len(self.index),
+                'symbols': self.symbols,
+                'indexed_size': self.indexed_size,
+                'header': self.header,
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, self.meta_path)
+
+    def _reset_index(self):
+        self.index = np.zeros(0, dtype=INDEX_DTYPE)
+        self.symbols = ['']
+        self.indexed_size = 0
+        self.header = ''
+        if os.path.exists(self.index_path):
+            os.remove(self.index_path)
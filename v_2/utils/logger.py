@@ -7,34 +7,191 @@
 2. 에러 로깅
 3. 성능 메트릭 기록
 4. 로그 파일 관리
+   - 큐 핸들러 + 백그라운드 리스너 (거래 스레드에서 디스크 I/O 제거)
+   - 시간/크기 기준 로테이션 및 gzip 압축
+   - JSON 라인 형식 (tick, symbol, latency 필드)
 """
+import atexit
+import glob
+import gzip
+import json
 import logging
-from datetime import datetime
+import logging.handlers
+import os
+import queue
+import shutil
+import threading
+from datetime import datetime, timedelta
 
-def setup_logger():
+# 로그 레코드에 붙는 컨텍스트 필드 (tick, symbol 등, 스레드별로 따로 유지)
+_log_context = threading.local()
+_listener = None
+
+# JSON 레코드에 포함할 구조화 필드
+STRUCTURED_FIELDS = ('tick', 'symbol', 'latency')
+
+
+class ContextFilter(logging.Filter):
+    """로그를 남기는 스레드가 set_log_context()로 지정한 필드를 레코드에 주입 (extra로 넘긴 값이 우선)"""
+
+    def filter(self, record):
+        for key, value in getattr(_log_context, 'fields', {}).items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 한 줄 JSON으로 변환"""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class CompressedRotatingFileHandler(logging.handlers.BaseRotatingHandler):
+    def __init__(self, filename: str, max_bytes: int = 50 * 1024 * 1024,
+                 interval_hours: int = 24, backup_count: int = 30):
+        """
+        시간/크기 기준 로테이션 파일 핸들러
+
+        Args:
+            filename (str): 현재 로그 파일 경로
+            max_bytes (int): 파일 크기 한도 (0이면 크기 로테이션 안 함)
+            interval_hours (int): 로테이션 주기 (24이면 매일 자정)
+            backup_count (int): 보관할 압축 파일 개수 (0이면 무제한)
+
+        로테이션된 파일은 '<filename>.<YYYYmmdd-HHMMSS>.gz'로 압축 저장
+        """
+        super().__init__(filename, 'a', encoding='utf-8', delay=False)
+        self.max_bytes = max_bytes
+        self.interval = timedelta(hours=interval_hours)
+        self.backup_count = backup_count
+        self.rollover_at = self._next_rollover(datetime.now())
+
+    def _next_rollover(self, now: datetime) -> datetime:
+        if self.interval == timedelta(hours=24):
+            return datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        return now + self.interval
+
+    def shouldRollover(self, record) -> bool:
+        if datetime.now() >= self.rollover_at:
+            return True
+        if self.max_bytes and self.stream is not None:
+            return self.stream.tell() >= self.max_bytes
+        return False
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        now = datetime.now()
+        if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) > 0:
+            target = f"{self.baseFilename}.{now.strftime('%Y%m%d-%H%M%S')}"
+            suffix = 0
+            while os.path.exists(target + '.gz'):
+                suffix += 1
+                target = f"{self.baseFilename}.{now.strftime('%Y%m%d-%H%M%S')}-{suffix}"
+            with open(self.baseFilename, 'rb') as src, gzip.open(target + '.gz', 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(self.baseFilename)
+            self._remove_old_backups()
+
+        self.rollover_at = self._next_rollover(now)
+        self.stream = self._open()
+
+    def _remove_old_backups(self):
+        if not self.backup_count:
+            return
+        backups = sorted(glob.glob(glob.escape(self.baseFilename) + '.*.gz'), key=os.path.getmtime)
+        for path in backups[:-self.backup_count]:
+            os.remove(path)
+
+
+def set_log_context(**fields):
+    """
+    현재 스레드가 이후 남기는 로그 레코드에 붙일 컨텍스트 필드 설정
+
+    파이프라인처럼 한 틱을 여러 스레드가 처리하면 각 스레드에서 다시 설정
+
+    사용 예:
+        set_log_context(tick=metrics.tick, symbol='BTC/USDT')
+        logger.info("주문 실행", extra={'latency': 0.12})
+    """
+    if not hasattr(_log_context, 'fields'):
+        _log_context.fields = {}
+    _log_context.fields.update(fields)
+
+
+def setup_logger(config=None):
     """
     로깅 시스템 초기화
-    
+
     설정:
-    1. 파일 로거: 일별 로그 파일 생성
-    2. 콘솔 로거: 실시간 로그 출력
-    3. 로그 레벨: INFO
-    4. 로그 포맷: 시간 - 레벨 - 메시지
-    
+    1. 큐 핸들러: 호출 스레드는 큐에 넣기만 하고 즉시 반환
+    2. 백그라운드 리스너: 파일/콘솔 출력 담당
+    3. 파일 로거: 시간/크기 로테이션, gzip 압축, JSON 라인
+    4. 콘솔 로거: 시간 - 레벨 - 메시지
+
+    Args:
+        config (dict, optional): config['logging'] 설정
+            - path: 로그 파일 경로 (기본 data/logs/trading.log)
+            - max_bytes: 파일 크기 한도
+            - interval_hours: 로테이션 주기
+            - backup_count: 보관할 압축 파일 개수
+            - level: 로그 레벨 (기본 INFO)
+
     Returns:
         Logger: 설정된 로거 인스턴스
     """
-    # 로깅 기본 설정
-    logging.basicConfig(
-        level=logging.INFO,  # 로그 레벨 설정
-        format='%(asctime)s - %(levelname)s - %(message)s',  # 로그 형식
-        handlers=[
-            # 파일 핸들러: 날짜별 로그 파일 생성
-            logging.FileHandler(
-                f'data/logs/trading_{datetime.now().strftime("%Y%m%d")}.log'
-            ),
-            # 콘솔 출력 핸들러
-            logging.StreamHandler()
-        ]
+    global _listener
+    if _listener is not None:
+        return logging.getLogger(__name__)
+
+    config = config or {}
+    log_path = config.get('path', 'data/logs/trading.log')
+    os.makedirs(os.path.dirname(log_path) or '.', exist_ok=True)
+
+    # 파일 핸들러: 로테이션 + 압축 + JSON 라인
+    file_handler = CompressedRotatingFileHandler(
+        log_path,
+        max_bytes=config.get('max_bytes', 50 * 1024 * 1024),
+        interval_hours=config.get('interval_hours', 24),
+        backup_count=config.get('backup_count', 30)
     )
-    return logging.getLogger(__name__) 
\ No newline at end of file
+    file_handler.setFormatter(JsonFormatter())
+
+    # 콘솔 출력 핸들러
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    )
+
+    # 큐 핸들러: 로그 호출은 큐 삽입만 수행
+    log_queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter())
+
+    root = logging.getLogger()
+    root.setLevel(config.get('level', 'INFO'))
+    root.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    return logging.getLogger(__name__)
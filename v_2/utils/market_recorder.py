@@ -0,0 +1,212 @@
+"""
+시장 데이터 기록기
+봇이 받은 거래소 응답(티커, 캔들, 호가창, 잔고, 주문)을 그대로 보관하여 재현/벤치마크에 사용
+
+# 주요 기능:
+- 기록
+  - 호출 측은 큐에 넣고 즉시 반환 (틱 지연 거의 없음)
+  - 백그라운드 스레드가 모아서 일괄 기록
+  - 큐가 가득 차면 버리고 개수만 집계 (거래 루프 보호)
+
+- 저장 형식
+  - 시간 구간별 세그먼트: <디렉토리>/<YYYYmmdd-HHMMSS>.jsonl.gz (UTC 시작 시각)
+  - 한 줄에 한 응답: {"ts": 수신 시각(ms), "kind": 종류, "args": 요청 인자, "data": 응답}
+  - 일괄 기록마다 gzip 멤버를 이어 붙이는 추가 전용 방식
+
+- 조회
+  - read_records(): 파일 이름의 시작 시각으로 필요한 세그먼트만 읽음
+"""
+
+import glob
+import gzip
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+DEFAULT_RECORDING_DIR = 'data/recordings'
+SEGMENT_SUFFIX = '.jsonl.gz'
+SEGMENT_TIME_FORMAT = '%Y%m%d-%H%M%S'
+
+logger = logging.getLogger(__name__)
+
+
+def _segment_start(path: str) -> int:
+    """세그먼트 파일 이름의 시작 시각 (ms)"""
+    name = os.path.basename(path)[:-len(SEGMENT_SUFFIX)]
+    start = datetime.strptime(name, SEGMENT_TIME_FORMAT).replace(tzinfo=timezone.utc)
+    return int(start.timestamp() * 1000)
+
+
+def list_segments(directory: str = DEFAULT_RECORDING_DIR):
+    """시간순 세그먼트 경로 목록"""
+    return sorted(glob.glob(os.path.join(directory, '*' + SEGMENT_SUFFIX)))
+
+
+def read_records(directory: str = DEFAULT_RECORDING_DIR, start_ms: Optional[int] = None,
+                 end_ms: Optional[int] = None,
+                 kinds: Optional[Sequence[str]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    기록된 응답을 시간순으로 조회
+
+    Args:
+        directory (str): 기록 디렉토리
+        start_ms (int, optional): 시작 시각 (포함)
+        end_ms (int, optional): 종료 시각 (미포함)
+        kinds (list, optional): 조회할 종류 (기본: 전체)
+
+    Yields:
+        dict: {'ts', 'kind', 'args', 'data'}
+    """
+    segments = list_segments(directory)
+    starts = [_segment_start(path) for path in segments]
+    for i, path in enumerate(segments):
+        next_start = starts[i + 1] if i + 1 < len(starts) else None
+        if start_ms is not None and next_start is not None and next_start <= start_ms:
+            continue
+        if end_ms is not None and starts[i] >= end_ms:
+            break
+        with gzip.open(path, 'rt', encoding='utf-8') as file:
+            try:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if start_ms is not None and record['ts'] < start_ms:
+                        continue
+                    if end_ms is not None and record['ts'] >= end_ms:
+                        break
+                    if kinds is None or record['kind'] in kinds:
+                        yield record
+            except EOFError:
+                pass  # 기록 중인 세그먼트의 마지막 멤버
+
+
+class MarketRecorder:
+    def __init__(self, directory: str = DEFAULT_RECORDING_DIR, segment_seconds: int = 3600,
+                 flush_interval: float = 1.0, batch_size: int = 512, queue_size: int = 10000):
+        """
+        시장 데이터 기록기 초기화 (start() 호출 전에는 기록하지 않음)
+
+        Args:
+            directory (str): 세그먼트 저장 디렉토리
+            segment_seconds (int): 세그먼트 하나가 담는 시간 (초)
+            flush_interval (float): 일괄 기록 주기 (초)
+            batch_size (int): 한 번에 기록할 최대 응답 수
+            queue_size (int): 기록 대기 한도 (초과분은 버림)
+        """
+        self.directory = directory
+        self.segment_seconds = segment_seconds
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.enabled = False
+        self.dropped = 0
+        self._queue = queue.Queue(queue_size)
+        self._thread = None
+        self._segment_path = None
+        self._segment_start = None
+
+    def record(self, kind: str, data: Any, **args):
+        """
+        거래소 응답 기록 요청 (비활성화 상태면 아무것도 하지 않음)
+
+        Args:
+            kind (str): 응답 종류 (ticker, ohlcv, orderbook, balance, order 등)
+            data: 거래소 응답 (JSON 직렬화 가능한 값)
+            **args: 요청 인자 (symbol, timeframe 등)
+        """
+        if not self.enabled:
+            return
+        try:
+            self._queue.put_nowait({'ts': int(time.time() * 1000), 'kind': kind, 'args': args, 'data': data})
+        except queue.Full:
+            self.dropped += 1
+
+    def start(self):
+        if self._thread is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self.enabled = True
+            self._thread = threading.Thread(target=self._write_loop, daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self):
+        """기록 중단 후 남은 응답 기록"""
+        if self._thread is None:
+            return
+        self.enabled = False
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def setup(self, config: Optional[Dict[str, Any]]):
+        """
+        config['recorder'] 설정 적용
+
+        설정 항목:
+            enabled: 기록 여부
+            directory: 세그먼트 저장 디렉토리
+            segment_seconds: 세그먼트 시간 구간 (초)
+        """
+        config = config or {}
+        if not config.get('enabled', False):
+            return
+        self.directory = config.get('directory', self.directory)
+        self.segment_seconds = config.get('segment_seconds', self.segment_seconds)
+        self.start()
+
+    def _write_loop(self):
+        running = True
+        while running:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            batch = []
+            item = first
+            while True:
+                if item is None:
+                    running = False
+                else:
+                    batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                try:
+                    self._write(batch)
+                except (OSError, TypeError, ValueError) as e:
+                    logger.error(f"시장 데이터 기록 실패: {e}")
+
+    def _write(self, batch):
+        lines = {}
+        for record in batch:
+            path = self._segment_for(record['ts'])
+            lines.setdefault(path, []).append(json.dumps(record, default=str))
+        for path, chunk in lines.items():
+            with gzip.open(path, 'at', encoding='utf-8') as file:
+                file.write('\n'.join(chunk) + '\n')
+
+    def _segment_for(self, ts: int) -> str:
+        """기록 시각이 속한 세그먼트 (구간이 지나면 새 세그먼트 시작)"""
+        if self._segment_start is None or ts - self._segment_start >= self.segment_seconds * 1000:
+            self._segment_start = ts - ts % 1000
+            name = datetime.fromtimestamp(self._segment_start / 1000, tz=timezone.utc)
+            self._segment_path = os.path.join(
+                self.directory, name.strftime(SEGMENT_TIME_FORMAT) + SEGMENT_SUFFIX
+            )
+        return self._segment_path
+
+
+# 프로세스 전역 시장 데이터 기록기
+recorder = MarketRecorder()
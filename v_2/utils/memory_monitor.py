@@ -0,0 +1,196 @@
+"""
+메모리 사용량 감시 모듈
+장기 실행 봇의 RSS와 파이썬 할당을 주기적으로 기록하고 누수 의심 시 경고
+
+# 주요 기능:
+- 샘플링
+  - 프로세스 RSS (/proc/self/statm)
+  - tracemalloc 추적 메모리와 상위 할당 위치
+  - 기준 스냅샷(워밍업 후) 대비 증가한 할당 위치
+
+- 누수 감지
+  - 기준 대비 RSS 증가량이 임계값을 넘으면 경고
+  - 최근 샘플의 RSS 증가 기울기(MB/시간)가 임계값을 넘으면 경고
+  - 경고에 증가량 상위 할당 위치 포함
+
+- 노출
+  - 게이지: memory_rss_bytes, memory_traced_bytes
+  - 카운터: memory_alerts_total{kind}
+  - 샘플 JSONL 기록 (선택)
+"""
+
+import json
+import logging
+import os
+import resource
+import time
+import tracemalloc
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from utils.metrics import metrics
+
+MB = 1024 * 1024
+TRACE_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+logger = logging.getLogger(__name__)
+
+
+def rss_bytes() -> int:
+    """현재 프로세스 RSS (바이트)"""
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        # /proc이 없는 플랫폼: 최대 RSS로 대체 (Linux는 KB 단위)
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class MemoryMonitor:
+    def __init__(self, interval: float = 300.0, top_n: int = 10, growth_threshold_mb: float = 200.0,
+                 slope_threshold_mb_per_hour: float = 20.0, warmup_samples: int = 3,
+                 history: int = 288, trace_frames: int = 5, trace: bool = True,
+                 jsonl_path: Optional[str] = None, clock=time.monotonic):
+        """
+        메모리 감시 초기화
+
+        Args:
+            interval (float): 샘플링 주기 (초)
+            top_n (int): 기록할 상위 할당 위치 수
+            growth_threshold_mb (float): 기준 대비 RSS 증가 경고 임계값 (MB)
+            slope_threshold_mb_per_hour (float): RSS 증가 기울기 경고 임계값 (MB/시간)
+            warmup_samples (int): 기준으로 삼기 전 건너뛸 샘플 수 (캐시/임포트 안정화)
+            history (int): 기울기 계산에 쓰는 최근 샘플 수
+            trace_frames (int): tracemalloc 스택 깊이
+            trace (bool): tracemalloc 사용 여부 (할당 추적은 CPU/메모리 비용이 있음)
+            jsonl_path (str, optional): 샘플 기록 파일
+            clock (callable): 시간 함수
+        """
+        self.interval = interval
+        self.top_n = top_n
+        self.growth_threshold_mb = growth_threshold_mb
+        self.slope_threshold_mb_per_hour = slope_threshold_mb_per_hour
+        self.warmup_samples = warmup_samples
+        self.trace_frames = trace_frames
+        self.trace = trace
+        self.jsonl_path = jsonl_path
+        self.clock = clock
+        self.samples = deque(maxlen=history)
+        self.sample_count = 0
+        self.baseline_rss = None
+        self._baseline_snapshot = None
+        self._last_sample = None
+        self._alerted = set()
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> Optional['MemoryMonitor']:
+        """config['memory'] 설정으로 생성 (비활성화 시 None)"""
+        config = config or {}
+        if not config.get('enabled', False):
+            return None
+        return cls(
+            interval=config.get('interval', 300.0),
+            top_n=config.get('top_n', 10),
+            growth_threshold_mb=config.get('growth_threshold_mb', 200.0),
+            slope_threshold_mb_per_hour=config.get('slope_threshold_mb_per_hour', 20.0),
+            trace=config.get('tracemalloc', True),
+            jsonl_path=config.get('jsonl_path') or None,
+        ).start()
+
+    def start(self):
+        if self.trace and not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_frames)
+        return self
+
+    def maybe_sample(self) -> Optional[Dict[str, Any]]:
+        """주기가 지났으면 샘플링 (매 틱 호출)"""
+        if self._last_sample is not None and self.clock() - self._last_sample < self.interval:
+            return None
+        return self.sample()
+
+    def sample(self) -> Dict[str, Any]:
+        """
+        메모리 샘플 기록 및 누수 검사
+
+        Returns:
+            dict: {'ts', 'rss_mb', 'traced_mb', 'peak_traced_mb', 'top', 'growth', 'alerts'}
+        """
+        now = self.clock()
+        self._last_sample = now
+        self.sample_count += 1
+        rss = rss_bytes()
+        record = {'ts': time.time(), 'rss_mb': rss / MB, 'top': [], 'growth': [], 'alerts': []}
+
+        if tracemalloc.is_tracing():
+            traced, peak = tracemalloc.get_traced_memory()
+            record.update(traced_mb=traced / MB, peak_traced_mb=peak / MB)
+            snapshot = tracemalloc.take_snapshot().filter_traces(TRACE_FILTERS)
+            record['top'] = [
+                {'where': str(stat.traceback[0]), 'size_mb': stat.size / MB, 'count': stat.count}
+                for stat in snapshot.statistics('lineno')[:self.top_n]
+            ]
+            if self._baseline_snapshot is None and self.sample_count > self.warmup_samples:
+                self._baseline_snapshot = snapshot
+            elif self._baseline_snapshot is not None:
+                record['growth'] = [
+                    {'where': str(stat.traceback[0]), 'size_mb': stat.size_diff / MB,
+                     'count': stat.count_diff}
+                    for stat in snapshot.compare_to(self._baseline_snapshot, 'lineno')[:self.top_n]
+                    if stat.size_diff > 0
+                ]
+            metrics.set_gauge('memory_traced_bytes', traced)
+        metrics.set_gauge('memory_rss_bytes', rss)
+
+        if self.baseline_rss is None and self.sample_count > self.warmup_samples:
+            self.baseline_rss = rss
+        self.samples.append((now, rss))
+        record['alerts'] = self._check(record)
+
+        if self.jsonl_path:
+            with open(self.jsonl_path, 'a', encoding='utf-8') as file:
+                file.write(json.dumps(record) + '\n')
+        return record
+
+    def growth_mb(self) -> float:
+        """기준 대비 RSS 증가량 (MB)"""
+        if self.baseline_rss is None or not self.samples:
+            return 0.0
+        return (self.samples[-1][1] - self.baseline_rss) / MB
+
+    def slope_mb_per_hour(self) -> float:
+        """기준 이후 최근 샘플의 RSS 증가 기울기 (MB/시간)"""
+        if self.baseline_rss is None or len(self.samples) < 4:
+            return 0.0
+        times, sizes = np.array(self.samples, dtype=float).T
+        if times[-1] - times[0] <= 0:
+            return 0.0
+        return float(np.polyfit((times - times[0]) / 3600, sizes / MB, 1)[0])
+
+    def _check(self, record: Dict[str, Any]) -> List[str]:
+        alerts = []
+        growth = self.growth_mb()
+        if growth > self.growth_threshold_mb:
+            alerts.append('growth')
+        slope = self.slope_mb_per_hour()
+        if slope > self.slope_threshold_mb_per_hour:
+            alerts.append('slope')
+
+        for kind in alerts:
+            metrics.inc('memory_alerts_total', kind=kind)
+            if kind in self._alerted:
+                continue  # 같은 종류 경고는 한 번만 상세 기록
+            self._alerted.add(kind)
+            top = ', '.join(f"{g['where']} +{g['size_mb']:.1f}MB" for g in record['growth'][:3])
+            logger.warning(
+                f"메모리 증가 경고 ({kind}): RSS {record['rss_mb']:.1f}MB, "
+                f"기준 대비 +{growth:.1f}MB, 기울기 {slope:.1f}MB/h"
+                + (f", 증가 위치: {top}" if top else '')
+            )
+        return alerts
@@ -0,0 +1,269 @@
+"""
+트레이딩 루프 계측 모듈
+틱 단계별 소요 시간과 카운터를 수집하여 Prometheus 텍스트 형식으로 노출
+
+# 주요 기능:
+- 계측
+  - 단계별 타이밍 스팬 (fetch, indicators, prompt, llm, parse, order)
+  - 카운터 (틱 수, 주문 수, 오류 수 등)
+  - 게이지 (메모리 사용량 등 현재 값)
+  - 지연시간 히스토그램
+
+- 노출
+  - 봇 프로세스 내 HTTP 엔드포인트 (/metrics, add_route()로 추가한 제어 경로)
+  - 틱 단위 JSONL 기록 (선택)
+
+- 틱 기록
+  - 진행 중인 틱은 스레드별로 관리 (틱을 시작한 스레드의 스팬만 기록)
+  - 파이프라인 단계 사이에서는 detach_tick()/attach_tick()으로 틱을 넘겨 마지막 단계에서 종료
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+# 지연시간 히스토그램 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """누적 버킷 히스토그램"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+class MetricsRegistry:
+    def __init__(self):
+        """
+        메트릭 저장소 초기화
+
+        카운터와 히스토그램은 (이름, 라벨) 단위로 관리
+        """
+        self._lock = threading.Lock()
+        self.counters: Dict[Tuple[str, Tuple], float] = {}
+        self.histograms: Dict[Tuple[str, Tuple], Histogram] = {}
+        self.gauges: Dict[Tuple[str, Tuple], float] = {}
+
+        self.tick = 0  # 마지막으로 시작한 틱 번호
+        # 스레드별 진행 중인 틱 {'tick': 번호, 'start': 시작 시각, 'stages': 단계별 소요 시간}
+        self._local = threading.local()
+        self._jsonl_file = None
+        self._server = None
+        self.routes: Dict[str, Callable[[Dict[str, List[str]]], str]] = {}
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """카운터 증가"""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels):
+        """게이지 값 설정"""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.gauges[key] = value
+
+    def observe(self, name: str, value: float, **labels):
+        """히스토그램에 값 기록"""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            if key not in self.histograms:
+                self.histograms[key] = Histogram()
+            self.histograms[key].observe(value)
+
+    @contextmanager
+    def span(self, stage: str):
+        """
+        단계 소요 시간 측정
+
+        사용 예:
+            with metrics.span('fetch'):
+                market_data = fetch_market_data()
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.observe('tick_stage_seconds', elapsed, stage=stage)
+            current = getattr(self._local, 'current', None)
+            if current is not None:
+                current['stages'][stage] = current['stages'].get(stage, 0.0) + elapsed
+
+    def start_tick(self):
+        """현재 스레드에서 새 틱 시작 (단계별 기록 초기화)"""
+        with self._lock:
+            self.tick += 1
+            tick = self.tick
+        self._local.current = {'tick': tick, 'start': time.perf_counter(), 'stages': {}}
+
+    def detach_tick(self) -> Optional[Dict[str, Any]]:
+        """
+        현재 스레드의 진행 중인 틱을 떼어내 반환 (다른 스레드가 attach_tick()으로 이어서 종료)
+
+        Returns:
+            dict: 진행 중인 틱 상태 (없으면 None)
+        """
+        current = getattr(self._local, 'current', None)
+        self._local.current = None
+        return current
+
+    def attach_tick(self, current: Optional[Dict[str, Any]]):
+        """detach_tick()으로 떼어낸 틱을 현재 스레드의 진행 중인 틱으로 설정"""
+        self._local.current = current
+
+    def end_tick(self, **fields) -> Dict[str, Any]:
+        """
+        틱 종료 및 요약 기록
+
+        Args:
+            **fields: JSONL 레코드에 함께 남길 추가 필드
+
+        Returns:
+            dict: 틱 요약 레코드 (현재 스레드에 진행 중인 틱이 없으면 빈 dict)
+        """
+        current = self.detach_tick()
+        if current is None:
+            return {}
+        elapsed = time.perf_counter() - current['start']
+        self.observe('tick_seconds', elapsed)
+        self.inc('ticks_total')
+
+        record = {
+            'ts': time.time(),
+            'tick': current['tick'],
+            'duration': elapsed,
+            'stages': current['stages'],
+        }
+        record.update(fields)
+
+        if self._jsonl_file:
+            line = json.dumps(record, default=str) + '\n'
+            with self._lock:
+                self._jsonl_file.write(line)
+                self._jsonl_file.flush()
+        return record
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식으로 변환"""
+        lines = []
+        with self._lock:
+            counters = dict(self.counters)
+            gauges = dict(self.gauges)
+            histograms = {
+                key: (hist.buckets, list(hist.counts), hist.count, hist.sum)
+                for key, hist in self.histograms.items()
+            }
+
+        for name in sorted({key[0] for key in counters}):
+            lines.append(f'# TYPE {name} counter')
+            for (metric, labels), value in counters.items():
+                if metric == name:
+                    lines.append(f'{name}{_format_labels(labels)} {value}')
+
+        for name in sorted({key[0] for key in gauges}):
+            lines.append(f'# TYPE {name} gauge')
+            for (metric, labels), value in gauges.items():
+                if metric == name:
+                    lines.append(f'{name}{_format_labels(labels)} {value}')
+
+        for name in sorted({key[0] for key in histograms}):
+            lines.append(f'# TYPE {name} histogram')
+            for (metric, labels), (buckets, counts, count, total) in histograms.items():
+                if metric != name:
+                    continue
+                for bound, bucket_count in zip(buckets, counts):
+                    bucket_labels = labels + (('le', str(bound)),)
+                    lines.append(f'{name}_bucket{_format_labels(bucket_labels)} {bucket_count}')
+                lines.append(f'{name}_bucket{_format_labels(labels + (("le", "+Inf"),))} {count}')
+                lines.append(f'{name}_sum{_format_labels(labels)} {total}')
+                lines.append(f'{name}_count{_format_labels(labels)} {count}')
+
+        return '\n'.join(lines) + '\n'
+
+    def open_jsonl(self, path: str):
+        """틱 요약을 기록할 JSONL 파일 열기"""
+        self._jsonl_file = open(path, 'a', encoding='utf-8')
+
+    def add_route(self, path: str, handler: Callable[[Dict[str, List[str]]], str]):
+        """
+        메트릭 서버에 GET 경로 추가 (예: /profile)
+
+        Args:
+            path (str): 경로
+            handler (callable): 쿼리 파라미터 dict를 받아 응답 텍스트 반환
+        """
+        self.routes[path] = handler
+
+    def start_server(self, host: str = '127.0.0.1', port: int = 9108):
+        """
+        /metrics HTTP 엔드포인트를 백그라운드 스레드에서 실행
+
+        Returns:
+            ThreadingHTTPServer: 실행 중인 서버
+        """
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path, _, query = self.path.partition('?')
+                if path == '/metrics':
+                    body = registry.render_prometheus().encode('utf-8')
+                elif path in registry.routes:
+                    body = registry.routes[path](parse_qs(query)).encode('utf-8')
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # 요청 로그는 남기지 않음
+
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self._server
+
+    def setup(self, config: Optional[Dict[str, Any]]):
+        """
+        config['metrics'] 설정 적용
+
+        설정 항목:
+            enabled: HTTP 엔드포인트 실행 여부
+            host/port: 바인딩 주소
+            jsonl_path: 틱 요약 JSONL 경로 (비어 있으면 기록 안 함)
+        """
+        config = config or {}
+        if config.get('enabled', False) and self._server is None:
+            self.start_server(config.get('host', '127.0.0.1'), config.get('port', 9108))
+        if config.get('jsonl_path') and self._jsonl_file is None:
+            self.open_jsonl(config['jsonl_path'])
+
+
+def _format_labels(labels: Tuple) -> str:
+    if not labels:
+        return ''
+    inner = ','.join(f'{key}="{value}"' for key, value in labels)
+    return '{' + inner + '}'
+
+
+# 프로세스 전역 메트릭 저장소
+metrics = MetricsRegistry()
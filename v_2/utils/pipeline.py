@@ -0,0 +1,191 @@
+"""
+단계별 작업 파이프라인
+수집/분석/결정/실행 단계를 각자의 작업자 스레드에서 돌려 느린 단계가 앞 단계를 막지 않도록 함
+
+# 주요 기능:
+- 단계 간 대기열 (LatestQueue)
+  - 키(거래 페어)별로 최신 항목 하나만 보관: 처리 전에 새 항목이 오면 이전 항목을 대체
+  - 대체 시 merge 함수로 이전 항목의 정보를 넘길 수 있음 (예: 트리거 사유 합치기)
+  - 키 개수 한도를 넘으면 가장 오래된 항목을 버림
+  - 대체/버림 횟수 집계 (pipeline_coalesced_total, pipeline_dropped_total)
+
+- 단계 (Stage)
+  - 대기열에서 꺼내 처리 함수 실행 후 결과를 다음 대기열로 전달 (None이면 전달하지 않음)
+  - max_age보다 오래된 항목은 처리하지 않고 버림 (pipeline_stale_total, on_stale 콜백)
+  - 처리 시간/오류 집계 (pipeline_stage_seconds, pipeline_errors_total)
+
+- 파이프라인 (Pipeline)
+  - 단계 시작/중지, 대기열 상태 조회
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class LatestQueue:
+    def __init__(self, name: str, max_keys: int = 16,
+                 merge: Optional[Callable[[Any, Any], Any]] = None):
+        """
+        키별 최신 항목 대기열
+
+        Args:
+            name (str): 대기열 이름 (메트릭 라벨)
+            max_keys (int): 동시에 보관할 최대 키 수
+            merge (callable, optional): (이전 항목, 새 항목) -> 보관할 항목 (기본: 새 항목)
+        """
+        self.name = name
+        self.max_keys = max_keys
+        self.merge = merge
+        self._items: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def put(self, key: Hashable, item: Any):
+        """항목 추가 (같은 키의 처리 전 항목은 대체)"""
+        with self._cond:
+            if key in self._items:
+                previous = self._items.pop(key)
+                if self.merge is not None:
+                    item = self.merge(previous, item)
+                metrics.inc('pipeline_coalesced_total', queue=self.name)
+            elif len(self._items) >= self.max_keys:
+                self._items.popitem(last=False)
+                metrics.inc('pipeline_dropped_total', queue=self.name)
+            self._items[key] = item
+            self._cond.notify()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Any]:
+        """가장 오래 기다린 키의 항목 (시간 초과 또는 닫힘이면 None)"""
+        with self._cond:
+            if not self._items and not self._closed:
+                self._cond.wait(timeout)
+            if not self._items:
+                return None
+            return self._items.popitem(last=False)[1]
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class Stage:
+    def __init__(self, name: str, handler: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+                 inbox: LatestQueue, outbox: Optional[LatestQueue] = None,
+                 max_age: Optional[float] = None, key: str = 'symbol', clock=time.monotonic,
+                 on_stale: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        파이프라인 단계
+
+        Args:
+            name (str): 단계 이름 (스레드 이름 pipeline-<name>, 메트릭 라벨)
+            handler (callable): 항목(dict)을 받아 다음 단계 항목을 반환 (None이면 종료)
+            inbox (LatestQueue): 입력 대기열
+            outbox (LatestQueue, optional): 출력 대기열
+            max_age (float, optional): 항목의 'created' 이후 이 시간(초)이 지나면 버림
+            key (str): 출력 대기열 키로 쓸 항목 필드
+            clock (callable): 'created'와 같은 시간 함수
+            on_stale (callable, optional): 오래되어 버린 항목을 받아 정리하는 함수
+        """
+        self.name = name
+        self.handler = handler
+        self.inbox = inbox
+        self.outbox = outbox
+        self.max_age = max_age
+        self.key = key
+        self.clock = clock
+        self.on_stale = on_stale
+        self.processed = 0
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=f'pipeline-{self.name}', daemon=True)
+            self._thread.start()
+        return self
+
+    def join(self, timeout: Optional[float] = None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            item = self.inbox.get(timeout=1.0)
+            if item is None:
+                if self.inbox.closed:
+                    break
+                continue
+            if self.max_age is not None and self.clock() - item['created'] > self.max_age:
+                metrics.inc('pipeline_stale_total', stage=self.name)
+                if self.on_stale is not None:
+                    self.on_stale(item)
+                continue
+
+            start = time.perf_counter()
+            try:
+                result = self.handler(item)
+            except Exception as e:
+                metrics.inc('pipeline_errors_total', stage=self.name)
+                logger.error(f"파이프라인 {self.name} 단계 오류: {e}")
+                continue
+            finally:
+                metrics.observe('pipeline_stage_seconds', time.perf_counter() - start, stage=self.name)
+            self.processed += 1
+            if result is not None and self.outbox is not None:
+                self.outbox.put(result[self.key], result)
+
+        if self.outbox is not None:
+            self.outbox.close()  # 다음 단계도 남은 항목 처리 후 종료
+
+
+class Pipeline:
+    def __init__(self, stages: List[Stage]):
+        """
+        단계 목록으로 파이프라인 구성 (앞 단계의 outbox가 다음 단계의 inbox)
+
+        Args:
+            stages (list): 처리 순서대로의 Stage 목록
+        """
+        self.stages = stages
+
+    @property
+    def inbox(self) -> LatestQueue:
+        """첫 단계 입력 대기열 (수집 측이 항목을 넣음)"""
+        return self.stages[0].inbox
+
+    def submit(self, key: Hashable, item: Dict[str, Any], clock=time.monotonic):
+        """항목 투입 ('created' 시각 기록)"""
+        item.setdefault('created', clock())
+        self.inbox.put(key, item)
+
+    def start(self):
+        for stage in self.stages:
+            stage.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        """입력을 닫고 각 단계가 남은 항목을 처리한 뒤 종료할 때까지 대기"""
+        self.inbox.close()
+        for stage in self.stages:
+            stage.join(timeout)
+
+    def status(self) -> Dict[str, Dict[str, int]]:
+        """단계별 {'pending': 대기 항목 수, 'processed': 처리 수}"""
+        return {
+            stage.name: {'pending': len(stage.inbox), 'processed': stage.processed}
+            for stage in self.stages
+        }
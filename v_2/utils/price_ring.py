@@ -0,0 +1,210 @@
+"""
+실시간 가격 링 버퍼
+고정 크기 레코드를 메모리 맵 파일에 순환 기록하여 live_data.csv를 대체
+
+# 주요 기능:
+- 기록 (봇 프로세스)
+  - 타임스탬프/가격/매수호가/매도호가/거래량 샘플 추가
+  - 덮어쓰기 직전 구간을 압축 세그먼트로 보관 (선택)
+
+- 조회 (대시보드 프로세스)
+  - 파일 파싱 없이 NumPy 뷰로 접근
+  - 조회 비용은 보관 개수에만 비례 (봇 실행 시간과 무관)
+  - 보관된 과거 세그먼트 조회
+"""
+
+import glob
+import os
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+
+# 샘플 레코드 형식 (40바이트)
+SAMPLE_DTYPE = np.dtype([
+    ('ts', '<i8'),      # 타임스탬프 (epoch ms)
+    ('price', '<f8'),   # 현재가
+    ('bid', '<f8'),     # 매수호가
+    ('ask', '<f8'),     # 매도호가
+    ('volume', '<f8'),  # 거래량
+])
+
+# 헤더: magic, 용량, 누적 기록 수
+HEADER_DTYPE = np.dtype([
+    ('magic', 'S8'),
+    ('capacity', '<u8'),
+    ('count', '<u8'),
+    ('pad', 'V40'),
+])
+MAGIC = b'PRING001'
+
+
+class PriceRingBuffer:
+    def __init__(self, path: str, capacity: int = 100000, spill_dir: Optional[str] = None,
+                 segment_size: int = 10000, readonly: bool = False):
+        """
+        링 버퍼 초기화
+
+        Args:
+            path (str): 버퍼 파일 경로
+            capacity (int): 보관할 최대 샘플 수 (새 파일 생성 시에만 사용)
+            spill_dir (str, optional): 덮어쓰는 샘플을 압축 보관할 디렉토리
+            segment_size (int): 보관 세그먼트 크기 (capacity의 약수여야 함)
+            readonly (bool): 조회 전용으로 열기 (대시보드)
+        """
+        self.path = path
+        self.spill_dir = spill_dir
+        self.readonly = readonly
+
+        if not os.path.exists(path):
+            if readonly:
+                raise FileNotFoundError(path)
+            self._create(path, capacity)
+
+        mode = 'r' if readonly else 'r+'
+        self.header = np.memmap(path, dtype=HEADER_DTYPE, mode=mode, shape=(1,))
+        if self.header['magic'][0] != MAGIC:
+            raise ValueError(f"링 버퍼 파일 형식이 아님: {path}")
+
+        self.capacity = int(self.header['capacity'][0])
+        self.records = np.memmap(
+            path, dtype=SAMPLE_DTYPE, mode=mode,
+            offset=HEADER_DTYPE.itemsize, shape=(self.capacity,)
+        )
+
+        if self.capacity % segment_size:
+            raise ValueError("segment_size는 capacity의 약수여야 합니다")
+        self.segment_size = segment_size
+
+    @classmethod
+    def from_config(cls, config, readonly: bool = False) -> 'PriceRingBuffer':
+        """config['live_data'] 설정으로 버퍼 생성"""
+        config = config or {}
+        return cls(
+            config.get('path', 'data/live_data.ring'),
+            capacity=config.get('capacity', 100000),
+            spill_dir=config.get('spill_dir') or None,
+            segment_size=config.get('segment_size', 10000),
+            readonly=readonly
+        )
+
+    @staticmethod
+    def _create(path: str, capacity: int):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        header = np.zeros(1, dtype=HEADER_DTYPE)
+        header['magic'] = MAGIC
+        header['capacity'] = capacity
+        with open(path, 'wb') as f:
+            f.write(header.tobytes())
+            f.truncate(HEADER_DTYPE.itemsize + capacity * SAMPLE_DTYPE.itemsize)
+
+    @property
+    def count(self) -> int:
+        """지금까지 기록된 누적 샘플 수"""
+        return int(self.header['count'][0])
+
+    def append(self, ts: int, price: float, bid: float, ask: float, volume: float):
+        """
+        샘플 추가
+
+        Args:
+            ts (int): 타임스탬프 (epoch ms)
+            price, bid, ask, volume (float): 가격 정보
+        """
+        count = self.count
+        slot = count % self.capacity
+
+        # 가장 오래된 세그먼트를 덮어쓰기 직전에 압축 보관
+        if self.spill_dir and count >= self.capacity and slot % self.segment_size == 0:
+            self._spill(self.records[slot:slot + self.segment_size])
+
+        self.records[slot] = (ts, price, bid, ask, volume)
+        # 레코드를 먼저 기록한 뒤 카운트를 증가시켜 조회 측이 미완성 레코드를 보지 않도록 함
+        self.header['count'] = count + 1
+
+    def append_ticker(self, ticker: dict):
+        """ccxt fetch_ticker() 응답으로 샘플 추가 (누락 값은 NaN)"""
+        def value(key):
+            return float('nan') if ticker.get(key) is None else float(ticker[key])
+
+        self.append(
+            int(ticker.get('timestamp') or time.time() * 1000),
+            value('last'), value('bid'), value('ask'), value('quoteVolume')
+        )
+
+    def views(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        복사 없이 (오래된 구간, 최신 구간) 두 개의 뷰 반환
+
+        버퍼가 한 바퀴 돌기 전에는 첫 번째 뷰가 비어 있음
+        """
+        count = self.count
+        if count <= self.capacity:
+            return self.records[:0], self.records[:count]
+        slot = count % self.capacity
+        return self.records[slot:], self.records[:slot]
+
+    def latest(self, n: Optional[int] = None) -> np.ndarray:
+        """
+        최근 n개 샘플을 시간순으로 반환
+
+        순환 경계를 넘지 않으면 복사 없는 뷰, 넘으면 n개만 이어 붙인 배열
+        """
+        count = self.count
+        available = min(count, self.capacity)
+        n = available if n is None else min(n, available)
+        if n == 0:
+            return self.records[:0]
+
+        end = count % self.capacity or self.capacity
+        start = end - n
+        if start >= 0:
+            result = self.records[start:end]
+        else:
+            result = np.concatenate([self.records[start:], self.records[:end]])
+
+        # 조회 도중 기록된 샘플이 오래된 레코드를 덮어썼다면 그만큼 제외
+        overwritten = self.count - count
+        if overwritten > 0:
+            result = result[overwritten:]
+        return result
+
+    def load_segments(self, start_ts: Optional[int] = None, end_ts: Optional[int] = None) -> np.ndarray:
+        """
+        압축 보관된 과거 샘플 조회
+
+        Args:
+            start_ts, end_ts (int, optional): 조회 구간 (epoch ms)
+        """
+        if not self.spill_dir:
+            return np.zeros(0, dtype=SAMPLE_DTYPE)
+
+        parts = []
+        for path in sorted(glob.glob(os.path.join(self.spill_dir, 'segment_*.npz'))):
+            first, last = (int(v) for v in os.path.basename(path)[8:-4].split('_'))
+            if (start_ts is not None and last < start_ts) or (end_ts is not None and first > end_ts):
+                continue
+            with np.load(path) as segment:
+                data = segment['samples']
+            mask = np.ones(len(data), dtype=bool)
+            if start_ts is not None:
+                mask &= data['ts'] >= start_ts
+            if end_ts is not None:
+                mask &= data['ts'] <= end_ts
+            parts.append(data[mask])
+
+        if not parts:
+            return np.zeros(0, dtype=SAMPLE_DTYPE)
+        return np.concatenate(parts)
+
+    def _spill(self, samples: np.ndarray):
+        os.makedirs(self.spill_dir, exist_ok=True)
+        first, last = int(samples['ts'][0]), int(samples['ts'][-1])
+        path = os.path.join(self.spill_dir, f'segment_{first:013d}_{last:013d}.npz')
+        np.savez_compressed(path, samples=np.array(samples))
+
+    def flush(self):
+        """메모리 맵 변경 내용을 디스크에 반영"""
+        if not self.readonly:
+            self.records.flush()
+            self.header.flush()
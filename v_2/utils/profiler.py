@@ -0,0 +1,253 @@
+"""
+거래 루프 샘플링 프로파일러
+봇을 재시작하지 않고 다음 N틱 또는 일정 시간 동안의 호출 스택을 수집
+
+# 주요 기능:
+- 수집
+  - 백그라운드 스레드가 주기적으로 스택 샘플링 (sys._current_frames)
+  - 거래 루프(메인 스레드), LLM 호출 스레드, 파이프라인 단계 스레드 등 이름이 지정된 스레드만 기록
+  - 상시 저빈도 샘플링 (선택): 일정 주기마다 누적 결과 저장
+
+- 제어
+  - 시그널 (SIGUSR2): 다음 N틱 수집 (핸들러는 요청만 기록하고 다음 틱 시작 시 처리)
+  - HTTP 엔드포인트: 메트릭 서버의 /profile?ticks=N 또는 /profile?seconds=S
+  - 설정: config['profiling']['capture_ticks'] 변경 시 수집 (핫 리로드)
+
+- 결과
+  - <출력 디렉토리>/profile-<capture|continuous>-<시각>-<번호>.collapsed : flamegraph.pl / speedscope 입력 형식
+  - 같은 이름의 .txt : 함수별 self/total 샘플 표
+"""
+
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+DEFAULT_PROFILE_DIR = 'data/profiles'
+TOP_FUNCTIONS = 50
+
+logger = logging.getLogger(__name__)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})'
+
+
+class SamplingProfiler:
+    def __init__(self, output_dir: str = DEFAULT_PROFILE_DIR, interval: float = 0.005,
+                 continuous_interval: float = 0.05, flush_seconds: float = 300.0,
+                 threads=('MainThread', 'llm', 'pipeline')):
+        """
+        샘플링 프로파일러 초기화
+
+        Args:
+            output_dir (str): 결과 파일 디렉토리
+            interval (float): 수집 중 샘플링 주기 (초)
+            continuous_interval (float): 상시 샘플링 주기 (초)
+            flush_seconds (float): 상시 샘플링 결과 저장 주기 (초)
+            threads (tuple): 샘플링할 스레드 이름 접두사 (대기 중인 서버 스레드 등 제외)
+        """
+        self.output_dir = output_dir
+        self.interval = interval
+        self.continuous_interval = continuous_interval
+        self.flush_seconds = flush_seconds
+        self.threads = tuple(threads)
+        self.continuous = False
+        self._dumps = 0
+
+        self._lock = threading.Lock()
+        self._thread = None
+        self._ticks_left = 0        # 남은 수집 틱 수
+        self._in_tick = False
+        self._until = None          # 시간 기준 수집 종료 시각
+        self._capture = Counter()   # 요청 수집 결과 (스택 -> 샘플 수)
+        self._background = Counter()  # 상시 샘플링 누적
+        self._background_since = time.monotonic()
+        self._last_config = None
+        self._signal_ticks = 0      # 시그널로 요청된 틱 수 (다음 틱 시작 시 처리)
+
+    def request(self, ticks: int = 0, seconds: float = 0.0) -> str:
+        """
+        다음 N틱 또는 S초 동안 수집 요청
+
+        Returns:
+            str: 요청 결과 메시지
+        """
+        with self._lock:
+            if ticks > 0:
+                self._ticks_left = int(ticks)
+            if seconds > 0:
+                self._until = time.monotonic() + seconds
+            self._capture.clear()
+        self._ensure_thread()
+        message = f"프로파일 수집 요청: ticks={ticks}, seconds={seconds}"
+        logger.info(message)
+        return message
+
+    def on_tick_start(self):
+        if self._signal_ticks:
+            ticks, self._signal_ticks = self._signal_ticks, 0
+            self.request(ticks=ticks)
+        self._in_tick = self._ticks_left > 0
+
+    def on_tick_end(self):
+        if not self._in_tick:
+            return
+        self._in_tick = False
+        with self._lock:
+            self._ticks_left -= 1
+            done = self._ticks_left <= 0 and self._until is None
+        if done:
+            self._dump_capture()
+
+    def install_signal(self, signum: int = getattr(signal, 'SIGUSR2', None), ticks: int = 10):
+        """
+        시그널 수신 시 다음 N틱 수집 (메인 스레드에서 호출)
+
+        핸들러는 메인 스레드가 _lock을 잡고 있을 때도 실행될 수 있으므로
+        잠금/로깅 없이 요청 틱 수만 기록하고 on_tick_start()에서 request() 호출
+        """
+        if signum is None:
+            return  # 시그널 미지원 플랫폼
+
+        def handler(*_):
+            self._signal_ticks = ticks
+
+        signal.signal(signum, handler)
+
+    def http_handler(self, query: Dict[str, List[str]]) -> str:
+        """메트릭 서버 /profile 경로 처리"""
+        ticks = int(query.get('ticks', ['0'])[0])
+        seconds = float(query.get('seconds', ['0'])[0])
+        if ticks <= 0 and seconds <= 0:
+            ticks = 10
+        return self.request(ticks=ticks, seconds=seconds) + '\n'
+
+    def setup(self, config: Optional[Dict[str, Any]]):
+        """
+        config['profiling'] 설정 적용 (설정 변경 시 다시 호출)
+
+        설정 항목:
+            output_dir: 결과 디렉토리
+            interval: 수집 중 샘플링 주기 (초)
+            continuous: 상시 저빈도 샘플링 여부
+            continuous_interval / flush_seconds: 상시 샘플링 주기 / 저장 주기 (초)
+            threads: 샘플링할 스레드 이름 접두사 목록
+            capture_ticks: 0보다 크게 바꾸면 다음 N틱 수집
+        """
+        config = dict(config or {})
+        previous, self._last_config = self._last_config, config
+        self.output_dir = config.get('output_dir', self.output_dir)
+        self.interval = config.get('interval', self.interval)
+        self.continuous_interval = config.get('continuous_interval', self.continuous_interval)
+        self.flush_seconds = config.get('flush_seconds', self.flush_seconds)
+        self.threads = tuple(config.get('threads', self.threads))
+        self.continuous = config.get('continuous', False)
+        if self.continuous:
+            self._ensure_thread()
+
+        capture_ticks = config.get('capture_ticks', 0)
+        if capture_ticks and (previous is None or previous.get('capture_ticks') != capture_ticks):
+            self.request(ticks=capture_ticks)
+
+    def _capturing(self) -> bool:
+        if self._until is not None:
+            if time.monotonic() < self._until:
+                return True
+            with self._lock:
+                self._until = None
+                done = self._ticks_left <= 0
+            if done:
+                self._dump_capture()
+            return False
+        return self._in_tick
+
+    def _ensure_thread(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._sample_loop, name='profiler', daemon=True)
+            self._thread.start()
+
+    def _sample_loop(self):
+        while True:
+            capturing = self._capturing()
+            if capturing:
+                time.sleep(self.interval)
+            elif self.continuous:
+                time.sleep(self.continuous_interval)
+            else:
+                time.sleep(0.05)
+                continue
+
+            stacks = self._sample()
+            with self._lock:
+                target = self._capture if capturing else self._background
+                target.update(stacks)
+
+            if self.continuous and time.monotonic() - self._background_since >= self.flush_seconds:
+                with self._lock:
+                    background, self._background = self._background, Counter()
+                self._background_since = time.monotonic()
+                self._write(background, 'continuous')
+
+    def _sample(self) -> List[str]:
+        names = {
+            thread.ident: thread.name for thread in threading.enumerate()
+            if thread.name.startswith(self.threads)
+        }
+        stacks = []
+        for ident, frame in sys._current_frames().items():
+            if ident not in names:
+                continue
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            labels.append(names[ident])
+            stacks.append(';'.join(reversed(labels)))
+        return stacks
+
+    def _dump_capture(self):
+        with self._lock:
+            capture, self._capture = self._capture, Counter()
+        self._write(capture, 'capture')
+
+    def _write(self, stacks: Counter, kind: str):
+        if not stacks:
+            return
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._dumps += 1
+        base = os.path.join(
+            self.output_dir,
+            f"profile-{kind}-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{self._dumps}"
+        )
+        with open(base + '.collapsed', 'w') as file:
+            for stack, count in stacks.most_common():
+                file.write(f'{stack} {count}\n')
+
+        total = sum(stacks.values())
+        self_counts, total_counts = Counter(), Counter()
+        for stack, count in stacks.items():
+            frames = stack.split(';')
+            self_counts[frames[-1]] += count
+            for frame in set(frames[1:]):  # 첫 항목은 스레드 이름
+                total_counts[frame] += count
+
+        with open(base + '.txt', 'w') as file:
+            file.write(f"총 샘플: {total}\n\n")
+            file.write(f"{'self':>8} {'self%':>7} {'total':>8} {'total%':>7}  함수\n")
+            for frame, count in total_counts.most_common(TOP_FUNCTIONS):
+                own = self_counts.get(frame, 0)
+                file.write(
+                    f"{own:>8} {own / total:>7.1%} {count:>8} {count / total:>7.1%}  {frame}\n"
+                )
+        logger.info(f"프로파일 저장: {base}.collapsed ({total} 샘플)")
+
+
+# 프로세스 전역 프로파일러
+profiler = SamplingProfiler()
@@ -0,0 +1,36 @@
+"""
+요청 속도 제한
+여러 스레드가 하나의 거래소 요청 한도를 나눠 쓰도록 하는 토큰 버킷
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    def __init__(self, rate: float, burst: float = None):
+        """
+        토큰 버킷 초기화
+
+        Args:
+            rate (float): 초당 허용 가중치
+            burst (float, optional): 순간 최대 가중치 (기본: rate)
+        """
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, weight: float = 1.0):
+        """가중치만큼 토큰이 모일 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= weight:
+                    self._tokens -= weight
+                    return
+                wait = (weight - self._tokens) / self.rate
+            time.sleep(wait)
@@ -0,0 +1,190 @@
+"""
+캔들 경계 정렬 틱 스케줄러
+작업 시간만큼 밀리지 않도록 절대 시각 기준으로 다음 틱을 예약
+
+# 주요 기능:
+- 정렬
+  - 주기(초)의 배수 시각 + 오프셋에 틱 실행 (예: 1시간 봉 마감 2초 후)
+  - 거래 페어별로 다른 주기/오프셋 지원
+
+- 보정
+  - 다음 틱 시각 = 이전 예정 시각 + 주기 (작업 시간과 무관)
+  - 대기는 단조 시계(time.monotonic) 기준 (시스템 시각 변경에 영향 없음)
+  - 시스템 시각과 단조 시계 차이가 크게 변하면 경계를 다시 맞춤
+
+- 누락 감지
+  - 작업이 길어 예정 시각을 하나 이상 지나치면 지난 틱은 건너뛰고 누락으로 집계
+  - 메트릭: scheduler_missed_ticks_total{job}, scheduler_lateness_seconds{job}
+"""
+
+import logging
+import math
+import time
+from typing import Any, Dict, List, Optional
+
+import ccxt
+
+from utils.metrics import metrics
+
+RESYNC_THRESHOLD = 1.0  # 시스템 시각/단조 시계 차이 변화 허용치 (초)
+
+logger = logging.getLogger(__name__)
+
+
+def schedule_symbols(trading_config: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    config['trading'] 설정의 거래 페어별 스케줄
+
+    schedule.symbols가 비어 있으면 trading.symbol 하나를 trading.interval 주기로 실행
+
+    Returns:
+        dict: {페어: {'timeframe': 캔들 시간단위, 'interval': 주기(초), 'offset': 오프셋(초)}}
+    """
+    schedule = trading_config.get('schedule') or {}
+    symbols = schedule.get('symbols') or {trading_config['symbol']: {}}
+    result = {}
+    for symbol, options in symbols.items():
+        options = options or {}
+        timeframe = options.get('timeframe', schedule.get('timeframe', '1h'))
+        interval = options.get('interval')
+        if interval is None:
+            # 페어별 주기가 없으면 기본 페어는 trading.interval, 나머지는 캔들 주기
+            interval = (trading_config['interval'] if symbol == trading_config['symbol']
+                        else ccxt.Exchange.parse_timeframe(timeframe))
+        result[symbol] = {
+            'timeframe': timeframe,
+            'interval': float(interval),
+            'offset': float(options.get('offset', schedule.get('offset', 0.0))),
+        }
+    return result
+
+
+class ScheduledJob:
+    __slots__ = ('name', 'period', 'offset', 'align', 'due', 'runs', 'missed')
+
+    def __init__(self, name: str, period: float, offset: float = 0.0, align: bool = True):
+        self.name = name
+        self.period = period
+        self.offset = offset
+        self.align = align
+        self.due = None    # 다음 실행 예정 시각 (단조 시계)
+        self.runs = 0
+        self.missed = 0
+
+
+class TickScheduler:
+    def __init__(self, clock=time.monotonic, wall_clock=time.time, sleep=time.sleep,
+                 tolerance: float = 0.005):
+        """
+        스케줄러 초기화
+
+        Args:
+            clock (callable): 단조 시계 (대기/예정 시각 기준)
+            wall_clock (callable): 시스템 시각 (캔들 경계 계산용)
+            sleep (callable): 대기 함수
+            tolerance (float): 이만큼 이른 작업은 함께 실행 (초)
+        """
+        self.clock = clock
+        self.wall_clock = wall_clock
+        self.sleep = sleep
+        self.tolerance = tolerance
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self._wall_offset = wall_clock() - clock()
+
+    @classmethod
+    def from_config(cls, trading_config: Dict[str, Any]) -> 'TickScheduler':
+        """
+        config['trading'] 설정으로 생성
+
+        설정 항목 (trading.schedule):
+            align: 주기 경계 정렬 여부 (false면 시작 시점부터 주기마다)
+            offset: 경계 이후 실행 지연 (초, 거래소 캔들 마감 반영 대기)
+            timeframe: 조회할 캔들 시간단위
+            symbols: {페어: {timeframe, interval, offset}} (비어 있으면 trading.symbol)
+        """
+        schedule = trading_config.get('schedule') or {}
+        scheduler = cls()
+        for symbol, options in schedule_symbols(trading_config).items():
+            scheduler.add(symbol, options['interval'], options['offset'], align=schedule.get('align', True))
+        return scheduler
+
+    def add(self, name: str, period: float, offset: float = 0.0, align: bool = True) -> ScheduledJob:
+        """
+        작업 등록
+
+        Args:
+            name (str): 작업 이름 (거래 페어)
+            period (float): 주기 (초)
+            offset (float): 경계 이후 실행 지연 (초)
+            align (bool): True면 epoch 기준 주기 배수 + offset, False면 등록 시점 + offset
+        """
+        job = ScheduledJob(name, period, offset, align)
+        job.due = self._first_due(job)
+        self.jobs[name] = job
+        return job
+
+    def remove(self, name: str):
+        self.jobs.pop(name, None)
+
+    def next_due(self) -> Optional[float]:
+        """가장 이른 실행 예정 시각 (단조 시계, 작업이 없으면 None)"""
+        if not self.jobs:
+            return None
+        return min(job.due for job in self.jobs.values())
+
+    def wait(self) -> List[ScheduledJob]:
+        """
+        다음 실행 예정 시각까지 대기 후 실행할 작업 반환 (예정 시각 순)
+
+        Returns:
+            list: 실행할 ScheduledJob 목록
+        """
+        while True:
+            self._resync()
+            due = self.next_due()
+            if due is None:
+                return []
+            delay = due - self.clock()
+            if delay <= self.tolerance:
+                return self.pop_due()
+            self.sleep(delay)
+
+    def pop_due(self) -> List[ScheduledJob]:
+        """예정 시각이 된 작업을 반환하고 다음 예정 시각으로 이동 (대기 없음)"""
+        now = self.clock()
+        ready = sorted(
+            (job for job in self.jobs.values() if job.due - now <= self.tolerance),
+            key=lambda job: job.due
+        )
+        for job in ready:
+            lateness = max(0.0, now - job.due)
+            missed = int(lateness // job.period)
+            if missed:
+                # 지난 틱은 실행하지 않고 가장 최근 예정 시각부터 다시 진행
+                job.missed += missed
+                metrics.inc('scheduler_missed_ticks_total', missed, job=job.name)
+                logger.warning(f"{job.name} 틱 {missed}회 누락 (예정 시각보다 {lateness:.1f}초 늦음)")
+            metrics.observe('scheduler_lateness_seconds', lateness - missed * job.period, job=job.name)
+            job.due += (missed + 1) * job.period
+            job.runs += 1
+        return ready
+
+    def _first_due(self, job: ScheduledJob) -> float:
+        now = self.clock()
+        if not job.align:
+            return now + job.offset
+        wall = now + self._wall_offset
+        boundary = math.floor((wall - job.offset) / job.period) * job.period + job.offset
+        next_wall = boundary + job.period if boundary < wall - self.tolerance else boundary
+        return next_wall - self._wall_offset
+
+    def _resync(self):
+        """시스템 시각이 조정되었으면 정렬된 작업의 예정 시각을 다시 계산"""
+        wall_offset = self.wall_clock() - self.clock()
+        if abs(wall_offset - self._wall_offset) <= RESYNC_THRESHOLD:
+            return
+        logger.info(f"시스템 시각 변경 감지 ({wall_offset - self._wall_offset:+.1f}초), 틱 경계 재정렬")
+        self._wall_offset = wall_offset
+        for job in self.jobs.values():
+            if job.align:
+                job.due = self._first_due(job)
@@ -0,0 +1,198 @@
+"""
+프로세스 간 상태 버스
+봇 프로세스가 수집/분석한 상태를 Unix 소켓으로 대시보드 프로세스들에 배포
+
+# 주요 기능:
+- 발행 (봇 프로세스)
+  - 캔들, 지표 스냅샷, LLM 분석, 포지션, 주문 발행
+  - 포지션은 주문 직후 또는 position_interval마다만 조회/발행 (틱마다 잔고 조회 방지)
+  - 토픽별 마지막 값 보관 (새 구독자에게 즉시 전달)
+  - 구독자별 전송 큐/스레드 (거래 스레드는 블로킹되지 않음)
+
+- 구독 (대시보드 프로세스)
+  - 백그라운드 수신 스레드가 토픽별 최신 값 유지
+  - 연결이 끊기면 자동 재연결
+  - 봇이 없으면 None 반환 (호출 측에서 직접 조회로 대체)
+
+외부 I/O(거래소, LLM)는 봇에서 한 번만 수행하고 모든 화면이 결과를 공유
+"""
+
+import logging
+import os
+import pickle
+import queue
+import socket
+import struct
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+# 토픽 이름
+TOPIC_CANDLES = 'candles'
+TOPIC_ANALYSIS = 'analysis'
+TOPIC_LLM = 'llm_analysis'
+TOPIC_POSITION = 'position'
+TOPIC_ORDER = 'order'
+
+DEFAULT_SOCKET_PATH = 'data/state_bus.sock'
+DEFAULT_POSITION_INTERVAL = 60.0  # 포지션 재조회/발행 최소 간격 (초)
+_FRAME_HEADER = struct.Struct('!I')
+
+logger = logging.getLogger(__name__)
+
+
+def _encode(topic: str, payload: Any) -> bytes:
+    body = pickle.dumps((topic, time.time(), payload), protocol=pickle.HIGHEST_PROTOCOL)
+    return _FRAME_HEADER.pack(len(body)) + body
+
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+class StateBusServer:
+    def __init__(self, path: str = DEFAULT_SOCKET_PATH, queue_size: int = 256):
+        """
+        상태 버스 발행 서버 초기화
+
+        Args:
+            path (str): Unix 소켓 경로
+            queue_size (int): 구독자별 전송 대기 한도 (초과 시 해당 구독자 연결 해제)
+        """
+        self.path = path
+        self.queue_size = queue_size
+        self.retained: Dict[str, bytes] = {}  # 토픽별 마지막 프레임
+        self.subscribers = []
+        self._lock = threading.Lock()
+        self._sock = None
+
+    def start(self):
+        """소켓을 열고 구독자 접속 수락 스레드 시작"""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        if os.path.exists(self.path):
+            os.remove(self.path)  # 이전 실행이 남긴 소켓
+
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.bind(self.path)
+        os.chmod(self.path, 0o600)  # 같은 사용자 프로세스만 접근
+        self._sock.listen()
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        return self
+
+    def publish(self, topic: str, payload: Any):
+        """
+        토픽 발행 (직렬화 1회 후 각 구독자 큐에 넣고 즉시 반환)
+        """
+        frame = _encode(topic, payload)
+        with self._lock:
+            self.retained[topic] = frame
+            for subscriber in list(self.subscribers):
+                try:
+                    subscriber.put_nowait(frame)
+                except queue.Full:
+                    self._drop(subscriber)
+
+    def close(self):
+        if self._sock:
+            self._sock.close()
+            self._sock = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _accept_loop(self):
+        while self._sock is not None:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            outbox = queue.Queue(self.queue_size)
+            with self._lock:
+                for frame in self.retained.values():
+                    outbox.put_nowait(frame)
+                self.subscribers.append(outbox)
+            threading.Thread(target=self._send_loop, args=(conn, outbox), daemon=True).start()
+
+    def _send_loop(self, conn: socket.socket, outbox: queue.Queue):
+        try:
+            while True:
+                frame = outbox.get()
+                if frame is None:
+                    break
+                conn.sendall(frame)
+        except OSError:
+            pass
+        finally:
+            conn.close()
+            with self._lock:
+                if outbox in self.subscribers:
+                    self.subscribers.remove(outbox)
+
+    def _drop(self, outbox: queue.Queue):
+        """처리가 밀린 구독자 연결 해제"""
+        self.subscribers.remove(outbox)
+        while not outbox.empty():
+            outbox.get_nowait()
+        outbox.put_nowait(None)
+        logger.warning("상태 버스 구독자 처리 지연으로 연결 해제")
+
+
+class StateBusClient:
+    def __init__(self, path: str = DEFAULT_SOCKET_PATH, reconnect_interval: float = 2.0):
+        """
+        상태 버스 구독 클라이언트 초기화
+
+        Args:
+            path (str): Unix 소켓 경로
+            reconnect_interval (float): 재연결 시도 간격 (초)
+        """
+        self.path = path
+        self.reconnect_interval = reconnect_interval
+        self.latest: Dict[str, Tuple[float, Any]] = {}  # 토픽별 (발행 시각, 값)
+        self.connected = False
+        threading.Thread(target=self._receive_loop, daemon=True).start()
+
+    def get(self, topic: str, max_age: Optional[float] = None) -> Any:
+        """
+        토픽의 최신 값 조회
+
+        Args:
+            topic (str): 토픽 이름
+            max_age (float, optional): 이보다 오래된 값은 None 처리 (초)
+
+        Returns:
+            최신 값 또는 None
+        """
+        entry = self.latest.get(topic)
+        if entry is None:
+            return None
+        published_at, payload = entry
+        if max_age is not None and time.time() - published_at > max_age:
+            return None
+        return payload
+
+    def _receive_loop(self):
+        while True:
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                    sock.connect(self.path)
+                    self.connected = True
+                    while True:
+                        header = _recv_exact(sock, _FRAME_HEADER.size)
+                        if header is None:
+                            break
+                        body = _recv_exact(sock, _FRAME_HEADER.unpack(header)[0])
+                        if body is None:
+                            break
+                        topic, published_at, payload = pickle.loads(body)
+                        self.latest[topic] = (published_at, payload)
+            except OSError:
+                pass
+            self.connected = False
+            time.sleep(self.reconnect_interval)
@@ -0,0 +1,301 @@
+"""
+거래 내역 저장소
+최근 거래는 고정 크기 링에 보관하고 오래된 거래는 압축 세그먼트로 내보내 메모리 사용량을 일정하게 유지
+
+# 주요 기능:
+- 기록
+  - 고정 크기 레코드(구조화 배열)로 거래 추가
+  - 링이 가득 차면 가장 오래된 segment_size개를 디스크 세그먼트로 이동
+  - 링에 있는 최근 거래는 프로세스별 최근 거래 파일에도 이어 붙임 (내보낼 때 남은 거래로 다시 작성)
+  - 종료 시 flush()로 메모리에 남은 거래도 세그먼트로 저장
+
+- 조회 (메모리/디스크 구분 없이)
+  - 전체 거래 수, 최근 n개
+  - 페이지 단위 조회: 세그먼트 파일 이름의 거래 수로 필요한 세그먼트만 읽음
+  - 시간 구간/거래 페어 조회: 파일 이름의 시각 범위로 세그먼트 선별
+  - 읽은 세그먼트는 캐시 (세그먼트는 기록 후 변경되지 않음)
+
+- 저장 형식
+  - <디렉토리>/trades_<첫 거래 ms>_<마지막 거래 ms>_<거래 수>.npz
+  - <디렉토리>/recent_<pid>.bin: 아직 내보내지 않은 거래 (TRADE_DTYPE 레코드를 그대로 이어 붙임)
+  - 다른 프로세스(대시보드)는 세그먼트와 기록 중인 프로세스의 최근 거래 파일을 합쳐 전체 내역 조회
+    (세그먼트로 옮겨지는 사이에 양쪽에 있는 거래는 한 번만 포함)
+"""
+
+import glob
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_TRADE_DIR = 'data/trades'
+
+# 거래 레코드 형식 (86바이트)
+TRADE_DTYPE = np.dtype([
+    ('ts', '<i8'),          # 주문 시각 (epoch ms)
+    ('symbol', 'S16'),      # 거래 페어
+    ('side', 'S4'),         # buy / sell
+    ('amount', '<f8'),      # 거래량
+    ('price', '<f8'),       # 가격
+    ('status', 'S10'),      # 주문 상태
+    ('order_id', 'S24'),    # 거래소 주문 ID
+])
+TEXT_FIELDS = ('symbol', 'side', 'status', 'order_id')
+
+
+@lru_cache(maxsize=16)
+def _load_segment(path: str) -> np.ndarray:
+    with np.load(path) as segment:
+        data = segment['trades']
+    data.flags.writeable = False
+    return data
+
+
+def _segment_info(path: str) -> Tuple[int, int, int]:
+    """세그먼트 파일 이름의 (첫 거래 ms, 마지막 거래 ms, 거래 수)"""
+    first, last, count = os.path.basename(path)[7:-4].split('_')
+    return int(first), int(last), int(count)
+
+
+def to_frame(trades: np.ndarray) -> pd.DataFrame:
+    """거래 레코드를 DataFrame으로 변환 (timestamp 인덱스, 문자열 디코딩)"""
+    frame = pd.DataFrame({
+        name: (np.char.decode(trades[name], 'utf-8') if name in TEXT_FIELDS else trades[name])
+        for name in TRADE_DTYPE.names if name != 'ts'
+    })
+    frame.index = pd.to_datetime(trades['ts'], unit='ms')
+    frame.index.name = 'timestamp'
+    return frame
+
+
+class TradeHistory:
+    def __init__(self, directory: str = DEFAULT_TRADE_DIR, capacity: int = 1000, segment_size: int = 500):
+        """
+        거래 내역 저장소 초기화
+
+        Args:
+            directory (str): 세그먼트 저장 디렉토리
+            capacity (int): 메모리에 보관할 최대 거래 수
+            segment_size (int): 한 번에 디스크로 내보낼 거래 수 (capacity 이하)
+        """
+        if not 0 < segment_size <= capacity:
+            raise ValueError("segment_size는 1 이상 capacity 이하여야 합니다")
+        self.directory = directory
+        self.capacity = capacity
+        self.segment_size = segment_size
+        self._ring = np.zeros(capacity, dtype=TRADE_DTYPE)
+        self._start = 0  # 가장 오래된 거래 위치
+        self._size = 0
+        self._lock = threading.Lock()
+        # 이 프로세스의 최근 거래 파일 (첫 거래 추가 시 생성)
+        self._recent_path = os.path.join(directory, f'recent_{os.getpid()}.bin')
+        self._recent_file = None
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> 'TradeHistory':
+        """config['trade_history'] 설정으로 생성"""
+        config = config or {}
+        return cls(
+            config.get('directory', DEFAULT_TRADE_DIR),
+            capacity=config.get('capacity', 1000),
+            segment_size=config.get('segment_size', 500),
+        )
+
+    def append(self, symbol: str, side: str, amount: float, price: float, status: str = '',
+               ts: Optional[int] = None, order_id: str = ''):
+        """
+        거래 추가
+
+        Args:
+            symbol (str): 거래 페어
+            side (str): 'buy' 또는 'sell'
+            amount (float): 거래량
+            price (float): 가격
+            status (str): 주문 상태
+            ts (int, optional): 주문 시각 (epoch ms, 기본: 현재 시각)
+            order_id (str): 거래소 주문 ID
+        """
+        record = (
+            int(ts if ts is not None else time.time() * 1000),
+            symbol.encode(), side.encode(), amount, price or 0.0,
+            (status or '').encode(), str(order_id or '').encode(),
+        )
+        with self._lock:
+            if self._size == self.capacity:
+                self._spill(self.segment_size)
+            position = (self._start + self._size) % self.capacity
+            self._ring[position] = record
+            self._size += 1
+            if self._recent_file is None:
+                os.makedirs(self.directory, exist_ok=True)
+                self._recent_file = open(self._recent_path, 'ab')
+            self._recent_file.write(self._ring[position].tobytes())
+            self._recent_file.flush()
+
+    def flush(self):
+        """메모리에 남은 거래를 모두 세그먼트로 저장 (종료 시 호출)"""
+        with self._lock:
+            if self._size:
+                self._spill(self._size)
+
+    def __len__(self) -> int:
+        """메모리와 디스크의 전체 거래 수"""
+        with self._lock:
+            memory = self._size
+            segments = self._segments()
+        return memory + len(self._others(segments)) + sum(count for _, _, count in segments.values())
+
+    def latest(self, n: int = 50) -> np.ndarray:
+        """최근 n개 거래 (시간순)"""
+        total = len(self)
+        return self._slice(max(0, total - n), total)
+
+    def page(self, page: int = 0, page_size: int = 50, newest_first: bool = True) -> np.ndarray:
+        """
+        페이지 단위 조회
+
+        Args:
+            page (int): 페이지 번호 (0부터)
+            page_size (int): 페이지 크기
+            newest_first (bool): 최신 거래부터 페이지를 나눌지 여부
+
+        Returns:
+            np.ndarray: TRADE_DTYPE 레코드 (페이지 안에서도 newest_first 순서)
+        """
+        total = len(self)
+        if newest_first:
+            end = max(0, total - page * page_size)
+            return self._slice(max(0, end - page_size), end)[::-1]
+        start = min(total, page * page_size)
+        return self._slice(start, min(total, start + page_size))
+
+    def query(self, start_ts: Optional[int] = None, end_ts: Optional[int] = None,
+              symbol: Optional[str] = None) -> np.ndarray:
+        """
+        시간 구간/거래 페어 조회 (시간순)
+
+        Args:
+            start_ts, end_ts (int, optional): 조회 구간 (epoch ms, 양 끝 포함)
+            symbol (str, optional): 거래 페어
+        """
+        with self._lock:
+            memory = self._memory()
+            segments = self._segments()
+        memory = self._merge_others(memory, segments)
+
+        parts = []
+        for path, (first, last, _) in segments.items():
+            if (start_ts is not None and last < start_ts) or (end_ts is not None and first > end_ts):
+                continue
+            parts.append(_load_segment(path))
+        parts.append(memory)
+
+        trades = np.concatenate(parts)
+        mask = np.ones(len(trades), dtype=bool)
+        if start_ts is not None:
+            mask &= trades['ts'] >= start_ts
+        if end_ts is not None:
+            mask &= trades['ts'] <= end_ts
+        if symbol is not None:
+            mask &= trades['symbol'] == symbol.encode()
+        return trades[mask]
+
+    def _slice(self, start: int, end: int) -> np.ndarray:
+        """시간순 전체 거래 중 [start, end) 구간 (필요한 세그먼트만 읽음)"""
+        with self._lock:
+            memory = self._memory()
+            segments = self._segments()
+        memory = self._merge_others(memory, segments)
+
+        parts: List[np.ndarray] = []
+        offset = 0
+        for path, (_, _, count) in segments.items():
+            if offset + count > start and offset < end:
+                data = _load_segment(path)
+                parts.append(data[max(0, start - offset):end - offset])
+            offset += count
+        if end > offset:
+            parts.append(memory[max(0, start - offset):end - offset])
+
+        if not parts:
+            return np.zeros(0, dtype=TRADE_DTYPE)
+        return np.concatenate(parts)
+
+    def _memory(self) -> np.ndarray:
+        """메모리의 거래 사본 (시간순)"""
+        index = (self._start + np.arange(self._size)) % self.capacity
+        return self._ring[index]
+
+    def _others(self, segments: Dict[str, Tuple[int, int, int]]) -> np.ndarray:
+        """다른 프로세스가 아직 내보내지 않은 거래 (세그먼트에 이미 있는 거래 제외)"""
+        parts = []
+        for path in glob.glob(os.path.join(self.directory, 'recent_*.bin')):
+            if path == self._recent_path:
+                continue
+            try:
+                with open(path, 'rb') as file:
+                    data = file.read()
+            except FileNotFoundError:
+                continue  # 기록 프로세스가 종료하며 삭제
+            # 쓰는 중인 마지막 레코드는 제외
+            parts.append(np.frombuffer(data[:len(data) - len(data) % TRADE_DTYPE.itemsize], dtype=TRADE_DTYPE))
+        if not parts:
+            return np.zeros(0, dtype=TRADE_DTYPE)
+
+        others = np.concatenate(parts)
+        if not len(others):
+            return others
+        # 세그먼트로 옮겨진 직후 최근 거래 파일이 아직 다시 작성되지 않은 거래
+        first, last = int(others['ts'].min()), int(others['ts'].max())
+        spilled = set()
+        for path, (seg_first, seg_last, _) in segments.items():
+            if seg_last >= first and seg_first <= last:
+                spilled.update(record.tobytes() for record in _load_segment(path))
+        if spilled:
+            others = others[[record.tobytes() not in spilled for record in others]]
+        return others
+
+    def _merge_others(self, memory: np.ndarray, segments: Dict[str, Tuple[int, int, int]]) -> np.ndarray:
+        """메모리의 거래와 다른 프로세스의 최근 거래를 시간순으로 합침"""
+        others = self._others(segments)
+        if not len(others):
+            return memory
+        merged = np.concatenate([memory, others])
+        return merged[np.argsort(merged['ts'], kind='stable')]
+
+    def _segments(self) -> Dict[str, Tuple[int, int, int]]:
+        """시간순 세그먼트 경로 -> (첫 거래 ms, 마지막 거래 ms, 거래 수)"""
+        paths = sorted(glob.glob(os.path.join(self.directory, 'trades_*.npz')))
+        return {path: _segment_info(path) for path in paths}
+
+    def _spill(self, n: int):
+        """가장 오래된 n개 거래를 세그먼트로 저장하고 링에서 제거"""
+        trades = self._memory()[:n]
+        os.makedirs(self.directory, exist_ok=True)
+        first, last = int(trades['ts'][0]), int(trades['ts'][-1])
+        path = os.path.join(self.directory, f'trades_{first:013d}_{last:013d}_{n}.npz')
+        tmp_path = os.path.join(self.directory, f'.writing_{os.getpid()}.npz')  # 프로세스별 임시 파일
+        np.savez_compressed(tmp_path, trades=trades)
+        os.replace(tmp_path, path)  # 조회 측이 쓰는 중인 파일을 읽지 않도록 원자적 교체
+        self._start = (self._start + n) % self.capacity
+        self._size -= n
+        self._rewrite_recent()
+
+    def _rewrite_recent(self):
+        """최근 거래 파일을 링에 남은 거래로 다시 작성 (남은 거래가 없으면 삭제)"""
+        if self._recent_file is not None:
+            self._recent_file.close()
+            self._recent_file = None
+        if not self._size:
+            if os.path.exists(self._recent_path):
+                os.remove(self._recent_path)
+            return
+        tmp_path = self._recent_path + '.tmp'
+        with open(tmp_path, 'wb') as file:
+            file.write(self._memory().tobytes())
+        os.replace(tmp_path, self._recent_path)
+        self._recent_file = open(self._recent_path, 'ab')